@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 # Python 3.10+ has importlib.metadata in stdlib
 from importlib.metadata import entry_points
 from typing import Any
@@ -10,6 +12,21 @@ from circuitai.adapters.protocol import CircuitAdapter
 from circuitai.core.exceptions import AdapterError
 
 
+@lru_cache(maxsize=8)
+def _discover_entry_points(group: str) -> dict[str, Any]:
+    """Scan installed distributions for one entry point group, once per process."""
+    eps = entry_points()
+    # Python 3.12+ returns a SelectableGroups, 3.9-3.11 returns a dict
+    if hasattr(eps, "select"):
+        found = eps.select(group=group)
+    elif isinstance(eps, dict):
+        found = eps.get(group, [])
+    else:
+        found = [ep for ep in eps if ep.group == group]
+
+    return {ep.name: ep for ep in found}
+
+
 class AdapterRegistry:
     """Discovers and loads CircuitAI adapters from entry_points."""
 
@@ -20,39 +37,44 @@ class AdapterRegistry:
         self._loaded: dict[str, CircuitAdapter] = {}
 
     def _discover(self) -> dict[str, Any]:
-        """Discover all registered adapter entry points."""
-        eps = entry_points()
-        # Python 3.12+ returns a SelectableGroups, 3.9-3.11 returns a dict
-        if hasattr(eps, "select"):
-            group = eps.select(group=self.ENTRY_POINT_GROUP)
-        elif isinstance(eps, dict):
-            group = eps.get(self.ENTRY_POINT_GROUP, [])
-        else:
-            group = [ep for ep in eps if ep.group == self.ENTRY_POINT_GROUP]
-
-        return {ep.name: ep for ep in group}
+        """Discover all registered adapter entry points (cached per process)."""
+        return dict(_discover_entry_points(self.ENTRY_POINT_GROUP))
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget discovered entry points, e.g. after installing an adapter at runtime."""
+        _discover_entry_points.cache_clear()
 
     def list_adapters(self) -> list[dict[str, Any]]:
         """List all available adapters with metadata."""
-        result = []
-        for name, ep in self._discover().items():
-            try:
-                adapter_class = ep.load()
-                adapter = adapter_class()
-                meta = adapter.metadata()
-                result.append({
-                    "name": name,
-                    "description": meta.get("description", ""),
-                    "version": meta.get("version", "0.0.0"),
-                    "author": meta.get("author", ""),
-                })
-            except Exception as e:
-                result.append({
-                    "name": name,
-                    "description": f"(error loading: {e})",
-                    "version": "?",
-                })
-        return result
+        return [self._describe(name, ep) for name, ep in self._discover().items()]
+
+    def find_adapter(self, name: str) -> dict[str, Any] | None:
+        """Return list_adapters()-style metadata for one adapter, or None if not installed."""
+        ep = self._discover().get(name)
+        if ep is None:
+            return None
+        return self._describe(name, ep)
+
+    @staticmethod
+    def _describe(name: str, ep: Any) -> dict[str, Any]:
+        """Load an entry point and summarize its metadata, recording load errors."""
+        try:
+            adapter_class = ep.load()
+            adapter = adapter_class()
+            meta = adapter.metadata()
+            return {
+                "name": name,
+                "description": meta.get("description", ""),
+                "version": meta.get("version", "0.0.0"),
+                "author": meta.get("author", ""),
+            }
+        except Exception as e:
+            return {
+                "name": name,
+                "description": f"(error loading: {e})",
+                "version": "?",
+            }
 
     def get_adapter_info(self, name: str) -> dict[str, str]:
         """Get metadata for a specific adapter."""
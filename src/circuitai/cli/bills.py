@@ -7,7 +7,7 @@ from datetime import date
 import click
 
 from circuitai.cli.main import CircuitContext, JsonGroup, pass_context
-from circuitai.output.formatter import dollars, format_date
+from circuitai.output.formatter import dollars, dollars_many, format_date
 
 
 @click.group(cls=JsonGroup)
@@ -41,15 +41,16 @@ def bills_list(ctx: CircuitContext, show_all: bool) -> None:
         )
         return
 
+    amounts = dollars_many(b.amount_cents for b in bill_list)
     rows = []
     json_data = []
-    for b in bill_list:
+    for b, amount in zip(bill_list, amounts):
         last = svc.get_last_payment(b.id)
         status = "Paid" if last and (date.today() - date.fromisoformat(last.paid_date[:10])).days < 25 else "Upcoming"
         rows.append([
             b.name,
             b.provider,
-            dollars(b.amount_cents),
+            amount,
             str(b.due_day or "—"),
             b.frequency,
             status,
@@ -106,21 +106,26 @@ def browse_sync(ctx: CircuitContext, site: str) -> None:
     db = ctx.get_db()
     svc = BrowserService(db)
 
-    # Check credentials
-    creds = svc.get_credentials(site)
-    if not creds:
-        ctx.formatter.error(
-            f"No credentials found for {site}. Run 'circuit browse setup {site}' first."
-        )
+    if not svc.has_username(site):
+        ctx.formatter.error(f"No credentials found for {site}. Run 'circuit browse setup {site}' first.")
         return
 
-    username, password = creds
+    # Read the password while the browser starts
+    creds_future = svc.prefetch_credentials(site)
 
     if not ctx.json_mode:
         ctx.formatter.info(f"Launching browser for {site_cls.DISPLAY_NAME}...")
 
     try:
         _browser, _context, page = svc.launch_browser()
+        creds = creds_future.result()
+        if not creds:
+            ctx.formatter.error(
+                f"No credentials found for {site}. Run 'circuit browse setup {site}' first."
+            )
+            return
+
+        username, password = creds
 
         # Instantiate the site adapter
         site_adapter = site_cls(page, svc)
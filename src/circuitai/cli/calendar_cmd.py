@@ -65,14 +65,15 @@ def calendar_setup(ctx: CircuitContext) -> None:
 
 
 @calendar.command("sync")
+@click.option("--force", is_flag=True, help="Push everything, even if nothing changed locally.")
 @pass_context
-def calendar_sync(ctx: CircuitContext) -> None:
+def calendar_sync(ctx: CircuitContext, force: bool) -> None:
     """Trigger a manual calendar sync."""
     from circuitai.services.calendar_service import CalendarService
 
     db = ctx.get_db()
     svc = CalendarService(db)
-    results = svc.sync()
+    results = svc.sync(force=force)
 
     if ctx.json_mode:
         ctx.formatter.json(results)
@@ -41,8 +41,10 @@ def capture_setup(ctx: CircuitContext) -> None:
 @capture.command("snap")
 @click.option("--account", "account_id", default=None, help="Account or card ID to import into.")
 @click.option("--type", "entity_type", type=click.Choice(["account", "card"]), default=None, help="Entity type.")
+@click.option("--pages", type=click.IntRange(min=1), default=1, show_default=True,
+              help="Screenshots to take for multi-page results; extracted concurrently.")
 @pass_context
-def capture_snap(ctx: CircuitContext, account_id: str | None, entity_type: str | None) -> None:
+def capture_snap(ctx: CircuitContext, account_id: str | None, entity_type: str | None, pages: int) -> None:
     """Screenshot a bank page, extract transactions, and import."""
     from circuitai.services.capture_service import CaptureService
 
@@ -86,10 +88,16 @@ def capture_snap(ctx: CircuitContext, account_id: str | None, entity_type: str |
         entity_type = "account"
 
     if not ctx.json_mode:
-        ctx.formatter.info("Select the browser window to capture...")
+        if pages > 1:
+            ctx.formatter.info(f"Select the browser window to capture, once per page ({pages} pages)...")
+        else:
+            ctx.formatter.info("Select the browser window to capture...")
 
     try:
-        result = svc.snap(account_id, entity_type)
+        if pages > 1:
+            result = svc.snap_many(account_id, entity_type, pages=pages)
+        else:
+            result = svc.snap(account_id, entity_type)
     except Exception as e:
         if ctx.json_mode:
             ctx.formatter.json_error(str(e))
@@ -165,7 +165,7 @@ def health_show(ctx: CircuitContext, result_id: str | None) -> None:
         json_data["panels"] = []
         for pd in detail["panels"]:
             panel_data = pd["panel"].model_dump()
-            panel_data["markers"] = [m.model_dump() for m in pd["markers"]]
+            panel_data["markers"] = [m.to_model().model_dump() for m in pd["markers"]]
             json_data["panels"].append(panel_data)
         ctx.formatter.json(json_data)
         return
@@ -5,13 +5,10 @@ from __future__ import annotations
 from datetime import date
 
 import click
-from rich.console import Console
 
 from circuitai.cli.main import CircuitContext, pass_context
 from circuitai.output.formatter import dollars, format_date
 
-console = Console()
-
 
 @click.command()
 @pass_context
@@ -27,6 +24,9 @@ def morning(ctx: CircuitContext) -> None:
         ctx.formatter.json(briefing)
         return
 
+    from rich.console import Console
+
+    console = Console()
     today = date.today()
     console.print()
     console.print(f"[bold]Good morning![/bold] {today.strftime('%A, %b %d, %Y')}")
@@ -366,7 +366,7 @@ def _handle_file_import(ctx: CircuitContext, file_path: str) -> None:
             if not account_id:
                 ctx.formatter.error("No accounts found. Add one first with '/accounts add'.")
                 return
-            result = import_file(db, file_path, account_id)
+            result = import_file(db, file_path, account_id, file_type=file_type)
             ctx.formatter.success(
                 f"Imported {result['imported']} transactions, linked {result.get('linked', 0)}."
             )
@@ -416,13 +416,13 @@ def _handle_file_import(ctx: CircuitContext, file_path: str) -> None:
                 if not account_id:
                     ctx.formatter.error("No accounts found. Add one first with '/accounts add'.")
                     return
-                result = import_file(db, file_path, account_id, mode=mode)
+                result = import_file(db, file_path, account_id, file_type=file_type, mode=mode)
                 ctx.formatter.success(f"Imported {result['imported']} transactions.")
                 if result.get("errors"):
                     for err in result["errors"][:5]:
                         ctx.formatter.warning(f"  {err}")
             else:
-                result = import_file(db, file_path, account_id="", mode=mode)
+                result = import_file(db, file_path, account_id="", file_type=file_type, mode=mode)
                 amount = result.get("amount_due")
                 due = result.get("due_date")
                 if amount is not None:
@@ -3,12 +3,9 @@
 from __future__ import annotations
 
 import click
-from rich.console import Console
 
 from circuitai.cli.main import CircuitContext, pass_context
 
-console = Console()
-
 
 @click.command("serve")
 @click.option("--port", default=8321, show_default=True, help="Port to serve on.")
@@ -47,6 +44,10 @@ def serve(ctx: CircuitContext, port: int, host: str, no_browser: bool) -> None:
     app = create_app(encryption_key=encryption_key)
     url = f"http://{host}:{port}"
 
+    from rich.console import Console
+
+    console = Console()
+
     console.print(f"\n[bold cyan]CircuitAI Web Dashboard[/bold cyan]")
     console.print(f"  [dim]Serving at[/dim] {url}")
     console.print(f"  [dim]Press Ctrl+C to stop[/dim]\n")
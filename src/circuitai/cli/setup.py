@@ -3,8 +3,6 @@
 from __future__ import annotations
 
 import click
-from rich.console import Console
-from rich.panel import Panel
 
 from circuitai.cli.main import CircuitContext, pass_context
 from circuitai.core.config import get_data_dir, load_config, update_config
@@ -12,13 +10,15 @@ from circuitai.core.database import DatabaseConnection
 from circuitai.core.encryption import MasterKeyManager
 from circuitai.core.migrations import initialize_database
 
-console = Console()
-
 
 @click.command("setup")
 @pass_context
 def setup_cmd(ctx: CircuitContext) -> None:
     """Run the first-time setup wizard."""
+    from rich.console import Console
+    from rich.panel import Panel
+
+    console = Console()
     fmt = ctx.formatter
     config = load_config()
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 import click
 
 from circuitai.cli.main import CircuitContext, JsonGroup, pass_context
-from circuitai.output.formatter import dollars, format_date
+from circuitai.output.formatter import dollars, dollars_many, format_date
 
 
 @click.group(cls=JsonGroup)
@@ -38,12 +38,13 @@ def subscriptions_list(ctx: CircuitContext, show_all: bool) -> None:
         )
         return
 
+    amounts = dollars_many(s.amount_cents for s in sub_list)
     rows = []
-    for s in sub_list:
+    for s, amount in zip(sub_list, amounts):
         confidence_str = f"{s.confidence}%"
         rows.append([
             s.name,
-            dollars(s.amount_cents),
+            amount,
             s.frequency,
             format_date(s.next_charge_date),
             s.status,
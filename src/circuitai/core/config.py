@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -82,6 +83,20 @@ def load_config() -> dict[str, Any]:
         raise ConfigError(f"Failed to load config: {e}") from e
 
 
+@lru_cache(maxsize=4)
+def _load_config_at(config_path: Path) -> dict[str, Any]:
+    return load_config()
+
+
+def load_config_cached() -> dict[str, Any]:
+    """Load configuration once per process and config path.
+
+    For read-only callers that are constructed repeatedly; the returned dict
+    is shared and must not be mutated. ``save_config`` clears the cache.
+    """
+    return _load_config_at(get_config_path())
+
+
 def save_config(config: dict[str, Any]) -> None:
     """Save configuration to TOML file."""
     config_path = get_config_path()
@@ -90,6 +105,8 @@ def save_config(config: dict[str, Any]) -> None:
             tomli_w.dump(config, f)
     except Exception as e:
         raise ConfigError(f"Failed to save config: {e}") from e
+    finally:
+        _load_config_at.cache_clear()
 
 
 def update_config(**updates: Any) -> dict[str, Any]:
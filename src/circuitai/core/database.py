@@ -20,6 +20,25 @@ except ImportError:
 
 DB_FILENAME = "circuitai.db"
 
+# Size of sqlite3's per-connection LRU of compiled statements. Repository
+# queries are fixed SQL strings, so each one is prepared once per connection.
+STATEMENT_CACHE_SIZE = 256
+
+# Applied on every connect. WAL keeps readers off the writer's lock and adds
+# circuitai.db-wal / circuitai.db-shm next to the database; with WAL,
+# synchronous=NORMAL only fsyncs at checkpoints and cannot corrupt the file.
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA cache_size = -16384",  # 16 MiB page cache
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA busy_timeout = 5000",
+)
+
+# Memory-mapped reads for plain sqlite3 only; SQLCipher must decrypt each page.
+MMAP_SIZE = 256 * 1024 * 1024
+
 
 class DatabaseConnection:
     """Manages a connection to the CircuitAI SQLite/SQLCipher database."""
@@ -32,19 +51,21 @@ class DatabaseConnection:
         self.db_path = db_path or (get_data_dir() / DB_FILENAME)
         self.encryption_key = encryption_key
         self._conn: sqlite3.Connection | None = None
+        self._tx_depth = 0
 
     def connect(self) -> None:
         """Open the database connection."""
         try:
             if self.encryption_key and HAS_SQLCIPHER:
-                self._conn = sqlcipher.connect(str(self.db_path))
+                self._conn = sqlcipher.connect(str(self.db_path), cached_statements=STATEMENT_CACHE_SIZE)
                 self._conn.execute(f"PRAGMA key = \"x'{self.encryption_key}'\"")
                 self._conn.execute("PRAGMA cipher_memory_security = ON")
             else:
-                self._conn = sqlite3.connect(str(self.db_path))
+                self._conn = sqlite3.connect(str(self.db_path), cached_statements=STATEMENT_CACHE_SIZE)
+                self._conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
 
-            self._conn.execute("PRAGMA journal_mode = WAL")
-            self._conn.execute("PRAGMA foreign_keys = ON")
+            for pragma in CONNECTION_PRAGMAS:
+                self._conn.execute(pragma)
             self._conn.row_factory = sqlite3.Row
         except Exception as e:
             raise DatabaseError(f"Failed to connect to database: {e}") from e
@@ -69,7 +90,7 @@ class DatabaseConnection:
         except Exception as e:
             raise DatabaseError(f"SQL error: {e}\nQuery: {sql}") from e
 
-    def executemany(self, sql: str, params_seq: list[tuple[Any, ...]]) -> sqlite3.Cursor:
+    def executemany(self, sql: str, params_seq: list[tuple[Any, ...]] | list[dict[str, Any]]) -> sqlite3.Cursor:
         """Execute a SQL statement with multiple parameter sets."""
         try:
             return self.conn.executemany(sql, params_seq)
@@ -84,8 +105,36 @@ class DatabaseConnection:
         """Execute and fetch all rows."""
         return self.execute(sql, params).fetchall()
 
+    def fetchall_dicts(self, sql: str, params: tuple[Any, ...] | dict[str, Any] = ()) -> list[dict[str, Any]]:
+        """Execute and fetch all rows as plain dicts.
+
+        Column names are read from the cursor description once per query,
+        avoiding a by-name ``sqlite3.Row`` lookup for every column of every row.
+        """
+        cursor = self.execute(sql, params)
+        cols = [c[0] for c in cursor.description]
+        return [dict(zip(cols, r)) for r in cursor.fetchall()]
+
+    def fetchcolumn(self, sql: str, params: tuple[Any, ...] | dict[str, Any] = ()) -> list[Any]:
+        """Execute and return the first column of every row.
+
+        Uses a plain tuple cursor, skipping ``sqlite3.Row`` allocation.
+        """
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        try:
+            cursor.execute(sql, params)
+        except Exception as e:
+            raise DatabaseError(f"SQL error: {e}\nQuery: {sql}") from e
+        return [r[0] for r in cursor.fetchall()]
+
     def commit(self) -> None:
-        """Commit the current transaction."""
+        """Commit the current transaction.
+
+        Deferred while inside ``transaction()``; the outermost block commits.
+        """
+        if self._tx_depth:
+            return
         self.conn.commit()
 
     def rollback(self) -> None:
@@ -94,13 +143,59 @@ class DatabaseConnection:
 
     @contextmanager
     def transaction(self) -> Generator[None, None, None]:
-        """Context manager for a database transaction."""
+        """Context manager for a database transaction.
+
+        Repository writes inside the block share one transaction (and one
+        fsync) instead of committing individually. Blocks may be nested: the
+        outermost one commits or rolls back, and an inner block runs in a
+        savepoint, so if it fails only its own writes are undone.
+        """
+        depth = self._tx_depth
+        savepoint = f"tx_{depth}"
+        if depth:
+            self.execute(f"SAVEPOINT {savepoint}")
+        elif not self.conn.in_transaction:
+            self.execute("BEGIN IMMEDIATE")
+        self._tx_depth += 1
         try:
             yield
-            self.commit()
-        except Exception:
-            self.rollback()
+        except BaseException:
+            # Also on KeyboardInterrupt, so the write lock isn't left held
+            if depth:
+                self.execute(f"ROLLBACK TO {savepoint}")
+                self.execute(f"RELEASE {savepoint}")
+            else:
+                self.rollback()
             raise
+        else:
+            if depth:
+                self.execute(f"RELEASE {savepoint}")
+            else:
+                try:
+                    self.conn.commit()
+                except BaseException:
+                    self.rollback()
+                    raise
+        finally:
+            self._tx_depth = depth
+
+    @contextmanager
+    def read_snapshot(self) -> Generator[None, None, None]:
+        """Run a group of reads against one consistent snapshot.
+
+        Opens a deferred transaction so back-to-back SELECTs share a single
+        read lock instead of taking one per statement. No-op when a
+        transaction is already open.
+        """
+        if self.conn.in_transaction:
+            yield
+            return
+        self.execute("BEGIN DEFERRED")
+        try:
+            yield
+        finally:
+            if self.conn.in_transaction:
+                self.commit()
 
     def __enter__(self) -> "DatabaseConnection":
         self.connect()
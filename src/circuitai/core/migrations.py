@@ -5,7 +5,7 @@ from __future__ import annotations
 from circuitai.core.database import DatabaseConnection
 from circuitai.core.exceptions import DatabaseError
 
-CURRENT_SCHEMA_VERSION = 5
+CURRENT_SCHEMA_VERSION = 12
 
 MIGRATIONS: dict[int, str | list[str]] = {
     1: """
@@ -375,6 +375,51 @@ MIGRATIONS: dict[int, str | list[str]] = {
         """CREATE INDEX IF NOT EXISTS idx_lab_markers_panel ON lab_markers(lab_panel_id)""",
         "INSERT INTO schema_version (version) VALUES (5)",
     ],
+    6: [
+        # Numeric abnormal-flag column so flagged-marker queries hit a partial index
+        """ALTER TABLE lab_markers ADD COLUMN is_abnormal INTEGER
+           GENERATED ALWAYS AS (CASE WHEN flag = 'normal' THEN 0 ELSE 1 END) VIRTUAL""",
+        """CREATE INDEX IF NOT EXISTS idx_lab_markers_abnormal
+           ON lab_markers(is_abnormal) WHERE is_abnormal = 1""",
+        "INSERT INTO schema_version (version) VALUES (6)",
+    ],
+    7: [
+        # Covers SubscriptionRepository.get_upcoming's range scan
+        """CREATE INDEX IF NOT EXISTS idx_subscriptions_upcoming
+           ON subscriptions(next_charge_date) WHERE is_active = 1 AND status = 'active'""",
+        "INSERT INTO schema_version (version) VALUES (7)",
+    ],
+    8: [
+        # Payment history and import dedup look up payments per bill
+        """CREATE INDEX IF NOT EXISTS idx_bill_payments_bill ON bill_payments(bill_id, paid_date)""",
+        "INSERT INTO schema_version (version) VALUES (8)",
+    ],
+    9: [
+        # Hash of the last pushed event content, so unchanged events are not re-sent
+        "ALTER TABLE calendar_sync_log ADD COLUMN content_hash TEXT NOT NULL DEFAULT ''",
+        "INSERT INTO schema_version (version) VALUES (9)",
+    ],
+    10: [
+        # Older pushes appended a log row per sync; keep the newest row per UID
+        """DELETE FROM calendar_sync_log WHERE rowid NOT IN
+           (SELECT MAX(rowid) FROM calendar_sync_log GROUP BY calendar_uid)""",
+        """CREATE UNIQUE INDEX IF NOT EXISTS idx_sync_calendar_uid ON calendar_sync_log(calendar_uid)""",
+        "INSERT INTO schema_version (version) VALUES (10)",
+    ],
+    11: [
+        # Cross-source dedup view; filters push down into each table's fingerprint index
+        """CREATE VIEW IF NOT EXISTS txn_fingerprints AS
+           SELECT txn_fingerprint FROM account_transactions
+           UNION ALL SELECT txn_fingerprint FROM card_transactions""",
+        "INSERT INTO schema_version (version) VALUES (11)",
+    ],
+    12: [
+        # Hash of the imported PDF's bytes, so re-importing the same file skips parsing
+        "ALTER TABLE lab_results ADD COLUMN source_hash TEXT",
+        """CREATE INDEX IF NOT EXISTS idx_lab_results_source_hash
+           ON lab_results(source_hash) WHERE source_hash IS NOT NULL""",
+        "INSERT INTO schema_version (version) VALUES (12)",
+    ],
 }
 
 
@@ -26,15 +26,15 @@ class Account(CircuitModel):
         return self.balance_cents / 100
 
     def to_row(self) -> dict[str, Any]:
-        data = self.model_dump()
+        data = super().to_row()
         data["is_active"] = int(data["is_active"])
         return data
 
     @classmethod
     def from_row(cls, row: Any) -> "Account":
-        d = {k: row[k] for k in row.keys()}
+        d = dict(row)
         d["is_active"] = bool(d.get("is_active", 1))
-        return cls(**d)
+        return cls.model_construct(**d)
 
 
 class AccountTransaction(CircuitModel):
@@ -51,17 +51,17 @@ class AccountTransaction(CircuitModel):
     updated_at: str = Field(default="", exclude=True)
 
     def to_row(self) -> dict[str, Any]:
-        data = self.model_dump()
+        data = super().to_row()
         data["is_matched"] = int(data["is_matched"])
         data.pop("updated_at", None)
         return data
 
     @classmethod
     def from_row(cls, row: Any) -> "AccountTransaction":
-        d = {k: row[k] for k in row.keys()}
+        d = dict(row)
         d["is_matched"] = bool(d.get("is_matched", 0))
         d.pop("updated_at", None)
-        return cls(**d)
+        return cls.model_construct(**d)
 
 
 class AccountRepository(BaseRepository):
@@ -73,11 +73,17 @@ class AccountRepository(BaseRepository):
             "SELECT * FROM accounts WHERE LOWER(institution) LIKE ? AND is_active = 1",
             (f"%{institution.lower()}%",),
         )
-        return [Account.from_row(r) for r in rows]
+        return Account.from_rows(rows)
 
     def update_balance(self, account_id: str, balance_cents: int) -> Account:
         return self.update(account_id, balance_cents=balance_cents, balance_updated_at=now_iso())  # type: ignore[return-value]
 
+    def total_balance(self) -> int:
+        row = self.db.fetchone(
+            "SELECT COALESCE(SUM(balance_cents), 0) as total FROM accounts WHERE is_active = 1"
+        )
+        return row["total"] if row else 0
+
 
 class AccountTransactionRepository(BaseRepository):
     table: ClassVar[str] = "account_transactions"
@@ -88,7 +94,7 @@ class AccountTransactionRepository(BaseRepository):
             "SELECT * FROM account_transactions WHERE account_id = ? ORDER BY transaction_date DESC LIMIT ?",
             (account_id, limit),
         )
-        return [AccountTransaction.from_row(r) for r in rows]
+        return AccountTransaction.from_rows(rows)
 
     def get_unmatched(self, account_id: str | None = None) -> list[AccountTransaction]:
         sql = "SELECT * FROM account_transactions WHERE is_matched = 0"
@@ -98,4 +104,4 @@ class AccountTransactionRepository(BaseRepository):
             params = (account_id,)
         sql += " ORDER BY transaction_date DESC"
         rows = self.db.fetchall(sql, params)
-        return [AccountTransaction.from_row(r) for r in rows]
+        return AccountTransaction.from_rows(rows)
@@ -18,8 +18,8 @@ class Child(CircuitModel):
 
     @classmethod
     def from_row(cls, row: Any) -> "Child":
-        d = {k: row[k] for k in row.keys()}
-        return cls(**d)
+        d = dict(row)
+        return cls.model_construct(**d)
 
 
 class Activity(CircuitModel):
@@ -42,15 +42,15 @@ class Activity(CircuitModel):
         return self.cost_cents / 100
 
     def to_row(self) -> dict[str, Any]:
-        data = self.model_dump()
+        data = super().to_row()
         data["is_active"] = int(data["is_active"])
         return data
 
     @classmethod
     def from_row(cls, row: Any) -> "Activity":
-        d = {k: row[k] for k in row.keys()}
+        d = dict(row)
         d["is_active"] = bool(d.get("is_active", 1))
-        return cls(**d)
+        return cls.model_construct(**d)
 
 
 class ActivityPayment(CircuitModel):
@@ -64,15 +64,15 @@ class ActivityPayment(CircuitModel):
     updated_at: str = Field(default="", exclude=True)
 
     def to_row(self) -> dict[str, Any]:
-        data = self.model_dump()
+        data = super().to_row()
         data.pop("updated_at", None)
         return data
 
     @classmethod
     def from_row(cls, row: Any) -> "ActivityPayment":
-        d = {k: row[k] for k in row.keys()}
+        d = dict(row)
         d.pop("updated_at", None)
-        return cls(**d)
+        return cls.model_construct(**d)
 
 
 class ChildRepository(BaseRepository):
@@ -88,7 +88,7 @@ class ChildRepository(BaseRepository):
 
     def list_all(self, active_only: bool = True) -> list[Child]:
         rows = self.db.fetchall("SELECT * FROM children ORDER BY name")
-        return [Child.from_row(r) for r in rows]
+        return Child.from_rows(rows)
 
 
 class ActivityRepository(BaseRepository):
@@ -100,14 +100,28 @@ class ActivityRepository(BaseRepository):
             "SELECT * FROM activities WHERE child_id = ? AND is_active = 1 ORDER BY name",
             (child_id,),
         )
-        return [Activity.from_row(r) for r in rows]
+        return Activity.from_rows(rows)
 
     def get_by_sport(self, sport: str) -> list[Activity]:
         rows = self.db.fetchall(
             "SELECT * FROM activities WHERE LOWER(sport_or_type) LIKE ? AND is_active = 1",
             (f"%{sport.lower()}%",),
         )
-        return [Activity.from_row(r) for r in rows]
+        return Activity.from_rows(rows)
+
+    def summary_by_child(self) -> list[dict[str, Any]]:
+        """Every child joined with their active activities, one row per activity.
+
+        Children with no activities appear once with NULL activity columns.
+        Ordered by child name then activity name, so rows group by child.
+        """
+        return self.db.fetchall_dicts(
+            "SELECT c.id as child_id, c.name as child_name, a.id as activity_id, "
+            "a.name as activity_name, a.sport_or_type, a.cost_cents "
+            "FROM children c "
+            "LEFT JOIN activities a ON a.child_id = c.id AND a.is_active = 1 "
+            "ORDER BY c.name, c.id, a.name"
+        )
 
     def total_cost(self, child_id: str | None = None) -> int:
         sql = "SELECT COALESCE(SUM(cost_cents), 0) as total FROM activities WHERE is_active = 1"
@@ -128,4 +142,4 @@ class ActivityPaymentRepository(BaseRepository):
             "SELECT * FROM activity_payments WHERE activity_id = ? ORDER BY paid_date DESC LIMIT ?",
             (activity_id, limit),
         )
-        return [ActivityPayment.from_row(r) for r in rows]
+        return ActivityPayment.from_rows(rows)
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
-from typing import Any, ClassVar
+from functools import lru_cache
+from typing import Any, ClassVar, Iterable, Self
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from circuitai.core.database import DatabaseConnection
 from circuitai.core.exceptions import NotFoundError
@@ -22,23 +23,69 @@ def now_iso() -> str:
     return datetime.utcnow().isoformat()
 
 
+# Ids bound per ``IN (...)`` query, kept well under SQLite's parameter limit.
+IN_CHUNK_SIZE = 500
+
+
+# (numerator, denominator) converting an amount charged at a given frequency
+# to its monthly equivalent. Shared by subscription and bill summaries.
+MONTHLY_FACTORS: dict[str, tuple[int, int]] = {
+    "weekly": (52, 12),
+    "monthly": (1, 1),
+    "quarterly": (1, 3),
+    "yearly": (1, 12),
+}
+
+
+@lru_cache(maxsize=4096)
+def to_monthly_cents(amount_cents: int, frequency: str) -> int:
+    """Normalize an amount to monthly. Unknown frequencies pass through unchanged."""
+    num, den = MONTHLY_FACTORS.get(frequency, (1, 1))
+    return amount_cents * num // den
+
+
 class CircuitModel(BaseModel):
     """Base for all CircuitAI Pydantic models."""
 
+    # Validate on construction only; trusted rows and computed values are
+    # built with ``model_construct`` and never re-validated.
+    model_config = ConfigDict(extra="ignore", validate_assignment=False, revalidate_instances="never")
+
     id: str = Field(default_factory=new_id)
     created_at: str = Field(default_factory=now_iso)
     updated_at: str = Field(default_factory=now_iso)
 
+    # Field names in declaration order, filled in per subclass at class creation.
+    _row_fields: ClassVar[tuple[str, ...]] = ("id", "created_at", "updated_at")
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._row_fields = tuple(cls.model_fields)
+
     def to_row(self) -> dict[str, Any]:
-        """Convert model to a flat dict suitable for DB insertion."""
-        return self.model_dump()
+        """Convert model to a flat dict suitable for DB insertion.
+
+        All fields are scalar columns, so values are read straight from the
+        instance instead of going through ``model_dump`` serialization.
+        """
+        d = self.__dict__
+        return {k: d[k] for k in self._row_fields}
 
     @classmethod
     def from_row(cls, row: Any) -> "CircuitModel":
-        """Create model from a sqlite3.Row or dict."""
-        if hasattr(row, "keys"):
-            return cls(**{k: row[k] for k in row.keys()})
-        return cls(**row)
+        """Create model from a sqlite3.Row or dict.
+
+        Rows come from our own schema, so validation is skipped via
+        ``model_construct``; subclasses coerce INTEGER flags back to bool.
+        """
+        return cls.model_construct(**dict(row))
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Any]) -> list[Self]:
+        """Create models from a sequence of rows."""
+        from_row = cls.from_row
+        return [from_row(r) for r in rows]
 
 
 class BaseRepository:
@@ -59,6 +106,17 @@ class BaseRepository:
         self.db.commit()
         return model
 
+    def insert_many(self, models: list[CircuitModel]) -> list[CircuitModel]:
+        """Insert several records with one ``executemany`` and a single commit."""
+        if not models:
+            return models
+        rows = [m.to_row() for m in models]
+        cols = ", ".join(rows[0].keys())
+        placeholders = ", ".join(f":{k}" for k in rows[0].keys())
+        self.db.executemany(f"INSERT INTO {self.table} ({cols}) VALUES ({placeholders})", rows)
+        self.db.commit()
+        return models
+
     def get(self, entity_id: str) -> CircuitModel:
         """Fetch a single record by ID."""
         row = self.db.fetchone(f"SELECT * FROM {self.table} WHERE id = ?", (entity_id,))
@@ -69,11 +127,11 @@ class BaseRepository:
     def list_all(self, active_only: bool = True) -> list[CircuitModel]:
         """List all records, optionally filtering to active ones."""
         sql = f"SELECT * FROM {self.table}"
-        if active_only and "is_active" in self._column_names():
+        # The model mirrors the table, so no need to ask SQLite for its columns
+        if active_only and "is_active" in self.model_class.model_fields:
             sql += " WHERE is_active = 1"
         sql += " ORDER BY created_at DESC"
-        rows = self.db.fetchall(sql)
-        return [self.model_class.from_row(r) for r in rows]
+        return self.model_class.from_rows(self.db.fetchall_dicts(sql))
 
     def update(self, entity_id: str, **updates: Any) -> CircuitModel:
         """Update specific fields on a record."""
@@ -103,8 +161,3 @@ class BaseRepository:
             sql += f" WHERE {where}"
         row = self.db.fetchone(sql, params)
         return row["cnt"] if row else 0
-
-    def _column_names(self) -> list[str]:
-        """Get column names for this table."""
-        cursor = self.db.execute(f"PRAGMA table_info({self.table})")
-        return [row["name"] for row in cursor.fetchall()]
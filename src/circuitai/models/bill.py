@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import calendar
 import json
+from datetime import date
 from typing import Any, ClassVar
 
 from pydantic import Field
 
-from circuitai.models.base import BaseRepository, CircuitModel
+from circuitai.models.base import IN_CHUNK_SIZE, BaseRepository, CircuitModel
 
 
 class Bill(CircuitModel):
@@ -40,17 +42,17 @@ class Bill(CircuitModel):
             self.match_patterns = json.dumps(patterns)
 
     def to_row(self) -> dict[str, Any]:
-        data = self.model_dump()
+        data = super().to_row()
         data["auto_pay"] = int(data["auto_pay"])
         data["is_active"] = int(data["is_active"])
         return data
 
     @classmethod
     def from_row(cls, row: Any) -> "Bill":
-        d = {k: row[k] for k in row.keys()}
+        d = dict(row)
         d["auto_pay"] = bool(d.get("auto_pay", 0))
         d["is_active"] = bool(d.get("is_active", 1))
-        return cls(**d)
+        return cls.model_construct(**d)
 
 
 class BillPayment(CircuitModel):
@@ -65,15 +67,15 @@ class BillPayment(CircuitModel):
     updated_at: str = Field(default="", exclude=True)
 
     def to_row(self) -> dict[str, Any]:
-        data = self.model_dump()
+        data = super().to_row()
         data.pop("updated_at", None)
         return data
 
     @classmethod
     def from_row(cls, row: Any) -> "BillPayment":
-        d = {k: row[k] for k in row.keys()}
+        d = dict(row)
         d.pop("updated_at", None)
-        return cls(**d)
+        return cls.model_construct(**d)
 
 
 class BillRepository(BaseRepository):
@@ -86,37 +88,39 @@ class BillRepository(BaseRepository):
             "SELECT * FROM bills WHERE LOWER(name) LIKE ? AND is_active = 1",
             (f"%{name.lower()}%",),
         )
-        return [Bill.from_row(r) for r in rows]
+        return Bill.from_rows(rows)
 
-    def get_due_soon(self, within_days: int = 7) -> list[Bill]:
-        """Get active bills due within N days (based on due_day of current month)."""
-        from datetime import date
-        today = date.today()
+    def frequency_totals(self) -> dict[str, tuple[int, int]]:
+        """Count and total amount of active bills, keyed by frequency."""
+        rows = self.db.fetchall(
+            "SELECT frequency, COUNT(*) as cnt, COALESCE(SUM(amount_cents), 0) as total "
+            "FROM bills WHERE is_active = 1 GROUP BY frequency",
+        )
+        return {r["frequency"]: (r["cnt"], r["total"]) for r in rows}
+
+    def get_due_soon(self, within_days: int = 7, today: date | None = None) -> list[Bill]:
+        """Get active bills due within N days (based on due_day, clamped to month end)."""
+        if today is None:
+            today = date.today()
         rows = self.db.fetchall(
             "SELECT * FROM bills WHERE is_active = 1 AND due_day IS NOT NULL ORDER BY due_day",
         )
+        days_this = calendar.monthrange(today.year, today.month)[1]
+        next_year, next_month = (today.year + 1, 1) if today.month == 12 else (today.year, today.month + 1)
+        days_next = calendar.monthrange(next_year, next_month)[1]
         result = []
         for row in rows:
-            bill = Bill.from_row(row)
-            if bill.due_day:
-                try:
-                    due = today.replace(day=bill.due_day)
-                except ValueError:
-                    # Day doesn't exist in this month (e.g., 31st in Feb)
-                    import calendar
-                    last_day = calendar.monthrange(today.year, today.month)[1]
-                    due = today.replace(day=min(bill.due_day, last_day))
-
-                if due < today:
-                    # Due date already passed this month; check next month
-                    if today.month == 12:
-                        due = due.replace(year=today.year + 1, month=1)
-                    else:
-                        due = due.replace(month=today.month + 1)
-
-                diff = (due - today).days
-                if 0 <= diff <= within_days:
-                    result.append(bill)
+            due_day = row["due_day"]
+            if not due_day:
+                continue
+            # Days until this month's due day, or next month's if already past
+            day = min(due_day, days_this)
+            if day >= today.day:
+                diff = day - today.day
+            else:
+                diff = days_this - today.day + min(due_day, days_next)
+            if diff <= within_days:
+                result.append(Bill.from_row(row))
         return result
 
 
@@ -130,7 +134,7 @@ class BillPaymentRepository(BaseRepository):
             "SELECT * FROM bill_payments WHERE bill_id = ? ORDER BY paid_date DESC LIMIT ?",
             (bill_id, limit),
         )
-        return [BillPayment.from_row(r) for r in rows]
+        return BillPayment.from_rows(rows)
 
     def get_last_payment(self, bill_id: str) -> BillPayment | None:
         """Get the most recent payment for a bill."""
@@ -140,6 +144,27 @@ class BillPaymentRepository(BaseRepository):
         )
         return BillPayment.from_row(row) if row else None
 
+    def get_last_paid_dates(self, bill_ids: list[str]) -> dict[str, str]:
+        """Map bill id -> latest paid_date for bills with payments, in chunks of ``IN_CHUNK_SIZE``."""
+        last_paid: dict[str, str] = {}
+        for i in range(0, len(bill_ids), IN_CHUNK_SIZE):
+            chunk = bill_ids[i:i + IN_CHUNK_SIZE]
+            placeholders = ", ".join("?" for _ in chunk)
+            rows = self.db.fetchall(
+                f"""SELECT bill_id, MAX(paid_date) AS paid_date FROM bill_payments
+                    WHERE bill_id IN ({placeholders}) GROUP BY bill_id""",
+                tuple(chunk),
+            )
+            last_paid.update((r["bill_id"], r["paid_date"]) for r in rows)
+        return last_paid
+
+    def get_note_fingerprints(self, bill_id: str, prefix: str) -> set[str]:
+        """Fingerprints stored as ``{prefix}{fingerprint}`` in payment notes for a bill."""
+        return set(self.db.fetchcolumn(
+            "SELECT substr(notes, ?) FROM bill_payments WHERE bill_id = ? AND notes LIKE ?",
+            (len(prefix) + 1, bill_id, f"{prefix}%"),
+        ))
+
     def total_paid(self, bill_id: str) -> int:
         """Total amount paid for a bill (in cents)."""
         row = self.db.fetchone(
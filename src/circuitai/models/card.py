@@ -38,15 +38,15 @@ class Card(CircuitModel):
         return (self.balance_cents / self.credit_limit_cents) * 100
 
     def to_row(self) -> dict[str, Any]:
-        data = self.model_dump()
+        data = super().to_row()
         data["is_active"] = int(data["is_active"])
         return data
 
     @classmethod
     def from_row(cls, row: Any) -> "Card":
-        d = {k: row[k] for k in row.keys()}
+        d = dict(row)
         d["is_active"] = bool(d.get("is_active", 1))
-        return cls(**d)
+        return cls.model_construct(**d)
 
 
 class CardTransaction(CircuitModel):
@@ -62,17 +62,17 @@ class CardTransaction(CircuitModel):
     updated_at: str = Field(default="", exclude=True)
 
     def to_row(self) -> dict[str, Any]:
-        data = self.model_dump()
+        data = super().to_row()
         data["is_matched"] = int(data["is_matched"])
         data.pop("updated_at", None)
         return data
 
     @classmethod
     def from_row(cls, row: Any) -> "CardTransaction":
-        d = {k: row[k] for k in row.keys()}
+        d = dict(row)
         d["is_matched"] = bool(d.get("is_matched", 0))
         d.pop("updated_at", None)
-        return cls(**d)
+        return cls.model_construct(**d)
 
 
 class CardRepository(BaseRepository):
@@ -82,6 +82,25 @@ class CardRepository(BaseRepository):
     def update_balance(self, card_id: str, balance_cents: int) -> Card:
         return self.update(card_id, balance_cents=balance_cents, balance_updated_at=now_iso())  # type: ignore[return-value]
 
+    def totals(self) -> dict[str, int]:
+        """Sum balance and credit limit across active cards in one query."""
+        row = self.db.fetchone(
+            "SELECT COALESCE(SUM(balance_cents), 0) as balance_cents, "
+            "COALESCE(SUM(credit_limit_cents), 0) as limit_cents "
+            "FROM cards WHERE is_active = 1"
+        )
+        return {"balance_cents": row["balance_cents"], "limit_cents": row["limit_cents"]}
+
+    def get_utilization(self) -> list[dict[str, Any]]:
+        """Per-card balance and utilization, computed in SQL for active cards."""
+        return self.db.fetchall_dicts(
+            "SELECT id, name, institution, last_four, balance_cents, "
+            "credit_limit_cents as limit_cents, "
+            "CASE WHEN credit_limit_cents = 0 THEN 0.0 "
+            "ELSE balance_cents * 100.0 / credit_limit_cents END as utilization_pct "
+            "FROM cards WHERE is_active = 1 ORDER BY created_at DESC"
+        )
+
 
 class CardTransactionRepository(BaseRepository):
     table: ClassVar[str] = "card_transactions"
@@ -92,7 +111,7 @@ class CardTransactionRepository(BaseRepository):
             "SELECT * FROM card_transactions WHERE card_id = ? ORDER BY transaction_date DESC LIMIT ?",
             (card_id, limit),
         )
-        return [CardTransaction.from_row(r) for r in rows]
+        return CardTransaction.from_rows(rows)
 
     def get_unmatched(self, card_id: str | None = None) -> list[CardTransaction]:
         sql = "SELECT * FROM card_transactions WHERE is_matched = 0"
@@ -102,4 +121,4 @@ class CardTransactionRepository(BaseRepository):
             params = (card_id,)
         sql += " ORDER BY transaction_date DESC"
         rows = self.db.fetchall(sql, params)
-        return [CardTransaction.from_row(r) for r in rows]
+        return CardTransaction.from_rows(rows)
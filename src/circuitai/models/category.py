@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any, ClassVar
 
 from circuitai.models.base import BaseRepository, CircuitModel
@@ -34,8 +35,19 @@ class Tag(CircuitModel):
 
     @classmethod
     def from_row(cls, row: Any) -> "Tag":
-        d = {k: row[k] for k in row.keys()}
-        return cls(**d)
+        d = dict(row)
+        return cls.model_construct(**d)
+
+
+@dataclass(slots=True, frozen=True)
+class TagRow:
+    """Read-only, slotted view of a tag for bulk listing."""
+
+    id: str
+    entity_type: str
+    entity_id: str
+    tag: str
+    created_at: str
 
 
 class TagRepository(BaseRepository):
@@ -43,11 +55,11 @@ class TagRepository(BaseRepository):
     model_class: ClassVar[type[CircuitModel]] = Tag  # type: ignore[assignment]
 
     def get_for_entity(self, entity_type: str, entity_id: str) -> list[Tag]:
-        rows = self.db.fetchall(
+        rows = self.db.fetchall_dicts(
             "SELECT * FROM tags WHERE entity_type = ? AND entity_id = ?",
             (entity_type, entity_id),
         )
-        return [Tag.from_row(r) for r in rows]
+        return [Tag.model_construct(**d) for d in rows]
 
     def add_tag(self, entity_type: str, entity_id: str, tag: str) -> Tag:
         t = Tag(entity_type=entity_type, entity_id=entity_id, tag=tag)
@@ -61,9 +73,14 @@ class TagRepository(BaseRepository):
         self.db.commit()
 
     def find_entities_by_tag(self, tag: str) -> list[Tag]:
-        rows = self.db.fetchall("SELECT * FROM tags WHERE tag = ?", (tag,))
-        return [Tag.from_row(r) for r in rows]
+        rows = self.db.fetchall_dicts("SELECT * FROM tags WHERE tag = ?", (tag,))
+        return [Tag.model_construct(**d) for d in rows]
 
     def list_all(self, active_only: bool = True) -> list[Tag]:
-        rows = self.db.fetchall("SELECT * FROM tags ORDER BY tag")
-        return [Tag.from_row(r) for r in rows]
+        rows = self.db.fetchall_dicts("SELECT * FROM tags ORDER BY tag")
+        return [Tag.model_construct(**d) for d in rows]
+
+    def list_rows(self) -> list[TagRow]:
+        """List all tags as lightweight slotted rows."""
+        rows = self.db.fetchall("SELECT id, entity_type, entity_id, tag, created_at FROM tags ORDER BY tag")
+        return [TagRow(*r) for r in rows]
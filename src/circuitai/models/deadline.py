@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import date
 from typing import Any, ClassVar
 
-from circuitai.models.base import BaseRepository, CircuitModel, now_iso
+from circuitai.models.base import IN_CHUNK_SIZE, BaseRepository, CircuitModel, now_iso
 
 
 class Deadline(CircuitModel):
@@ -37,15 +37,15 @@ class Deadline(CircuitModel):
         return days is not None and days < 0 and not self.is_completed
 
     def to_row(self) -> dict[str, Any]:
-        data = self.model_dump()
+        data = super().to_row()
         data["is_completed"] = int(data["is_completed"])
         return data
 
     @classmethod
     def from_row(cls, row: Any) -> "Deadline":
-        d = {k: row[k] for k in row.keys()}
+        d = dict(row)
         d["is_completed"] = bool(d.get("is_completed", 0))
-        return cls(**d)
+        return cls.model_construct(**d)
 
 
 class DeadlineRepository(BaseRepository):
@@ -61,7 +61,7 @@ class DeadlineRepository(BaseRepository):
             "SELECT * FROM deadlines WHERE is_completed = 0 AND due_date >= ? AND due_date <= ? ORDER BY due_date",
             (target, end),
         )
-        return [Deadline.from_row(r) for r in rows]
+        return Deadline.from_rows(rows)
 
     def get_overdue(self) -> list[Deadline]:
         """Get uncompleted deadlines that are past due."""
@@ -70,11 +70,48 @@ class DeadlineRepository(BaseRepository):
             "SELECT * FROM deadlines WHERE is_completed = 0 AND due_date < ? ORDER BY due_date",
             (today,),
         )
-        return [Deadline.from_row(r) for r in rows]
+        return Deadline.from_rows(rows)
 
     def complete(self, deadline_id: str) -> Deadline:
         return self.update(deadline_id, is_completed=1, completed_at=now_iso())  # type: ignore[return-value]
 
+    def complete_many(self, deadline_ids: list[str], completed_at: str | None = None) -> int:
+        """Mark several deadlines completed in one UPDATE. Returns rows changed."""
+        if not deadline_ids:
+            return 0
+        ts = now_iso()
+        placeholders = ", ".join("?" for _ in deadline_ids)
+        cursor = self.db.execute(
+            f"UPDATE deadlines SET is_completed = 1, completed_at = ?, updated_at = ? WHERE id IN ({placeholders})",
+            (completed_at or ts, ts, *deadline_ids),
+        )
+        self.db.commit()
+        return cursor.rowcount
+
+    def get_due_dates(self, deadline_ids: list[str]) -> dict[str, str]:
+        """Map id -> due_date for the given deadlines, querying in chunks of ``IN_CHUNK_SIZE``."""
+        due: dict[str, str] = {}
+        for i in range(0, len(deadline_ids), IN_CHUNK_SIZE):
+            chunk = deadline_ids[i:i + IN_CHUNK_SIZE]
+            placeholders = ", ".join("?" for _ in chunk)
+            rows = self.db.fetchall(
+                f"SELECT id, due_date FROM deadlines WHERE id IN ({placeholders})",
+                tuple(chunk),
+            )
+            due.update((r["id"], r["due_date"]) for r in rows)
+        return due
+
+    def reschedule_many(self, changes: list[tuple[str, str]]) -> None:
+        """Set new due dates from ``(deadline_id, due_date)`` pairs with one ``executemany``."""
+        if not changes:
+            return
+        ts = now_iso()
+        self.db.executemany(
+            "UPDATE deadlines SET due_date = ?, updated_at = ? WHERE id = ?",
+            [(due_date, ts, deadline_id) for deadline_id, due_date in changes],
+        )
+        self.db.commit()
+
     def find_by_linked_bill(self, bill_id: str, active_only: bool = True) -> list[Deadline]:
         """Find deadlines linked to a specific bill."""
         sql = "SELECT * FROM deadlines WHERE linked_bill_id = ?"
@@ -82,7 +119,7 @@ class DeadlineRepository(BaseRepository):
             sql += " AND is_completed = 0"
         sql += " ORDER BY due_date"
         rows = self.db.fetchall(sql, (bill_id,))
-        return [Deadline.from_row(r) for r in rows]
+        return Deadline.from_rows(rows)
 
     def list_all(self, active_only: bool = True) -> list[Deadline]:
         sql = "SELECT * FROM deadlines"
@@ -90,4 +127,4 @@ class DeadlineRepository(BaseRepository):
             sql += " WHERE is_completed = 0"
         sql += " ORDER BY due_date"
         rows = self.db.fetchall(sql)
-        return [Deadline.from_row(r) for r in rows]
+        return Deadline.from_rows(rows)
@@ -6,6 +6,7 @@ from typing import Any, ClassVar
 
 from pydantic import Field
 
+from circuitai.core.exceptions import NotFoundError
 from circuitai.models.base import BaseRepository, CircuitModel, now_iso
 
 
@@ -40,15 +41,15 @@ class Investment(CircuitModel):
         return (self.gain_loss_cents / self.cost_basis_cents) * 100
 
     def to_row(self) -> dict[str, Any]:
-        data = self.model_dump()
+        data = super().to_row()
         data["is_active"] = int(data["is_active"])
         return data
 
     @classmethod
     def from_row(cls, row: Any) -> "Investment":
-        d = {k: row[k] for k in row.keys()}
+        d = dict(row)
         d["is_active"] = bool(d.get("is_active", 1))
-        return cls(**d)
+        return cls.model_construct(**d)
 
 
 class InvestmentContribution(CircuitModel):
@@ -62,15 +63,15 @@ class InvestmentContribution(CircuitModel):
     updated_at: str = Field(default="", exclude=True)
 
     def to_row(self) -> dict[str, Any]:
-        data = self.model_dump()
+        data = super().to_row()
         data.pop("updated_at", None)
         return data
 
     @classmethod
     def from_row(cls, row: Any) -> "InvestmentContribution":
-        d = {k: row[k] for k in row.keys()}
+        d = dict(row)
         d.pop("updated_at", None)
-        return cls(**d)
+        return cls.model_construct(**d)
 
 
 class InvestmentRepository(BaseRepository):
@@ -82,7 +83,7 @@ class InvestmentRepository(BaseRepository):
             "SELECT * FROM investments WHERE account_type = ? AND is_active = 1",
             (account_type,),
         )
-        return [Investment.from_row(r) for r in rows]
+        return Investment.from_rows(rows)
 
     def total_value(self) -> int:
         row = self.db.fetchone(
@@ -90,9 +91,30 @@ class InvestmentRepository(BaseRepository):
         )
         return row["total"] if row else 0
 
+    def summary_by_type(self) -> list[dict[str, Any]]:
+        """Aggregate value, cost basis and gain/loss per account type in one query."""
+        return self.db.fetchall_dicts(
+            "SELECT account_type, COUNT(*) as count, "
+            "SUM(current_value_cents) as value_cents, "
+            "SUM(cost_basis_cents) as cost_basis_cents, "
+            "SUM(current_value_cents - cost_basis_cents) as gain_cents "
+            "FROM investments WHERE is_active = 1 "
+            "GROUP BY account_type ORDER BY account_type"
+        )
+
     def update_value(self, investment_id: str, value_cents: int) -> Investment:
         return self.update(investment_id, current_value_cents=value_cents, value_updated_at=now_iso())  # type: ignore[return-value]
 
+    def increment_cost_basis(self, investment_id: str, delta_cents: int) -> None:
+        """Add to cost basis in place, without reading the row first."""
+        cursor = self.db.execute(
+            "UPDATE investments SET cost_basis_cents = cost_basis_cents + ?, updated_at = ? WHERE id = ?",
+            (delta_cents, now_iso(), investment_id),
+        )
+        if cursor.rowcount == 0:
+            raise NotFoundError(f"Investment not found: {investment_id}")
+        self.db.commit()
+
 
 class InvestmentContributionRepository(BaseRepository):
     table: ClassVar[str] = "investment_contributions"
@@ -103,7 +125,7 @@ class InvestmentContributionRepository(BaseRepository):
             "SELECT * FROM investment_contributions WHERE investment_id = ? ORDER BY contribution_date DESC LIMIT ?",
             (investment_id, limit),
         )
-        return [InvestmentContribution.from_row(r) for r in rows]
+        return InvestmentContribution.from_rows(rows)
 
     def total_contributed(self, investment_id: str) -> int:
         row = self.db.fetchone(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any, ClassVar
 
 from pydantic import Field
@@ -18,21 +19,22 @@ class LabResult(CircuitModel):
     order_date: str | None = None
     result_date: str | None = None
     report_fingerprint: str | None = None
+    source_hash: str | None = None  # SHA-256 of the imported file's bytes
     status: str = "completed"  # pending, completed, reviewed
     source: str = "pdf"  # pdf, browser, manual
     notes: str = ""
     is_active: bool = True
 
     def to_row(self) -> dict[str, Any]:
-        data = self.model_dump()
+        data = super().to_row()
         data["is_active"] = int(data["is_active"])
         return data
 
     @classmethod
     def from_row(cls, row: Any) -> "LabResult":
-        d = {k: row[k] for k in row.keys()}
+        d = dict(row)
         d["is_active"] = bool(d.get("is_active", 1))
-        return cls(**d)
+        return cls.model_construct(**d)
 
 
 class LabPanel(CircuitModel):
@@ -44,15 +46,15 @@ class LabPanel(CircuitModel):
     updated_at: str = Field(default="", exclude=True)
 
     def to_row(self) -> dict[str, Any]:
-        data = self.model_dump()
+        data = super().to_row()
         data.pop("updated_at", None)
         return data
 
     @classmethod
     def from_row(cls, row: Any) -> "LabPanel":
-        d = {k: row[k] for k in row.keys()}
+        d = dict(row)
         d.pop("updated_at", None)
-        return cls(**d)
+        return cls.model_construct(**d)
 
 
 class LabMarker(CircuitModel):
@@ -73,24 +75,68 @@ class LabMarker(CircuitModel):
 
     @property
     def reference_range(self) -> str:
-        if self.reference_low and self.reference_high:
-            return f"{self.reference_low} - {self.reference_high}"
-        if self.reference_low:
-            return f">= {self.reference_low}"
-        if self.reference_high:
-            return f"< {self.reference_high}"
-        return ""
+        return _format_reference_range(self.reference_low, self.reference_high)
 
     def to_row(self) -> dict[str, Any]:
-        data = self.model_dump()
+        data = super().to_row()
         data.pop("updated_at", None)
         return data
 
     @classmethod
     def from_row(cls, row: Any) -> "LabMarker":
-        d = {k: row[k] for k in row.keys()}
+        d = dict(row)
         d.pop("updated_at", None)
-        return cls(**d)
+        return cls.model_construct(**d)
+
+
+@dataclass(slots=True, frozen=True)
+class LabMarkerRow:
+    """Read-only, slotted view of a lab marker for bulk display paths.
+
+    Carries no per-instance ``__dict__`` or pydantic bookkeeping. Use
+    ``to_model()`` when validation or JSON serialization is needed.
+    """
+
+    id: str
+    lab_panel_id: str
+    marker_name: str
+    value: str
+    unit: str
+    reference_low: str
+    reference_high: str
+    flag: str
+    created_at: str
+
+    @property
+    def is_flagged(self) -> bool:
+        return self.flag != "normal"
+
+    @property
+    def reference_range(self) -> str:
+        return _format_reference_range(self.reference_low, self.reference_high)
+
+    def to_model(self) -> LabMarker:
+        return LabMarker.model_construct(
+            id=self.id,
+            lab_panel_id=self.lab_panel_id,
+            marker_name=self.marker_name,
+            value=self.value,
+            unit=self.unit,
+            reference_low=self.reference_low,
+            reference_high=self.reference_high,
+            flag=self.flag,
+            created_at=self.created_at,
+        )
+
+
+def _format_reference_range(low: str, high: str) -> str:
+    if low and high:
+        return f"{low} - {high}"
+    if low:
+        return f">= {low}"
+    if high:
+        return f"< {high}"
+    return ""
 
 
 class LabResultRepository(BaseRepository):
@@ -104,19 +150,26 @@ class LabResultRepository(BaseRepository):
         )
         return LabResult.from_row(row) if row else None
 
+    def find_by_source_hash(self, source_hash: str) -> LabResult | None:
+        row = self.db.fetchone(
+            "SELECT * FROM lab_results WHERE source_hash = ? AND is_active = 1",
+            (source_hash,),
+        )
+        return LabResult.from_row(row) if row else None
+
     def find_by_status(self, status: str) -> list[LabResult]:
         rows = self.db.fetchall(
             "SELECT * FROM lab_results WHERE status = ? AND is_active = 1 ORDER BY result_date DESC",
             (status,),
         )
-        return [LabResult.from_row(r) for r in rows]
+        return LabResult.from_rows(rows)
 
     def get_recent(self, limit: int = 10) -> list[LabResult]:
         rows = self.db.fetchall(
             "SELECT * FROM lab_results WHERE is_active = 1 ORDER BY result_date DESC LIMIT ?",
             (limit,),
         )
-        return [LabResult.from_row(r) for r in rows]
+        return LabResult.from_rows(rows)
 
 
 class LabPanelRepository(BaseRepository):
@@ -124,11 +177,11 @@ class LabPanelRepository(BaseRepository):
     model_class: ClassVar[type[CircuitModel]] = LabPanel  # type: ignore[assignment]
 
     def get_for_result(self, lab_result_id: str) -> list[LabPanel]:
-        rows = self.db.fetchall(
+        rows = self.db.fetchall_dicts(
             "SELECT * FROM lab_panels WHERE lab_result_id = ? ORDER BY panel_name",
             (lab_result_id,),
         )
-        return [LabPanel.from_row(r) for r in rows]
+        return [LabPanel.model_construct(**d) for d in rows]
 
 
 class LabMarkerRepository(BaseRepository):
@@ -136,37 +189,47 @@ class LabMarkerRepository(BaseRepository):
     model_class: ClassVar[type[CircuitModel]] = LabMarker  # type: ignore[assignment]
 
     def get_for_panel(self, lab_panel_id: str) -> list[LabMarker]:
-        rows = self.db.fetchall(
+        rows = self.db.fetchall_dicts(
             "SELECT * FROM lab_markers WHERE lab_panel_id = ? ORDER BY marker_name",
             (lab_panel_id,),
         )
-        return [LabMarker.from_row(r) for r in rows]
+        return [LabMarker.model_construct(**d) for d in rows]
+
+    def get_for_panel_rows(self, lab_panel_id: str) -> list[LabMarkerRow]:
+        """Like ``get_for_panel`` but returns lightweight slotted rows."""
+        rows = self.db.fetchall(
+            "SELECT id, lab_panel_id, marker_name, value, unit, reference_low, "
+            "reference_high, flag, created_at "
+            "FROM lab_markers WHERE lab_panel_id = ? ORDER BY marker_name",
+            (lab_panel_id,),
+        )
+        return [LabMarkerRow(*r) for r in rows]
 
     def get_flagged_for_result(self, lab_result_id: str) -> list[LabMarker]:
         """Get all flagged markers across all panels for a result (JOIN)."""
-        rows = self.db.fetchall(
+        rows = self.db.fetchall_dicts(
             "SELECT m.* FROM lab_markers m "
             "JOIN lab_panels p ON m.lab_panel_id = p.id "
-            "WHERE p.lab_result_id = ? AND m.flag != 'normal' "
+            "WHERE p.lab_result_id = ? AND m.is_abnormal = 1 "
             "ORDER BY m.marker_name",
             (lab_result_id,),
         )
-        return [LabMarker.from_row(r) for r in rows]
+        return [LabMarker.model_construct(**d) for d in rows]
 
     def get_all_flagged(self) -> list[LabMarker]:
         """Get all flagged markers from unreviewed results (for morning briefing)."""
-        rows = self.db.fetchall(
+        rows = self.db.fetchall_dicts(
             "SELECT m.* FROM lab_markers m "
             "JOIN lab_panels p ON m.lab_panel_id = p.id "
             "JOIN lab_results r ON p.lab_result_id = r.id "
-            "WHERE m.flag != 'normal' AND r.status != 'reviewed' AND r.is_active = 1 "
+            "WHERE m.is_abnormal = 1 AND r.status != 'reviewed' AND r.is_active = 1 "
             "ORDER BY r.result_date DESC, m.marker_name",
         )
-        return [LabMarker.from_row(r) for r in rows]
+        return [LabMarker.model_construct(**d) for d in rows]
 
     def get_marker_history(self, marker_name: str) -> list[dict]:
         """Get all values of a marker across results, ordered by date."""
-        rows = self.db.fetchall(
+        rows = self.db.fetchall_dicts(
             "SELECT m.value, m.unit, m.flag, m.reference_low, m.reference_high, "
             "r.result_date, r.provider "
             "FROM lab_markers m "
@@ -176,7 +239,7 @@ class LabMarkerRepository(BaseRepository):
             "ORDER BY r.result_date ASC",
             (marker_name,),
         )
-        return [dict(r) for r in rows]
+        return rows
 
     def list_distinct_names(self) -> list[str]:
         """Get all unique marker names across active results."""
@@ -39,15 +39,15 @@ class Mortgage(CircuitModel):
         return self.interest_rate_bps / 100
 
     def to_row(self) -> dict[str, Any]:
-        data = self.model_dump()
+        data = super().to_row()
         data["is_active"] = int(data["is_active"])
         return data
 
     @classmethod
     def from_row(cls, row: Any) -> "Mortgage":
-        d = {k: row[k] for k in row.keys()}
+        d = dict(row)
         d["is_active"] = bool(d.get("is_active", 1))
-        return cls(**d)
+        return cls.model_construct(**d)
 
 
 class MortgagePayment(CircuitModel):
@@ -63,21 +63,27 @@ class MortgagePayment(CircuitModel):
     updated_at: str = Field(default="", exclude=True)
 
     def to_row(self) -> dict[str, Any]:
-        data = self.model_dump()
+        data = super().to_row()
         data.pop("updated_at", None)
         return data
 
     @classmethod
     def from_row(cls, row: Any) -> "MortgagePayment":
-        d = {k: row[k] for k in row.keys()}
+        d = dict(row)
         d.pop("updated_at", None)
-        return cls(**d)
+        return cls.model_construct(**d)
 
 
 class MortgageRepository(BaseRepository):
     table: ClassVar[str] = "mortgages"
     model_class: ClassVar[type[CircuitModel]] = Mortgage  # type: ignore[assignment]
 
+    def total_balance(self) -> int:
+        row = self.db.fetchone(
+            "SELECT COALESCE(SUM(balance_cents), 0) as total FROM mortgages WHERE is_active = 1"
+        )
+        return row["total"] if row else 0
+
 
 class MortgagePaymentRepository(BaseRepository):
     table: ClassVar[str] = "mortgage_payments"
@@ -88,7 +94,7 @@ class MortgagePaymentRepository(BaseRepository):
             "SELECT * FROM mortgage_payments WHERE mortgage_id = ? ORDER BY paid_date DESC LIMIT ?",
             (mortgage_id, limit),
         )
-        return [MortgagePayment.from_row(r) for r in rows]
+        return MortgagePayment.from_rows(rows)
 
     def total_paid(self, mortgage_id: str) -> dict[str, int]:
         row = self.db.fetchone(
@@ -2,11 +2,42 @@
 
 from __future__ import annotations
 
+from datetime import date, timedelta
+from functools import lru_cache
 from typing import Any, ClassVar
 
 from pydantic import Field
 
-from circuitai.models.base import BaseRepository, CircuitModel
+from circuitai.models.base import BaseRepository, CircuitModel, to_monthly_cents
+
+# Hot-path queries kept as constants so sqlite3's statement cache reuses the
+# compiled statement on every call (e.g. once per candidate during detection).
+_SQL_FIND_BY_PATTERN = "SELECT * FROM subscriptions WHERE match_pattern = ? AND is_active = 1"
+_SQL_FIND_BY_STATUS = "SELECT * FROM subscriptions WHERE status = ? AND is_active = 1 ORDER BY name"
+_SQL_UPCOMING = (
+    "SELECT * FROM subscriptions WHERE is_active = 1 AND status = 'active' "
+    "AND next_charge_date IS NOT NULL AND next_charge_date <= ? "
+    "AND next_charge_date >= ? ORDER BY next_charge_date"
+)
+
+_SQL_MATCH_PATTERNS = (
+    "SELECT DISTINCT match_pattern FROM subscriptions WHERE is_active = 1 AND match_pattern != ''"
+)
+
+# (numerator, denominator) to convert an amount at a given frequency to a
+# yearly amount. Unknown frequencies pass through unchanged.
+_TO_YEARLY: dict[str, tuple[int, int]] = {
+    "weekly": (52, 1),
+    "monthly": (12, 1),
+    "quarterly": (4, 1),
+    "yearly": (1, 1),
+}
+
+
+@lru_cache(maxsize=4096)
+def _to_yearly_cents(amount_cents: int, frequency: str) -> int:
+    num, den = _TO_YEARLY.get(frequency, (1, 1))
+    return amount_cents * num // den
 
 
 class Subscription(CircuitModel):
@@ -28,6 +59,16 @@ class Subscription(CircuitModel):
     notes: str = ""
     is_active: bool = True
 
+    @property
+    def days_until(self) -> int | None:
+        if not self.next_charge_date:
+            return None
+        try:
+            charge = date.fromisoformat(self.next_charge_date[:10])
+            return (charge - date.today()).days
+        except ValueError:
+            return None
+
     @property
     def confidence_score(self) -> float:
         """Confidence as a 0.0-1.0 float."""
@@ -40,35 +81,23 @@ class Subscription(CircuitModel):
     @property
     def monthly_cost_cents(self) -> int:
         """Normalize cost to monthly."""
-        if self.frequency == "weekly":
-            return int(self.amount_cents * 52 / 12)
-        elif self.frequency == "quarterly":
-            return self.amount_cents // 3
-        elif self.frequency == "yearly":
-            return self.amount_cents // 12
-        return self.amount_cents  # monthly
+        return to_monthly_cents(self.amount_cents, self.frequency)
 
     @property
     def yearly_cost_cents(self) -> int:
         """Normalize cost to yearly."""
-        if self.frequency == "weekly":
-            return self.amount_cents * 52
-        elif self.frequency == "monthly":
-            return self.amount_cents * 12
-        elif self.frequency == "quarterly":
-            return self.amount_cents * 4
-        return self.amount_cents  # yearly
+        return _to_yearly_cents(self.amount_cents, self.frequency)
 
     def to_row(self) -> dict[str, Any]:
-        data = self.model_dump()
+        data = super().to_row()
         data["is_active"] = int(data["is_active"])
         return data
 
     @classmethod
     def from_row(cls, row: Any) -> "Subscription":
-        d = {k: row[k] for k in row.keys()}
+        d = dict(row)
         d["is_active"] = bool(d.get("is_active", 1))
-        return cls(**d)
+        return cls.model_construct(**d)
 
 
 class SubscriptionRepository(BaseRepository):
@@ -77,37 +106,21 @@ class SubscriptionRepository(BaseRepository):
 
     def find_by_match_pattern(self, pattern: str) -> Subscription | None:
         """Find a subscription by its normalized vendor pattern (idempotency)."""
-        row = self.db.fetchone(
-            "SELECT * FROM subscriptions WHERE match_pattern = ? AND is_active = 1",
-            (pattern,),
-        )
+        row = self.db.fetchone(_SQL_FIND_BY_PATTERN, (pattern,))
         return Subscription.from_row(row) if row else None
 
     def find_by_status(self, status: str) -> list[Subscription]:
         """Get subscriptions by status (active, paused, cancelled)."""
-        rows = self.db.fetchall(
-            "SELECT * FROM subscriptions WHERE status = ? AND is_active = 1 ORDER BY name",
-            (status,),
-        )
-        return [Subscription.from_row(r) for r in rows]
+        rows = self.db.fetchall(_SQL_FIND_BY_STATUS, (status,))
+        return Subscription.from_rows(rows)
 
     def get_upcoming(self, within_days: int = 7) -> list[Subscription]:
         """Get active subscriptions with next_charge_date within N days."""
-        from datetime import date, timedelta
-
         today = date.today()
         cutoff = (today + timedelta(days=within_days)).isoformat()
-        rows = self.db.fetchall(
-            "SELECT * FROM subscriptions WHERE is_active = 1 AND status = 'active' "
-            "AND next_charge_date IS NOT NULL AND next_charge_date <= ? "
-            "AND next_charge_date >= ? ORDER BY next_charge_date",
-            (cutoff, today.isoformat()),
-        )
-        return [Subscription.from_row(r) for r in rows]
+        rows = self.db.fetchall(_SQL_UPCOMING, (cutoff, today.isoformat()))
+        return Subscription.from_rows(rows)
 
     def get_all_match_patterns(self) -> set[str]:
         """Get all match_pattern values for fast exclusion during detection."""
-        rows = self.db.fetchall(
-            "SELECT match_pattern FROM subscriptions WHERE is_active = 1",
-        )
-        return {r["match_pattern"] for r in rows if r["match_pattern"]}
+        return set(self.db.fetchcolumn(_SQL_MATCH_PATTERNS))
@@ -1,5 +1,5 @@
 """Re-export tag models from category module for convenience."""
 
-from circuitai.models.category import Tag, TagRepository
+from circuitai.models.category import Tag, TagRepository, TagRow
 
-__all__ = ["Tag", "TagRepository"]
+__all__ = ["Tag", "TagRepository", "TagRow"]
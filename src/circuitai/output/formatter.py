@@ -3,15 +3,35 @@
 from __future__ import annotations
 
 import json
-from typing import Any
+import sys
+from datetime import datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Iterable
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+if TYPE_CHECKING:
+    from rich.console import Console
 
-# Human output goes to stdout; in JSON mode, human messages go to stderr
-_console = Console()
-_err_console = Console(stderr=True)
+# Try orjson for faster JSON output, fall back to stdlib json
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Human output goes to stdout; in JSON mode, human messages go to stderr.
+# Rich is imported on first use so agent (JSON) runs never load it.
+_consoles: dict[bool, Console] = {}
+
+
+def _get_console(stderr: bool = False) -> Console:
+    """Return the shared stdout (or stderr) console, creating it on first use."""
+    console = _consoles.get(stderr)
+    if console is None:
+        from rich.console import Console
+
+        console = _consoles[stderr] = Console(stderr=stderr)
+    return console
 
 
 class OutputFormatter:
@@ -25,41 +45,41 @@ class OutputFormatter:
     def json(self, data: Any, status: str = "success") -> None:
         """Print structured JSON to stdout."""
         envelope = {"status": status, "data": data}
-        print(json.dumps(envelope, indent=2, default=str))
+        _write_json(envelope)
 
     def json_error(self, message: str, code: int = 1) -> None:
         """Print a JSON error envelope to stdout."""
         envelope = {"status": "error", "error": {"message": message, "code": code}}
-        print(json.dumps(envelope, indent=2))
+        _write_json(envelope)
 
     # ── Human output ─────────────────────────────────────────────
 
     def print(self, message: str = "", **kwargs: Any) -> None:
         """Print a message, routing to stderr in JSON mode."""
-        console = _err_console if self.json_mode else _console
+        console = _get_console(stderr=self.json_mode)
         console.print(message, **kwargs)
 
     def success(self, message: str) -> None:
         """Print a success message."""
         if self.json_mode:
             return
-        _console.print(f"[green]✓[/green] {message}")
+        _get_console().print(f"[green]✓[/green] {message}")
 
     def warning(self, message: str) -> None:
         """Print a warning."""
-        console = _err_console if self.json_mode else _console
+        console = _get_console(stderr=self.json_mode)
         console.print(f"[yellow]![/yellow] {message}")
 
     def error(self, message: str) -> None:
         """Print an error message."""
-        console = _err_console if self.json_mode else _console
+        console = _get_console(stderr=self.json_mode)
         console.print(f"[red]✗[/red] {message}")
 
     def info(self, message: str) -> None:
         """Print an info message."""
         if self.json_mode:
             return
-        _console.print(f"[dim]ℹ[/dim] {message}")
+        _get_console().print(f"[dim]ℹ[/dim] {message}")
 
     def table(
         self,
@@ -78,40 +98,87 @@ class OutputFormatter:
             self.json(data_for_json or [dict(zip([c[0] for c in columns], r)) for r in rows])
             return
 
+        from rich.table import Table
+
         table = Table(title=title, show_header=True, header_style="bold cyan")
         for header, style in columns:
             table.add_column(header, style=style)
         for row in rows:
             table.add_row(*row)
-        _console.print(table)
+        _get_console().print(table)
 
     def panel(self, content: str, title: str = "", border_style: str = "blue") -> None:
         """Print a Rich panel."""
         if self.json_mode:
             return
-        _console.print(Panel(content, title=title, border_style=border_style))
+        from rich.panel import Panel
+
+        _get_console().print(Panel(content, title=title, border_style=border_style))
 
     def rule(self, title: str = "") -> None:
         """Print a horizontal rule."""
         if self.json_mode:
             return
-        _console.rule(title)
+        _get_console().rule(title)
+
+
+def _write_json(envelope: dict[str, Any]) -> None:
+    """Write a JSON envelope with 2-space indentation to stdout.
+
+    Uses orjson when installed, writing its UTF-8 bytes straight to the
+    underlying binary stream. Datetimes are passed through to ``str`` so the
+    output matches the stdlib path; anything orjson rejects (e.g. non-string
+    keys, integers beyond 64 bits) falls back to ``json.dump``, which streams
+    chunks to stdout instead of building the whole string first.
+    """
+    out = sys.stdout
+    if HAS_ORJSON:
+        try:
+            data = orjson.dumps(
+                envelope,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+        except TypeError:
+            pass
+        else:
+            buffer = getattr(out, "buffer", None)
+            if buffer is None:
+                out.write(data.decode())
+            else:
+                out.flush()
+                buffer.write(data)
+            return
+    json.dump(envelope, out, indent=2, default=str)
+    out.write("\n")
 
 
 def dollars(cents: int) -> str:
     """Format cents as a dollar string."""
-    negative = cents < 0
-    abs_cents = abs(cents)
-    s = f"${abs_cents // 100:,}.{abs_cents % 100:02d}"
-    return f"-{s}" if negative else s
+    if cents >= 0:
+        return f"${cents // 100:,d}.{cents % 100:02d}"
+    abs_cents = -cents
+    return f"-${abs_cents // 100:,d}.{abs_cents % 100:02d}"
+
 
+def dollars_many(cents_values: Iterable[int]) -> list[str]:
+    """Format a column of cents values as dollar strings.
 
+    Use when building table rows so the whole currency column is formatted
+    in one pass.
+    """
+    return list(map(dollars, cents_values))
+
+
+@lru_cache(maxsize=1024)
 def format_date(date_str: str | None) -> str:
-    """Format an ISO date string for display."""
+    """Format an ISO date string for display.
+
+    Cached: the same dates recur across rows of a table.
+    """
     if not date_str:
         return "—"
     try:
-        from datetime import datetime
         dt = datetime.fromisoformat(date_str)
         return dt.strftime("%b %d, %Y")
     except (ValueError, TypeError):
@@ -90,8 +90,7 @@ class AccountService:
 
     def get_total_balance(self) -> int:
         """Sum of all active account balances."""
-        accounts = self.list_accounts()
-        return sum(a.balance_cents for a in accounts)
+        return self.accounts.total_balance()
 
     def get_snapshot(self) -> list[dict[str, Any]]:
         """Get a quick snapshot of all accounts."""
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from datetime import date
+from itertools import groupby
+from operator import itemgetter
 from typing import Any
 
 from circuitai.core.database import DatabaseConnection
@@ -115,19 +117,20 @@ class ActivityService:
 
     def get_cost_summary(self) -> dict[str, Any]:
         """Get cost summary by child and sport."""
-        children = self.list_children()
         result: dict[str, Any] = {"children": [], "total_cents": 0}
 
-        for child in children:
-            activities = self.get_for_child(child.id)
-            child_total = sum(a.cost_cents for a in activities)
+        for child_id, group in groupby(self.activities.summary_by_child(), key=itemgetter("child_id")):
+            rows = list(group)
+            activities = [
+                {"name": r["activity_name"], "sport": r["sport_or_type"], "cost_cents": r["cost_cents"]}
+                for r in rows
+                if r["activity_id"] is not None
+            ]
+            child_total = sum(a["cost_cents"] for a in activities)
             result["children"].append({
-                "name": child.name,
-                "id": child.id,
-                "activities": [
-                    {"name": a.name, "sport": a.sport_or_type, "cost_cents": a.cost_cents}
-                    for a in activities
-                ],
+                "name": rows[0]["child_name"],
+                "id": child_id,
+                "activities": activities,
                 "total_cents": child_total,
             })
             result["total_cents"] += child_total
@@ -2,29 +2,47 @@
 
 from __future__ import annotations
 
-import calendar as cal_mod
 from datetime import date
+from functools import cached_property
 from typing import Any
 
 from circuitai.core.database import DatabaseConnection
 from circuitai.core.exceptions import ValidationError
+from circuitai.models.base import to_monthly_cents
 from circuitai.models.bill import Bill, BillPayment, BillPaymentRepository, BillRepository
+from circuitai.services.deadline_service import DeadlineService
 
+# Frequencies counted in the bill summary's monthly estimate; weekly and
+# one-time bills are left out
+_ESTIMATED_FREQUENCIES = ("monthly", "quarterly", "yearly")
 
-def _next_due_date(due_day: int) -> date:
-    """Calculate the next occurrence of a given day-of-month."""
-    today = date.today()
-    last_day = cal_mod.monthrange(today.year, today.month)[1]
-    clamped = min(due_day, last_day)
-    due = today.replace(day=clamped)
-    if due < today:
-        # Move to next month
-        if today.month == 12:
-            due = date(today.year + 1, 1, min(due_day, 31))
-        else:
-            next_last = cal_mod.monthrange(today.year, today.month + 1)[1]
-            due = date(today.year, today.month + 1, min(due_day, next_last))
-    return due
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _days_in_month(year: int, month: int) -> int:
+    """Return the number of days in a month."""
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _DAYS_IN_MONTH[month - 1]
+
+
+def _due_in_next_month(year: int, month: int, due_day: int) -> date:
+    """Return the due day in the month after (year, month), clamped to month end."""
+    if month == 12:
+        year, month = year + 1, 1
+    else:
+        month += 1
+    return date(year, month, min(due_day, _days_in_month(year, month)))
+
+
+def next_due_date(due_day: int, today: date | None = None) -> date:
+    """Calculate the next occurrence of a given day-of-month, on or after today."""
+    if today is None:
+        today = date.today()
+    day = min(due_day, _days_in_month(today.year, today.month))
+    if day < today.day:
+        return _due_in_next_month(today.year, today.month, due_day)
+    return date(today.year, today.month, day)
 
 
 class BillService:
@@ -35,6 +53,11 @@ class BillService:
         self.bills = BillRepository(db)
         self.payments = BillPaymentRepository(db)
 
+    @cached_property
+    def _deadline_svc(self) -> DeadlineService:
+        """Deadline service for bill-linked deadlines, built on first use."""
+        return DeadlineService(self.db)
+
     def add_bill(
         self,
         name: str,
@@ -70,29 +93,26 @@ class BillService:
         if provider:
             bill.add_pattern(provider.upper())
 
-        self.bills.insert(bill)
+        with self.db.transaction():
+            self.bills.insert(bill)
 
-        # Auto-create a deadline for this bill if it has a due day
-        if due_day is not None:
-            self._ensure_deadline(bill)
+            # Auto-create a deadline for this bill if it has a due day
+            if due_day is not None:
+                self._ensure_deadline(bill)
 
         return bill
 
     def _ensure_deadline(self, bill: Bill) -> None:
         """Create or refresh a deadline linked to a bill's due date."""
-        from circuitai.models.deadline import DeadlineRepository
-        from circuitai.services.deadline_service import DeadlineService
-
-        dl_svc = DeadlineService(self.db)
-        dl_repo = DeadlineRepository(self.db)
+        dl_svc = self._deadline_svc
 
         # Check for an existing active deadline linked to this bill
-        existing = dl_repo.find_by_linked_bill(bill.id, active_only=True)
+        existing = dl_svc.deadlines.find_by_linked_bill(bill.id, active_only=True)
         if existing:
             return  # Already has an active deadline — skip
 
         if bill.due_day is not None:
-            due = _next_due_date(bill.due_day)
+            due = next_due_date(bill.due_day)
             dl_svc.create_from_bill(bill.id, bill.name, due.isoformat())
 
     def get_bill(self, bill_id: str) -> Bill:
@@ -134,22 +154,43 @@ class BillService:
             confirmation=confirmation,
             notes=notes,
         )
-        self.payments.insert(payment)
+        with self.db.transaction():
+            self.payments.insert(payment)
 
-        # Auto-complete linked deadline and create one for next cycle
-        self._complete_and_renew_deadline(bill)
+            # Auto-complete linked deadline and create one for next cycle
+            self._complete_and_renew_deadline(bill)
 
         return payment
 
+    def pay_bill_many(
+        self,
+        bill_id: str,
+        payments: list[tuple[int, str, str]],
+    ) -> list[BillPayment]:
+        """Record several payments for a bill, e.g. imported statement history.
+
+        ``payments`` holds ``(amount_cents, paid_date, notes)`` tuples. All rows
+        are inserted in one transaction, and the linked deadline is completed
+        and renewed once rather than per payment.
+        """
+        if not payments:
+            return []
+        bill = self.get_bill(bill_id)
+        records = [
+            BillPayment(bill_id=bill_id, amount_cents=amount_cents, paid_date=paid_date, notes=notes)
+            for amount_cents, paid_date, notes in payments
+        ]
+        with self.db.transaction():
+            self.payments.insert_many(records)
+            self._complete_and_renew_deadline(bill)
+
+        return records
+
     def _complete_and_renew_deadline(self, bill: Bill) -> None:
         """Complete the current deadline for a paid bill and create the next one."""
-        from circuitai.models.deadline import DeadlineRepository
-        from circuitai.services.deadline_service import DeadlineService
-
-        dl_repo = DeadlineRepository(self.db)
-        dl_svc = DeadlineService(self.db)
+        dl_svc = self._deadline_svc
 
-        existing = dl_repo.find_by_linked_bill(bill.id, active_only=True)
+        existing = dl_svc.deadlines.find_by_linked_bill(bill.id, active_only=True)
         # Track the latest due date among completed deadlines
         latest_due: date | None = None
         for dl in existing:
@@ -157,18 +198,14 @@ class BillService:
                 dl_due = date.fromisoformat(dl.due_date[:10])
                 if latest_due is None or dl_due > latest_due:
                     latest_due = dl_due
-            dl_svc.complete_deadline(dl.id)
+        dl_svc.deadlines.complete_many([dl.id for dl in existing])
 
         # Create next cycle deadline (only for recurring bills)
         if bill.due_day is not None and bill.frequency != "one-time":
-            due = _next_due_date(bill.due_day)
+            due = next_due_date(bill.due_day)
             # Ensure new deadline is strictly after the one we just completed
             if latest_due is not None and due <= latest_due:
-                if latest_due.month == 12:
-                    due = date(latest_due.year + 1, 1, min(bill.due_day, 31))
-                else:
-                    next_last = cal_mod.monthrange(latest_due.year, latest_due.month + 1)[1]
-                    due = date(latest_due.year, latest_due.month + 1, min(bill.due_day, next_last))
+                due = _due_in_next_month(latest_due.year, latest_due.month, bill.due_day)
             dl_svc.create_from_bill(bill.id, bill.name, due.isoformat())
 
     def get_payments(self, bill_id: str, limit: int = 10) -> list[BillPayment]:
@@ -177,23 +214,30 @@ class BillService:
     def get_last_payment(self, bill_id: str) -> BillPayment | None:
         return self.payments.get_last_payment(bill_id)
 
+    def get_last_paid_dates(self, bill_ids: list[str]) -> dict[str, str]:
+        """Latest paid_date per bill, for bills that have any payments."""
+        return self.payments.get_last_paid_dates(bill_ids)
+
     def get_due_soon(self, within_days: int = 7) -> list[Bill]:
         return self.bills.get_due_soon(within_days=within_days)
 
     def get_summary(self) -> dict[str, Any]:
         """Get a summary of all bills."""
-        bills = self.list_bills()
-        total_monthly = sum(b.amount_cents for b in bills if b.frequency == "monthly")
-        total_yearly = sum(b.amount_cents for b in bills if b.frequency == "yearly")
-        total_quarterly = sum(b.amount_cents for b in bills if b.frequency == "quarterly")
+        totals = self.bills.frequency_totals()
+        total_monthly = totals.get("monthly", (0, 0))[1]
+        total_yearly = totals.get("yearly", (0, 0))[1]
+        total_quarterly = totals.get("quarterly", (0, 0))[1]
+        estimated_monthly = sum(
+            to_monthly_cents(totals[freq][1], freq) for freq in _ESTIMATED_FREQUENCIES if freq in totals
+        )
         due_soon = self.get_due_soon(within_days=7)
 
         return {
-            "total_bills": len(bills),
+            "total_bills": sum(cnt for cnt, _ in totals.values()),
             "monthly_total_cents": total_monthly,
             "yearly_total_cents": total_yearly,
             "quarterly_total_cents": total_quarterly,
-            "estimated_monthly_cents": total_monthly + (total_yearly // 12) + (total_quarterly // 3),
+            "estimated_monthly_cents": estimated_monthly,
             "due_soon": len(due_soon),
             "due_soon_bills": [
                 {"name": b.name, "amount_cents": b.amount_cents, "due_day": b.due_day}
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import json
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -9,7 +13,8 @@ import keyring
 
 from circuitai.core.database import DatabaseConnection
 from circuitai.core.exceptions import AdapterError
-from circuitai.services.capture_service import compute_txn_fingerprint
+from circuitai.services.bill_service import BillService
+from circuitai.services.capture_service import compute_txn_fingerprints
 
 try:
     from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page
@@ -19,7 +24,11 @@ except ImportError:
     HAS_PLAYWRIGHT = False
 
 KEYRING_SERVICE_PREFIX = "circuitai"
+IMPORT_NOTE_PREFIX = "browser-import:"
 BROWSER_DATA_DIR = Path.home() / ".circuitai" / "browser_data"
+STORAGE_STATE_PATH = BROWSER_DATA_DIR / "storage_state.json"
+# Seconds a keychain lookup is reused before the keychain is consulted again
+CREDENTIAL_CACHE_TTL = 300.0
 
 
 class BrowserService:
@@ -31,6 +40,8 @@ class BrowserService:
         self._browser: Browser | None = None
         self._context: BrowserContext | None = None
         self._page: Page | None = None
+        # site_key -> (monotonic fetch time, credentials or None)
+        self._cred_cache: dict[str, tuple[float, tuple[str, str] | None]] = {}
 
     # ── Credential management via keyring ────────────────────────────
 
@@ -44,9 +55,23 @@ class BrowserService:
         # Store username under a known key, password under the username
         keyring.set_password(service, "_username", username)
         keyring.set_password(service, username, password)
+        self._cred_cache[site_key] = (time.monotonic(), (username, password))
 
     def get_credentials(self, site_key: str) -> tuple[str, str] | None:
-        """Retrieve credentials from the system keychain. Returns (username, password) or None."""
+        """Retrieve credentials from the system keychain. Returns (username, password) or None.
+
+        Results are cached per site for ``CREDENTIAL_CACHE_TTL`` seconds, since
+        each keychain read is a synchronous round-trip that may prompt the user.
+        """
+        cached = self._cred_cache.get(site_key)
+        if cached is not None and time.monotonic() - cached[0] < CREDENTIAL_CACHE_TTL:
+            return cached[1]
+
+        creds = self._read_credentials(site_key)
+        self._cred_cache[site_key] = (time.monotonic(), creds)
+        return creds
+
+    def _read_credentials(self, site_key: str) -> tuple[str, str] | None:
         service = self._keyring_service(site_key)
         username = keyring.get_password(service, "_username")
         if not username:
@@ -56,6 +81,28 @@ class BrowserService:
             return None
         return (username, password)
 
+    def prefetch_credentials(self, site_key: str) -> Future[tuple[str, str] | None]:
+        """Start ``get_credentials`` on a worker thread and return its future.
+
+        Lets a slow (or prompting) keychain read overlap with browser startup,
+        which has to stay on the calling thread for Playwright's sync API.
+        """
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(self.get_credentials, site_key)
+        executor.shutdown(wait=False)
+        return future
+
+    def has_username(self, site_key: str) -> bool:
+        """Check that a site has a stored username, without reading its password.
+
+        A single keychain lookup (or a cache hit), cheap enough to run before
+        deciding whether to start the browser at all.
+        """
+        cached = self._cred_cache.get(site_key)
+        if cached is not None and time.monotonic() - cached[0] < CREDENTIAL_CACHE_TTL:
+            return cached[1] is not None
+        return bool(keyring.get_password(self._keyring_service(site_key), "_username"))
+
     def has_credentials(self, site_key: str) -> bool:
         """Check if credentials exist for a site."""
         return self.get_credentials(site_key) is not None
@@ -63,6 +110,7 @@ class BrowserService:
     def delete_credentials(self, site_key: str) -> None:
         """Remove credentials for a site from the keychain."""
         service = self._keyring_service(site_key)
+        self._cred_cache.pop(site_key, None)
         username = keyring.get_password(service, "_username")
         if username:
             try:
@@ -77,10 +125,13 @@ class BrowserService:
     # ── Playwright lifecycle ─────────────────────────────────────────
 
     def launch_browser(self) -> tuple[Any, Any, Any]:
-        """Launch a visible Chromium browser with persistent context.
+        """Launch a visible Chromium browser with a fresh context.
 
         Returns (browser, context, page).
-        Uses persistent context at ~/.circuitai/browser_data/ for cookie persistence.
+        Cookies and local storage are restored from ``STORAGE_STATE_PATH`` and
+        saved back on close, so logins persist without a long-lived persistent
+        profile accumulating memory. On first launch, logins from the
+        persistent profile used by earlier versions are carried over.
         """
         if not HAS_PLAYWRIGHT:
             raise AdapterError(
@@ -88,26 +139,96 @@ class BrowserService:
                 "Then run: playwright install chromium"
             )
 
-        BROWSER_DATA_DIR.mkdir(parents=True, exist_ok=True)
+        # Session cookies for bank logins live here; keep them private
+        data_dir = STORAGE_STATE_PATH.parent
+        data_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        data_dir.chmod(0o700)
+        if STORAGE_STATE_PATH.exists():
+            STORAGE_STATE_PATH.chmod(0o600)
 
         self._playwright = sync_playwright().start()
-        self._context = self._playwright.chromium.launch_persistent_context(
-            user_data_dir=str(BROWSER_DATA_DIR),
-            headless=False,
-            viewport={"width": 1280, "height": 900},
-        )
-        self._page = self._context.pages[0] if self._context.pages else self._context.new_page()
+        if not STORAGE_STATE_PATH.exists() and (data_dir / "Default").is_dir():
+            self._import_legacy_profile()
+        self._browser = self._playwright.chromium.launch(headless=False)
+        self._open_context()
+
+        return (self._browser, self._context, self._page)
+
+    def _open_context(self) -> None:
+        kwargs: dict[str, Any] = {}
+        if STORAGE_STATE_PATH.exists():
+            kwargs["storage_state"] = str(STORAGE_STATE_PATH)
+        self._context = self._browser.new_context(viewport={"width": 1280, "height": 900}, **kwargs)
+        self._page = self._context.new_page()
+
+    def _import_legacy_profile(self) -> None:
+        """Export logins from the old persistent Chromium profile into ``STORAGE_STATE_PATH``.
+
+        If the profile can't be opened, the user simply logs in again.
+        """
+        try:
+            legacy = self._playwright.chromium.launch_persistent_context(
+                user_data_dir=str(STORAGE_STATE_PATH.parent), headless=True,
+            )
+        except Exception:
+            return
+        try:
+            self._save_storage_state(legacy)
+        except Exception:
+            pass
+        finally:
+            try:
+                legacy.close()
+            except Exception:
+                pass
+
+    @staticmethod
+    def _save_storage_state(context: Any) -> None:
+        """Write a context's cookies and local storage, readable only by the user."""
+        state = context.storage_state()
+        tmp = STORAGE_STATE_PATH.with_name(STORAGE_STATE_PATH.name + ".tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            os.fchmod(fd, 0o600)
+            json.dump(state, f)
+        os.replace(tmp, STORAGE_STATE_PATH)
+
+    def _close_context(self) -> None:
+        """Save the context's storage state, then close it."""
+        if not self._context:
+            return
+        try:
+            self._save_storage_state(self._context)
+        except Exception:
+            pass
+        try:
+            self._context.close()
+        except Exception:
+            pass
+        self._context = None
+        self._page = None
 
-        return (self._context, self._context, self._page)
+    def recycle_context(self) -> Any:
+        """Replace the browser context with a fresh one, keeping login state.
+
+        Bounds memory growth when several sites are driven from one browser.
+        Returns the new page.
+        """
+        if not self._browser:
+            raise AdapterError("Browser is not running. Call launch_browser() first.")
+        self._close_context()
+        self._open_context()
+        return self._page
 
     def close_browser(self) -> None:
         """Clean up browser resources."""
-        if self._context:
+        self._close_context()
+        if self._browser:
             try:
-                self._context.close()
+                self._browser.close()
             except Exception:
                 pass
-            self._context = None
+            self._browser = None
         if self._playwright:
             try:
                 self._playwright.stop()
@@ -132,63 +253,55 @@ class BrowserService:
         Returns:
             {bill_name, amount_cents, imported, skipped}
         """
-        from circuitai.services.bill_service import BillService
-
         bill_svc = BillService(self.db)
         account_name = data.get("account_name", site_key.upper())
         category = data.get("category", "other")
         bills = data.get("bills", [])
 
-        # Find or create the bill
-        existing = bill_svc.search_bills(account_name)
-        if existing:
-            bill = existing[0]
-        else:
-            bill = bill_svc.add_bill(
-                name=account_name,
-                provider=account_name,
-                category=category,
-                amount_cents=data.get("current_balance_cents", 0),
-            )
-
-        # Update the bill amount to current balance if available
-        balance = data.get("current_balance_cents")
-        if balance is not None and balance != bill.amount_cents:
-            bill_svc.update_bill(bill.id, amount_cents=balance)
-
-        imported = 0
-        skipped = 0
-
-        for bill_entry in bills:
-            txn_date = bill_entry.get("date", "")
-            amount_cents = bill_entry.get("amount_cents", 0)
-            description = bill_entry.get("description", account_name)
-
-            if not txn_date or not amount_cents:
-                continue
-
-            fingerprint = compute_txn_fingerprint(txn_date, description, amount_cents)
-
-            # Check if this payment already exists (dedup via fingerprint in notes)
-            existing_payments = bill_svc.get_payments(bill.id, limit=100)
-            already_exists = any(
-                p.notes and fingerprint in p.notes for p in existing_payments
-            )
-            if already_exists:
-                skipped += 1
-                continue
-
-            bill_svc.pay_bill(
-                bill_id=bill.id,
-                amount_cents=amount_cents,
-                paid_date=txn_date,
-                notes=f"browser-import:{fingerprint}",
-            )
-            imported += 1
+        # One transaction for the whole import so a failure leaves no partial history
+        with self.db.transaction():
+            # Find or create the bill
+            existing = bill_svc.search_bills(account_name)
+            if existing:
+                bill = existing[0]
+            else:
+                bill = bill_svc.add_bill(
+                    name=account_name,
+                    provider=account_name,
+                    category=category,
+                    amount_cents=data.get("current_balance_cents", 0),
+                )
+
+            # Update the bill amount to current balance if available
+            balance = data.get("current_balance_cents")
+            if balance is not None and balance != bill.amount_cents:
+                bill_svc.update_bill(bill.id, amount_cents=balance)
+
+            skipped = 0
+            # Fingerprints of payments already imported for this bill, loaded once
+            seen = bill_svc.payments.get_note_fingerprints(bill.id, IMPORT_NOTE_PREFIX)
+            to_insert: list[tuple[int, str, str]] = []
+
+            entries = [
+                (e.get("date", ""), e.get("description", account_name), e.get("amount_cents", 0))
+                for e in bills
+            ]
+            entries = [e for e in entries if e[0] and e[2]]
+            fingerprints = compute_txn_fingerprints(entries)
+
+            for (txn_date, _, amount_cents), fingerprint in zip(entries, fingerprints):
+                if fingerprint in seen:
+                    skipped += 1
+                    continue
+
+                to_insert.append((amount_cents, txn_date, f"{IMPORT_NOTE_PREFIX}{fingerprint}"))
+                seen.add(fingerprint)
+
+            bill_svc.pay_bill_many(bill.id, to_insert)
 
         return {
             "bill_name": bill.name,
             "amount_cents": balance or bill.amount_cents,
-            "imported": imported,
+            "imported": len(to_insert),
             "skipped": skipped,
         }
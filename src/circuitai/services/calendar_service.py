@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
-import calendar as cal_mod
+import hashlib
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
-from typing import Any
+from typing import Any, Callable
 
-from circuitai.core.config import load_config
+from circuitai.core.config import load_config_cached
 from circuitai.core.database import DatabaseConnection
 from circuitai.core.exceptions import CalendarSyncError
-from circuitai.models.base import now_iso
+from circuitai.models.base import new_id, now_iso
+from circuitai.models.deadline import DeadlineRepository
+from circuitai.services.activity_service import ActivityService
+from circuitai.services.bill_service import BillService, next_due_date
+from circuitai.services.deadline_service import DeadlineService
 
 # CalDAV is optional
 try:
@@ -20,6 +27,41 @@ try:
 except ImportError:
     HAS_CALDAV = False
 
+# Concurrent CalDAV PUTs per push batch
+PUSH_WORKERS = 8
+
+# adapter_state key holding the last WebDAV-Sync token for pulls
+SYNC_TOKEN_KEY = "sync_token"
+
+
+# RFC 5545 TEXT escaping for SUMMARY/DESCRIPTION values
+_ESCAPE = str.maketrans({"\\": "\\\\", ";": "\\;", ",": "\\,", "\n": "\\n"})
+
+_VEVENT_HEAD = (
+    "BEGIN:VCALENDAR\r\n"
+    "VERSION:2.0\r\n"
+    "PRODID:-//CircuitAI//EN\r\n"
+    "BEGIN:VEVENT\r\n"
+    "UID:{uid}\r\n"
+    "DTSTAMP:{now}\r\n"
+    "DTSTART;VALUE=DATE:{dtstart}\r\n"
+    "SUMMARY:{summary}"
+)
+_VEVENT_DESCRIPTION = "\r\nDESCRIPTION:{description}"
+_VEVENT_ALARM = (
+    "\r\nBEGIN:VALARM\r\n"
+    "TRIGGER:-PT{minutes}M\r\n"
+    "ACTION:DISPLAY\r\n"
+    "DESCRIPTION:Reminder: {summary}\r\n"
+    "END:VALARM"
+)
+_VEVENT_TAIL = "\r\nEND:VEVENT\r\nEND:VCALENDAR"
+
+
+def _utc_stamp() -> str:
+    """Current UTC time in iCalendar DATE-TIME form."""
+    return time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+
 
 def _build_vevent(
     uid: str,
@@ -28,41 +70,28 @@ def _build_vevent(
     description: str = "",
     all_day: bool = True,
     alarm_minutes: int = 1440,
+    dtstamp: str | None = None,
 ) -> str:
-    """Build a VCALENDAR string for an event."""
-    now = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
-    dtstart_str = dtstart.strftime("%Y%m%d")
-
-    lines = [
-        "BEGIN:VCALENDAR",
-        "VERSION:2.0",
-        "PRODID:-//CircuitAI//EN",
-        "BEGIN:VEVENT",
-        f"UID:{uid}",
-        f"DTSTAMP:{now}",
-        f"DTSTART;VALUE=DATE:{dtstart_str}",
-        f"SUMMARY:{summary}",
-    ]
+    """Build a VCALENDAR string for an event.
 
-    if description:
-        # Escape newlines in description
-        desc = description.replace("\n", "\\n")
-        lines.append(f"DESCRIPTION:{desc}")
+    ``dtstamp`` lets a batch share one UTC timestamp; it defaults to now.
+    """
+    now = dtstamp or _utc_stamp()
+    summary = summary.translate(_ESCAPE)
 
+    parts = [_VEVENT_HEAD.format(uid=uid, now=now, dtstart=dtstart.strftime("%Y%m%d"), summary=summary)]
+    if description:
+        parts.append(_VEVENT_DESCRIPTION.format(description=description.translate(_ESCAPE)))
     if alarm_minutes > 0:
-        lines.extend([
-            "BEGIN:VALARM",
-            "TRIGGER:-PT" + str(alarm_minutes) + "M",
-            "ACTION:DISPLAY",
-            f"DESCRIPTION:Reminder: {summary}",
-            "END:VALARM",
-        ])
+        parts.append(_VEVENT_ALARM.format(minutes=alarm_minutes, summary=summary))
+    parts.append(_VEVENT_TAIL)
+    return "".join(parts)
+
 
-    lines.extend([
-        "END:VEVENT",
-        "END:VCALENDAR",
-    ])
-    return "\r\n".join(lines)
+def _event_hash(summary: str, event_date: date, description: str) -> str:
+    """Short digest of the fields that make up a pushed event."""
+    content = f"{summary}|{event_date.isoformat()}|{description}".encode()
+    return hashlib.blake2b(content, digest_size=8).hexdigest()
 
 
 class CalendarService:
@@ -70,9 +99,17 @@ class CalendarService:
 
     def __init__(self, db: DatabaseConnection) -> None:
         self.db = db
-        self.config = load_config().get("calendar", {})
+        self.config = load_config_cached().get("calendar", {})
         self._client = None
         self._calendar = None
+        self._credentials: dict[str, str] = {}
+        # Set when a request fails; the next connect() starts a new session
+        self._stale = False
+        # Calendars free for a push worker, each on its own client (session);
+        # extra clients are made on demand and kept until the next reconnect
+        self._idle_calendars: list[Any] = []
+        self._worker_clients: list[Any] = []
+        self._worker_lock = threading.Lock()
 
     @property
     def is_configured(self) -> bool:
@@ -108,7 +145,15 @@ class CalendarService:
         }
 
     def connect(self) -> Any:
-        """Connect to the CalDAV server and find/create the target calendar."""
+        """Connect to the CalDAV server and find/create the target calendar.
+
+        The client, its HTTP session, and the resolved calendar are kept on the
+        instance and reused by later sync cycles until a cycle fails.
+        """
+        if self._client is not None and self._calendar is not None and not self._stale:
+            return self._client
+        self._stale = False
+        self._close_worker_clients()
         if not HAS_CALDAV:
             raise CalendarSyncError(
                 "caldav package not installed. Install with: pip install circuitai[calendar]"
@@ -124,13 +169,13 @@ class CalendarService:
             raise CalendarSyncError("Calendar credentials not found. Run 'circuit calendar setup'.")
 
         cred_data = json.loads(creds["value"])
+        self._credentials = {
+            "username": cred_data.get("username", ""),
+            "password": cred_data.get("password", ""),
+        }
 
         try:
-            self._client = caldav.DAVClient(
-                url=self.config["server_url"],
-                username=cred_data.get("username", ""),
-                password=cred_data.get("password", ""),
-            )
+            self._client = self._new_client()
             principal = self._client.principal()
             cal_name = self.config.get("calendar_name", "CircuitAI")
 
@@ -138,16 +183,49 @@ class CalendarService:
             for cal in principal.calendars():
                 if cal.name == cal_name:
                     self._calendar = cal
-                    return self._client
-
-            # Calendar not found — try to create it
-            self._calendar = principal.make_calendar(name=cal_name)
+                    break
+            else:
+                # Calendar not found — try to create it
+                self._calendar = principal.make_calendar(name=cal_name)
+            self._idle_calendars.append(self._calendar)
             return self._client
         except Exception as e:
             raise CalendarSyncError(f"Failed to connect to CalDAV server: {e}") from e
 
-    def sync(self) -> dict[str, Any]:
-        """Run a full sync cycle: push local changes then pull remote changes."""
+    def _new_client(self) -> Any:
+        """Build a DAVClient for the configured server from the stored credentials."""
+        return caldav.DAVClient(url=self.config["server_url"], **self._credentials)
+
+    def _checkout_calendar(self) -> Any:
+        """Take an idle calendar for a push worker, opening another client if none is free."""
+        with self._worker_lock:
+            if self._idle_calendars:
+                return self._idle_calendars.pop()
+        client = self._new_client()
+        with self._worker_lock:
+            self._worker_clients.append(client)
+        return client.calendar(url=self._calendar.url)
+
+    def _checkin_calendar(self, calendar: Any) -> None:
+        with self._worker_lock:
+            self._idle_calendars.append(calendar)
+
+    def _close_worker_clients(self) -> None:
+        """Close the extra push clients; the next connect() starts over."""
+        for client in self._worker_clients:
+            try:
+                client.close()
+            except Exception:
+                pass
+        self._worker_clients = []
+        self._idle_calendars = []
+
+    def sync(self, force: bool = False) -> dict[str, Any]:
+        """Run a full sync cycle: push local changes then pull remote changes.
+
+        Entity types with no local changes since their last push are skipped
+        unless ``force`` is set.
+        """
         if not self.is_configured:
             return {"status": "skipped", "reason": "not configured"}
 
@@ -157,15 +235,15 @@ class CalendarService:
             self.connect()
 
             if self.config.get("sync_bills", True):
-                r = self._push_bills()
+                r = self._push_if_dirty("bills", "bill", self._push_bills, force)
                 results["pushed"] += r.get("pushed", 0)
 
             if self.config.get("sync_deadlines", True):
-                r = self._push_deadlines()
+                r = self._push_if_dirty("deadlines", "deadline", self._push_deadlines, force)
                 results["pushed"] += r.get("pushed", 0)
 
             if self.config.get("sync_activities", True):
-                r = self._push_activities()
+                r = self._push_if_dirty("activities", "activity", self._push_activities, force)
                 results["pushed"] += r.get("pushed", 0)
 
             # Pull changes from calendar
@@ -174,100 +252,193 @@ class CalendarService:
 
         except CalendarSyncError as e:
             results["errors"].append(str(e))
+            self._stale = True
         except Exception as e:
             results["errors"].append(f"Sync failed: {e}")
+            self._stale = True
 
         results["status"] = "error" if results["errors"] else "success"
         return results
 
-    def _get_or_create_uid(self, entity_type: str, entity_id: str) -> str:
-        """Get or create a stable calendar UID for an entity."""
-        row = self.db.fetchone(
-            "SELECT calendar_uid FROM calendar_sync_log "
-            "WHERE entity_type = ? AND entity_id = ?",
-            (entity_type, entity_id),
+    def _push_if_dirty(
+        self,
+        table: str,
+        entity_type: str,
+        push: Callable[[], dict[str, int]],
+        force: bool = False,
+    ) -> dict[str, int]:
+        """Run ``push`` unless nothing in ``table`` changed since its last clean push.
+
+        Event dates are computed relative to today, so a new day always pushes.
+        """
+        key = f"pushed_at_{entity_type}"
+        started = {"day": date.today().isoformat(), "at": now_iso()}
+        if not force:
+            last = self._get_state(key)
+            if last:
+                last_push = json.loads(last)
+                if last_push["day"] == started["day"] and not self.db.fetchone(
+                    f"SELECT 1 FROM {table} WHERE julianday(updated_at) > julianday(?) LIMIT 1",
+                    (last_push["at"],),
+                ):
+                    return {"pushed": 0}
+
+        result = push()
+        if not self._stale:
+            self._set_state(key, json.dumps(started))
+        return result
+
+    def _load_uids(self, entity_type: str) -> dict[str, tuple[str, str]]:
+        """Map entity_id -> (calendar UID, content hash) for every synced entity of a type."""
+        rows = self.db.fetchall(
+            "SELECT entity_id, calendar_uid, content_hash FROM calendar_sync_log WHERE entity_type = ?",
+            (entity_type,),
         )
-        if row:
-            return row["calendar_uid"]
+        return {r["entity_id"]: (r["calendar_uid"], r["content_hash"]) for r in rows}
 
-        uid = f"circuitai-{entity_type}-{entity_id}@circuit.local"
-        return uid
+    @staticmethod
+    def _new_uid(entity_type: str, entity_id: str) -> str:
+        """Build a stable calendar UID for an entity that has not been synced yet."""
+        return f"circuitai-{entity_type}-{entity_id}@circuit.local"
 
-    def _record_sync(
-        self, entity_type: str, entity_id: str, calendar_uid: str
+    def _record_syncs(
+        self,
+        entity_type: str,
+        synced: list[tuple[str, str, str]],
+        known: dict[str, tuple[str, str]],
     ) -> None:
-        """Record a sync event in the log."""
-        self.db.execute(
-            """INSERT OR REPLACE INTO calendar_sync_log
-               (entity_type, entity_id, calendar_uid, last_synced_at, sync_direction)
-               VALUES (?, ?, ?, ?, 'push')""",
-            (entity_type, entity_id, calendar_uid, now_iso()),
-        )
-        self.db.commit()
+        """Record a batch of pushed ``(entity_id, calendar_uid, content_hash)`` in one transaction.
+
+        Entities already in ``known`` (from ``_load_uids``) have their log row
+        refreshed; the rest get a new row.
+        """
+        if not synced:
+            return
+        synced_at = now_iso()
+        with self.db.transaction():
+            self.db.executemany(
+                """UPDATE calendar_sync_log
+                   SET last_synced_at = ?, content_hash = ?, sync_direction = 'push'
+                   WHERE entity_type = ? AND entity_id = ?""",
+                [
+                    (synced_at, content_hash, entity_type, entity_id)
+                    for entity_id, _, content_hash in synced
+                    if entity_id in known
+                ],
+            )
+            self.db.executemany(
+                """INSERT INTO calendar_sync_log
+                   (id, entity_type, entity_id, calendar_uid, last_synced_at, content_hash, sync_direction)
+                   VALUES (?, ?, ?, ?, ?, ?, 'push')""",
+                [
+                    (new_id(), entity_type, entity_id, uid, synced_at, content_hash)
+                    for entity_id, uid, content_hash in synced
+                    if entity_id not in known
+                ],
+            )
 
     def _push_event(
         self,
-        entity_type: str,
-        entity_id: str,
+        uid: str,
         summary: str,
         event_date: date,
         description: str = "",
+        dtstamp: str | None = None,
+        calendar: Any = None,
     ) -> bool:
-        """Push a single event to the calendar."""
-        if not self._calendar:
+        """Push a single event to ``calendar`` (default: the connected calendar)."""
+        calendar = calendar or self._calendar
+        if not calendar:
             return False
 
-        uid = self._get_or_create_uid(entity_type, entity_id)
         vcal = _build_vevent(
             uid=uid,
             summary=summary,
             dtstart=event_date,
             description=description,
+            dtstamp=dtstamp,
         )
 
         try:
-            self._calendar.save_event(vcal)
-            self._record_sync(entity_type, entity_id, uid)
+            calendar.save_event(vcal)
             return True
         except Exception:
             return False
 
+    def _push_events(
+        self, entity_type: str, events: list[tuple[str, str, date, str]]
+    ) -> dict[str, int]:
+        """Push ``(entity_id, summary, date, description)`` events and log the successes.
+
+        Events whose content hash matches the last push are skipped. Each push
+        is an HTTP PUT, so they run on a small thread pool to overlap
+        round-trips; the sync log is written afterwards on this thread.
+        DAVClient and its requests session aren't safe to share across
+        threads, so each push checks out a calendar on a client no other
+        worker is using; those clients are kept for later batches.
+        """
+        if not self._calendar or not events:
+            return {"pushed": 0}
+
+        known = self._load_uids(entity_type)
+        batch: list[tuple[str, str, str, str, date, str]] = []
+        for entity_id, summary, when, desc in events:
+            content_hash = _event_hash(summary, when, desc)
+            uid, pushed_hash = known.get(entity_id, ("", ""))
+            if pushed_hash == content_hash:
+                continue  # Calendar already has this exact event
+            uid = uid or self._new_uid(entity_type, entity_id)
+            batch.append((entity_id, uid, content_hash, summary, when, desc))
+
+        if not batch:
+            return {"pushed": 0}
+
+        dtstamp = _utc_stamp()
+
+        def push(e: tuple[str, str, str, str, date, str]) -> bool:
+            calendar = self._checkout_calendar()
+            try:
+                return self._push_event(e[1], *e[3:], dtstamp=dtstamp, calendar=calendar)
+            finally:
+                self._checkin_calendar(calendar)
+
+        with ThreadPoolExecutor(max_workers=PUSH_WORKERS) as pool:
+            results = list(pool.map(push, batch))
+        if not all(results):
+            self._stale = True
+
+        synced = [
+            (entity_id, uid, content_hash)
+            for (entity_id, uid, content_hash, *_), ok in zip(batch, results)
+            if ok
+        ]
+        self._record_syncs(entity_type, synced, known)
+        return {"pushed": len(synced)}
+
     def _push_bills(self) -> dict[str, int]:
         """Push bill due dates to calendar as all-day events."""
-        from circuitai.services.bill_service import BillService
-
         svc = BillService(self.db)
         bills = svc.list_bills()
-        pushed = 0
-
+        events: list[tuple[str, str, date, str]] = []
         today = date.today()
+
         for bill in bills:
             if not bill.due_day:
                 continue
 
-            # Calculate next due date
-            last_day = cal_mod.monthrange(today.year, today.month)[1]
-            due = today.replace(day=min(bill.due_day, last_day))
-            if due < today:
-                if today.month == 12:
-                    due = date(today.year + 1, 1, min(bill.due_day, 31))
-                else:
-                    nl = cal_mod.monthrange(today.year, today.month + 1)[1]
-                    due = date(today.year, today.month + 1, min(bill.due_day, nl))
+            # Same next due date the bills CLI and the briefing show
+            due = next_due_date(bill.due_day, today)
 
             desc = f"Amount: ${bill.amount_cents / 100:.2f}\nProvider: {bill.provider}"
-            if self._push_event("bill", bill.id, f"Bill Due: {bill.name}", due, desc):
-                pushed += 1
+            events.append((bill.id, f"Bill Due: {bill.name}", due, desc))
 
-        return {"pushed": pushed}
+        return self._push_events("bill", events)
 
     def _push_deadlines(self) -> dict[str, int]:
         """Push deadlines to calendar."""
-        from circuitai.services.deadline_service import DeadlineService
-
         svc = DeadlineService(self.db)
         deadlines = svc.list_deadlines()
-        pushed = 0
+        events: list[tuple[str, str, date, str]] = []
 
         for dl in deadlines:
             if not dl.due_date:
@@ -279,20 +450,15 @@ class CalendarService:
 
             prio = f" [{dl.priority.upper()}]" if dl.priority != "medium" else ""
             desc = dl.description or ""
-            if self._push_event(
-                "deadline", dl.id, f"Deadline{prio}: {dl.title}", due, desc
-            ):
-                pushed += 1
+            events.append((dl.id, f"Deadline{prio}: {dl.title}", due, desc))
 
-        return {"pushed": pushed}
+        return self._push_events("deadline", events)
 
     def _push_activities(self) -> dict[str, int]:
         """Push activity schedules to calendar."""
-        from circuitai.services.activity_service import ActivityService
-
         svc = ActivityService(self.db)
         activities = svc.list_activities()
-        pushed = 0
+        events: list[tuple[str, str, date, str]] = []
 
         for act in activities:
             if not act.schedule:
@@ -304,12 +470,52 @@ class CalendarService:
             if act.location:
                 desc += f"\nLocation: {act.location}"
 
-            if self._push_event(
-                "activity", act.id, f"Activity: {act.name}", today, desc
-            ):
-                pushed += 1
+            events.append((act.id, f"Activity: {act.name}", today, desc))
+
+        return self._push_events("activity", events)
+
+    def _get_state(self, key: str) -> str | None:
+        row = self.db.fetchone(
+            "SELECT value FROM adapter_state WHERE adapter_name = 'calendar' AND key = ?",
+            (key,),
+        )
+        return row["value"] if row else None
+
+    def _set_state(self, key: str, value: str) -> None:
+        self.db.execute(
+            """INSERT INTO adapter_state (id, adapter_name, key, value, updated_at)
+               VALUES (?, 'calendar', ?, ?, ?)
+               ON CONFLICT(adapter_name, key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at""",
+            (new_id(), key, value, now_iso()),
+        )
+        self.db.commit()
 
-        return {"pushed": pushed}
+    def _fetch_remote_changes(self) -> tuple[list[Any], str | None]:
+        """Fetch events changed on the server since the last pull.
+
+        Returns the events and the sync token to store once they have been
+        applied. Uses WebDAV-Sync (RFC 6578) with the token stored in
+        adapter_state. Without a token, or when the server rejects it (e.g.
+        410 Gone after pruning its history), falls back to scanning the next
+        30 days; the new token is taken before the scan so that edits made
+        during it are fetched again next time.
+        """
+        token = self._get_state(SYNC_TOKEN_KEY)
+        if token:
+            try:
+                changed = self._calendar.objects_by_sync_token(sync_token=token, load_objects=True)
+                return list(changed), str(changed.sync_token)
+            except Exception:
+                pass
+
+        try:
+            fresh: str | None = str(self._calendar.objects_by_sync_token(load_objects=False).sync_token)
+        except Exception:
+            # Server without sync-collection support; keep full scans
+            fresh = None
+        start = date.today()
+        end = start + timedelta(days=30)
+        return self._calendar.date_search(start=start, end=end, expand=True), fresh
 
     def _pull_changes(self) -> dict[str, int]:
         """Pull changes from calendar (detect rescheduled events)."""
@@ -318,54 +524,50 @@ class CalendarService:
 
         pulled = 0
         try:
-            # Fetch events for the next 30 days
-            start = date.today()
-            end = start + timedelta(days=30)
-            events = self._calendar.date_search(
-                start=start, end=end, expand=True
+            events, token = self._fetch_remote_changes()
+
+            # Our own events, keyed by calendar UID, loaded once
+            rows = self.db.fetchall(
+                "SELECT calendar_uid, entity_type, entity_id FROM calendar_sync_log"
             )
+            synced = {r["calendar_uid"]: (r["entity_type"], r["entity_id"]) for r in rows}
 
+            # deadline id -> date seen on the calendar
+            remote_dates: dict[str, str] = {}
             for event in events:
                 try:
                     vevent = event.vobject_instance.vevent
                     uid = str(vevent.uid.value)
 
                     # Check if this is one of our events
-                    row = self.db.fetchone(
-                        "SELECT entity_type, entity_id FROM calendar_sync_log "
-                        "WHERE calendar_uid = ?",
-                        (uid,),
-                    )
-                    if not row:
+                    entity = synced.get(uid)
+                    if entity is None or entity[0] != "deadline":
                         continue
 
-                    # Check if the date changed
                     new_date = vevent.dtstart.value
                     if isinstance(new_date, datetime):
                         new_date = new_date.date()
-                    new_date_str = new_date.isoformat()
-
-                    entity_type = row["entity_type"]
-                    entity_id = row["entity_id"]
-
-                    if entity_type == "deadline":
-                        # Update deadline due_date if changed
-                        dl = self.db.fetchone(
-                            "SELECT due_date FROM deadlines WHERE id = ?",
-                            (entity_id,),
-                        )
-                        if dl and dl["due_date"][:10] != new_date_str:
-                            self.db.execute(
-                                "UPDATE deadlines SET due_date = ? WHERE id = ?",
-                                (new_date_str, entity_id),
-                            )
-                            self.db.commit()
-                            pulled += 1
+                    remote_dates[entity[1]] = new_date.isoformat()
 
                 except Exception:
                     continue
 
+            # Apply only the dates that actually changed, in one batch
+            deadlines = DeadlineRepository(self.db)
+            current = deadlines.get_due_dates(list(remote_dates))
+            changes = [
+                (dl_id, new_date_str)
+                for dl_id, new_date_str in remote_dates.items()
+                if dl_id in current and current[dl_id][:10] != new_date_str
+            ]
+            # The token only moves once the changes it covers are stored
+            with self.db.transaction():
+                deadlines.reschedule_many(changes)
+                if token:
+                    self._set_state(SYNC_TOKEN_KEY, token)
+            pulled = len(changes)
+
         except Exception:
-            pass
+            self._stale = True
 
         return {"pulled": pulled}
@@ -2,19 +2,21 @@
 
 from __future__ import annotations
 
-import base64
 import hashlib
 import json
-import re
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 from circuitai.core.database import DatabaseConnection
-from circuitai.core.exceptions import AdapterError
-from circuitai.models.base import new_id, now_iso
+from circuitai.core.exceptions import AdapterError, DatabaseError
+from circuitai.models.account import AccountRepository
+from circuitai.models.base import IN_CHUNK_SIZE, new_id, now_iso
+from circuitai.models.card import CardRepository
+from circuitai.services.statement_linker import StatementLinker
 
 try:
     import anthropic
@@ -23,6 +25,35 @@ try:
 except ImportError:
     HAS_ANTHROPIC = False
 
+# Try pybase64 for faster screenshot encoding, fall back to stdlib base64
+try:
+    import pybase64 as _b64
+except ImportError:
+    import base64 as _b64
+
+# Try orjson for faster parsing of vision responses, fall back to stdlib json.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch one type.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+
+# Description normalization keeps only ASCII A-Z and 0-9 after upper-casing.
+# Dropping non-ASCII on encode and the rest with bytes.translate gives the same
+# result as re.sub(r"[^A-Z0-9]", "", ...) at roughly half the cost.
+_KEEP_BYTES = b"ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+_DROP_BYTES = bytes(b for b in range(128) if b not in _KEEP_BYTES)
+
+# Concurrent vision requests when extracting several screenshots at once
+EXTRACT_WORKERS = 4
+
+
+def _fingerprint_input(txn_date: str, description: str, amount_cents: int) -> bytes:
+    """The bytes hashed for a fingerprint: date|description|amount, description uppercase alphanumeric only."""
+    normalized = description.upper().encode("ascii", "ignore").translate(None, _DROP_BYTES).decode()
+    return f"{txn_date}|{normalized}|{amount_cents}".encode()
+
 
 def compute_txn_fingerprint(txn_date: str, description: str, amount_cents: int) -> str:
     """Compute a deterministic fingerprint for dedup across import sources.
@@ -30,9 +61,37 @@ def compute_txn_fingerprint(txn_date: str, description: str, amount_cents: int)
     Normalizes description to uppercase alphanumeric only, then hashes
     date|description|amount. Returns first 16 hex chars of SHA-256.
     """
-    normalized = re.sub(r"[^A-Z0-9]", "", description.upper())
-    raw = f"{txn_date}|{normalized}|{amount_cents}"
-    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+    # Hex-encode only the 8 bytes kept, not the full 32-byte digest
+    return hashlib.sha256(_fingerprint_input(txn_date, description, amount_cents)).digest()[:8].hex()
+
+
+def compute_txn_fingerprints(entries: Iterable[tuple[str, str, int]]) -> list[str]:
+    """Fingerprint many ``(txn_date, description, amount_cents)`` entries in one pass.
+
+    Produces the same values as ``compute_txn_fingerprint``, which are stored
+    and matched across import sources, so the hash itself is unchanged.
+    """
+    sha256 = hashlib.sha256
+    return [sha256(_fingerprint_input(*entry)).digest()[:8].hex() for entry in entries]
+
+
+def existing_fingerprints(db: DatabaseConnection, fingerprints: list[str]) -> set[str]:
+    """Return the fingerprints already stored in either transaction table.
+
+    Queries the ``txn_fingerprints`` view, which spans both tables; SQLite
+    pushes the ``IN`` filter into each branch, so each table's fingerprint
+    index is still probed.
+    """
+    found: set[str] = set()
+    unique = list(dict.fromkeys(fingerprints))
+    for i in range(0, len(unique), IN_CHUNK_SIZE):
+        chunk = unique[i:i + IN_CHUNK_SIZE]
+        placeholders = ", ".join("?" for _ in chunk)
+        found.update(db.fetchcolumn(
+            f"SELECT txn_fingerprint FROM txn_fingerprints WHERE txn_fingerprint IN ({placeholders})",
+            tuple(chunk),
+        ))
+    return found
 
 
 _EXTRACTION_PROMPT = """\
@@ -61,6 +120,9 @@ Rules:
 - If no transactions visible, return empty transactions array
 """
 
+# Constant prompt part of every vision request; only the image block varies
+_PROMPT_PART = {"type": "text", "text": _EXTRACTION_PROMPT}
+
 
 class CaptureService:
     """Screenshot bank pages, extract transactions via Claude vision, import with dedup."""
@@ -69,15 +131,21 @@ class CaptureService:
 
     def __init__(self, db: DatabaseConnection) -> None:
         self.db = db
+        # adapter_state values read or written by this instance, misses included
+        self._state_cache: dict[str, str | None] = {}
 
     # ── Adapter state helpers ────────────────────────────────────────
 
     def _get_state(self, key: str) -> str | None:
+        if key in self._state_cache:
+            return self._state_cache[key]
         row = self.db.fetchone(
             "SELECT value FROM adapter_state WHERE adapter_name = ? AND key = ?",
             (self.ADAPTER_NAME, key),
         )
-        return row["value"] if row else None
+        value = row["value"] if row else None
+        self._state_cache[key] = value
+        return value
 
     def _set_state(self, key: str, value: str) -> None:
         self.db.execute(
@@ -87,6 +155,7 @@ class CaptureService:
             (new_id(), self.ADAPTER_NAME, key, value, now_iso()),
         )
         self.db.commit()
+        self._state_cache[key] = value
 
     # ── Credentials ──────────────────────────────────────────────────
 
@@ -112,7 +181,9 @@ class CaptureService:
         if sys.platform != "darwin":
             raise AdapterError("Screen capture is only supported on macOS.")
 
-        tmp = Path(tempfile.mktemp(suffix=".png"))
+        # Create the file securely; screencapture overwrites it, and leaves it empty on cancel
+        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
+            tmp = Path(f.name)
         result = subprocess.run(
             ["screencapture", "-iW", str(tmp)],
             capture_output=True,
@@ -126,13 +197,17 @@ class CaptureService:
 
     def extract_from_screenshot(self, image_path: Path) -> dict[str, Any]:
         """Send screenshot to Claude Haiku 4.5 vision API and parse the result."""
+        return self._extract(self._vision_client(), image_path)
+
+    def _vision_client(self) -> Any:
         if not HAS_ANTHROPIC:
             raise AdapterError("anthropic package not installed. Install with: pip install circuitai[capture]")
+        return anthropic.Anthropic(api_key=self._get_api_key())
 
-        api_key = self._get_api_key()
-        image_data = base64.b64encode(image_path.read_bytes()).decode("utf-8")
+    @staticmethod
+    def _extract(client: Any, image_path: Path) -> dict[str, Any]:
+        image_data = _b64.b64encode(image_path.read_bytes()).decode("ascii")
 
-        client = anthropic.Anthropic(api_key=api_key)
         message = client.messages.create(
             model="claude-haiku-4-5-20251001",
             max_tokens=4096,
@@ -148,10 +223,7 @@ class CaptureService:
                                 "data": image_data,
                             },
                         },
-                        {
-                            "type": "text",
-                            "text": _EXTRACTION_PROMPT,
-                        },
+                        _PROMPT_PART,
                     ],
                 }
             ],
@@ -160,11 +232,12 @@ class CaptureService:
         raw = message.content[0].text.strip()
         # Handle potential ```json wrapping
         if raw.startswith("```"):
-            raw = re.sub(r"^```(?:json)?\s*", "", raw)
-            raw = re.sub(r"\s*```$", "", raw)
+            raw = raw[3:].removeprefix("json").lstrip()
+            if raw.endswith("```"):
+                raw = raw[:-3].rstrip()
 
         try:
-            return json.loads(raw)
+            return _json_loads(raw)
         except json.JSONDecodeError as e:
             raise AdapterError(f"Vision API returned invalid JSON: {e}\nRaw: {raw[:200]}") from e
 
@@ -180,7 +253,6 @@ class CaptureService:
 
         Returns: {imported, skipped, errors, balance_updated}
         """
-        imported = 0
         skipped = 0
         errors: list[str] = []
         balance_updated = False
@@ -188,7 +260,10 @@ class CaptureService:
         transactions = data.get("transactions", [])
         table = "account_transactions" if entity_type == "account" else "card_transactions"
         fk_col = "account_id" if entity_type == "account" else "card_id"
+        parent = "accounts" if entity_type == "account" else "cards"
 
+        # Validate every row up front so errors stay per-transaction
+        valid: list[tuple[int, str, str, int, str]] = []
         for i, txn in enumerate(transactions):
             try:
                 txn_date = txn.get("date", "")
@@ -200,43 +275,57 @@ class CaptureService:
                     errors.append(f"Transaction {i}: missing date or description")
                     continue
 
-                fingerprint = compute_txn_fingerprint(txn_date, description, amount_cents)
-
-                # Check for existing fingerprint in BOTH tables for cross-source dedup
-                existing_acct = self.db.fetchone(
-                    "SELECT id FROM account_transactions WHERE txn_fingerprint = ?",
-                    (fingerprint,),
-                )
-                existing_card = self.db.fetchone(
-                    "SELECT id FROM card_transactions WHERE txn_fingerprint = ?",
-                    (fingerprint,),
-                )
-                if existing_acct or existing_card:
-                    skipped += 1
-                    continue
-
-                self.db.execute(
-                    f"""INSERT INTO {table}
-                       (id, {fk_col}, description, amount_cents, transaction_date, category, txn_fingerprint, created_at)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (new_id(), account_id, description, amount_cents, txn_date, category, fingerprint, now_iso()),
-                )
-                imported += 1
+                valid.append((i, txn_date, description, amount_cents, category))
             except Exception as e:
                 errors.append(f"Transaction {i}: {e}")
 
-        if imported:
-            self.db.commit()
+        # Every row would fail the foreign key; say so once instead
+        if valid and not self.db.fetchone(f"SELECT 1 FROM {parent} WHERE id = ?", (account_id,)):
+            errors.append(f"{entity_type.capitalize()} not found: {account_id}")
+            valid = []
+
+        fingerprints = compute_txn_fingerprints((d, desc, amt) for _, d, desc, amt, _ in valid)
+        # Check BOTH tables for cross-source dedup, in one pass
+        seen = existing_fingerprints(self.db, fingerprints)
+
+        indexes: list[int] = []
+        rows: list[tuple[Any, ...]] = []
+        created_at = now_iso()
+        for (i, txn_date, description, amount_cents, category), fingerprint in zip(valid, fingerprints):
+            if fingerprint in seen:
+                skipped += 1
+                continue
+            seen.add(fingerprint)
+            indexes.append(i)
+            rows.append((new_id(), account_id, description, amount_cents, txn_date, category, fingerprint, created_at))
+
+        sql = f"""INSERT INTO {table}
+                  (id, {fk_col}, description, amount_cents, transaction_date, category, txn_fingerprint, created_at)
+                  VALUES (?, ?, ?, ?, ?, ?, ?, ?)"""
+        imported = 0
+        if rows:
+            try:
+                with self.db.transaction():
+                    self.db.executemany(sql, rows)
+                imported = len(rows)
+            except DatabaseError:
+                # The batch rolled back; insert row by row so one bad row
+                # (e.g. a fingerprint stored meanwhile) doesn't sink the rest
+                for i, row in zip(indexes, rows):
+                    try:
+                        self.db.execute(sql, row)
+                        self.db.commit()
+                        imported += 1
+                    except DatabaseError as e:
+                        errors.append(f"Transaction {i}: {e}")
 
         # Update balance if provided
         balance_cents = data.get("balance_cents")
         if balance_cents is not None:
             try:
                 if entity_type == "account":
-                    from circuitai.models.account import AccountRepository
                     AccountRepository(self.db).update_balance(account_id, balance_cents)
                 else:
-                    from circuitai.models.card import CardRepository
                     CardRepository(self.db).update_balance(account_id, balance_cents)
                 balance_updated = True
             except Exception as e:
@@ -253,7 +342,6 @@ class CaptureService:
 
     def run_statement_linking(self, account_id: str) -> dict[str, Any]:
         """Delegate to StatementLinker for bill matching."""
-        from circuitai.services.statement_linker import StatementLinker
         linker = StatementLinker(self.db)
         return linker.link_transactions(account_id)
 
@@ -264,12 +352,51 @@ class CaptureService:
         screenshot_path = self.take_screenshot()
         try:
             data = self.extract_from_screenshot(screenshot_path)
-            result = self.import_transactions(data, account_id, entity_type)
-            if result["imported"] > 0:
-                link_result = self.run_statement_linking(account_id)
-                result["linked"] = link_result.get("matched", 0)
-            else:
-                result["linked"] = 0
-            return result
+            return self._import_and_link(data, account_id, entity_type)
         finally:
             screenshot_path.unlink(missing_ok=True)
+
+    def snap_many(self, account_id: str, entity_type: str = "account", pages: int = 2) -> dict[str, Any]:
+        """Multi-page flow: take ``pages`` screenshots, extracting each while the next is taken.
+
+        ``screencapture`` blocks until the user picks a window, so each page's
+        vision request is submitted to a thread pool as soon as its screenshot
+        lands. Transactions from all pages are merged (dedup also drops rows
+        repeated across overlapping pages); the first page that shows a
+        balance wins.
+        """
+        client = self._vision_client()
+        paths: list[Path] = []
+        pool = ThreadPoolExecutor(max_workers=min(EXTRACT_WORKERS, pages))
+        try:
+            try:
+                futures = []
+                for _ in range(pages):
+                    path = self.take_screenshot()
+                    paths.append(path)
+                    futures.append(pool.submit(self._extract, client, path))
+                extractions = [future.result() for future in futures]
+            finally:
+                # On success every request is done; if a later screenshot was
+                # cancelled, don't make the user wait on requests in flight
+                pool.shutdown(wait=False, cancel_futures=True)
+            merged = {
+                "transactions": [t for data in extractions for t in data.get("transactions") or []],
+                "balance_cents": next(
+                    (data["balance_cents"] for data in extractions if data.get("balance_cents") is not None),
+                    None,
+                ),
+            }
+            return self._import_and_link(merged, account_id, entity_type)
+        finally:
+            for path in paths:
+                path.unlink(missing_ok=True)
+
+    def _import_and_link(self, data: dict[str, Any], account_id: str, entity_type: str) -> dict[str, Any]:
+        result = self.import_transactions(data, account_id, entity_type)
+        if result["imported"] > 0:
+            link_result = self.run_statement_linking(account_id)
+            result["linked"] = link_result.get("matched", 0)
+        else:
+            result["linked"] = 0
+        return result
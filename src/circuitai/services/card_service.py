@@ -82,25 +82,18 @@ class CardService:
     def get_transactions(self, card_id: str, limit: int = 50) -> list[CardTransaction]:
         return self.transactions.get_for_card(card_id, limit=limit)
 
+    def get_totals(self) -> dict[str, int]:
+        """Total balance and credit limit across active cards."""
+        return self.cards.totals()
+
     def get_total_balance(self) -> int:
-        cards = self.list_cards()
-        return sum(c.balance_cents for c in cards)
+        return self.cards.totals()["balance_cents"]
 
     def get_total_limit(self) -> int:
-        cards = self.list_cards()
-        return sum(c.credit_limit_cents for c in cards)
+        return self.cards.totals()["limit_cents"]
 
     def get_snapshot(self) -> list[dict[str, Any]]:
-        cards = self.list_cards()
-        return [
-            {
-                "id": c.id,
-                "name": c.name,
-                "institution": c.institution,
-                "last_four": c.last_four,
-                "balance_cents": c.balance_cents,
-                "limit_cents": c.credit_limit_cents,
-                "utilization_pct": round(c.utilization_pct, 1),
-            }
-            for c in cards
-        ]
+        snapshot = self.cards.get_utilization()
+        for c in snapshot:
+            c["utilization_pct"] = round(c["utilization_pct"], 1)
+        return snapshot
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import os
-import re
 from typing import Any
 
 from circuitai.core.database import DatabaseConnection
@@ -62,14 +61,21 @@ def get_file_type(path: str) -> str:
 
 
 def import_file(
-    db: DatabaseConnection, file_path: str, account_id: str, **kwargs: Any
+    db: DatabaseConnection,
+    file_path: str,
+    account_id: str,
+    file_type: str | None = None,
+    **kwargs: Any,
 ) -> dict[str, Any]:
     """Import a file using the appropriate adapter.
 
     For CSV: uses CsvImportAdapter.
     For PDF: uses PdfImportAdapter with mode from kwargs.get('mode', 'transactions').
+    Callers that already ran ``get_file_type`` can pass ``file_type`` to skip
+    re-parsing the path.
     """
-    file_type = get_file_type(file_path)
+    if file_type is None:
+        file_type = get_file_type(file_path)
 
     if file_type == "csv":
         from circuitai.adapters.builtin.csv_import import CsvImportAdapter
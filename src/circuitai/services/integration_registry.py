@@ -41,6 +41,14 @@ class IntegrationInfo:
 class IntegrationRegistry:
     """Combines adapter plugins and built-in services into a single registry."""
 
+    # Built-in integration name -> status-check method, in display order
+    _BUILTIN_CHECKS: dict[str, str] = {
+        "calendar-sync": "_check_calendar",
+        "statement-linker": "_check_statement_linker",
+        "text-parser": "_check_text_parser",
+        "query-engine": "_check_query_engine",
+    }
+
     def __init__(self, db: DatabaseConnection | None = None) -> None:
         self.db = db
 
@@ -49,38 +57,43 @@ class IntegrationRegistry:
         return self._get_adapter_integrations() + self._get_builtin_integrations()
 
     def get(self, name: str) -> IntegrationInfo | None:
-        """Look up a single integration by name."""
-        for info in self.list_all():
-            if info.name == name:
-                return info
-        return None
+        """Look up a single integration by name.
+
+        Loads only the matching adapter or runs only the matching built-in
+        check. Adapters take precedence, matching the list_all() order.
+        """
+        from circuitai.adapters.registry import AdapterRegistry
+
+        adapter = AdapterRegistry().find_adapter(name)
+        if adapter is not None:
+            return self._adapter_integration(adapter)
+        check = self._BUILTIN_CHECKS.get(name)
+        if check is None:
+            return None
+        return getattr(self, check)()
 
     def _get_adapter_integrations(self) -> list[IntegrationInfo]:
         """Query AdapterRegistry for installed adapter plugins."""
         from circuitai.adapters.registry import AdapterRegistry
 
-        registry = AdapterRegistry()
-        result = []
-        for adapter in registry.list_adapters():
-            result.append(IntegrationInfo(
-                name=adapter["name"],
-                kind="adapter",
-                description=adapter.get("description", ""),
-                version=adapter.get("version", "0.0.0"),
-                status=IntegrationStatus.active,
-                status_detail="Installed via entry_points",
-                config_command=f"circuit adapters configure {adapter['name']}",
-            ))
-        return result
+        return [self._adapter_integration(a) for a in AdapterRegistry().list_adapters()]
+
+    @staticmethod
+    def _adapter_integration(adapter: dict[str, Any]) -> IntegrationInfo:
+        """Wrap AdapterRegistry metadata as an IntegrationInfo."""
+        return IntegrationInfo(
+            name=adapter["name"],
+            kind="adapter",
+            description=adapter.get("description", ""),
+            version=adapter.get("version", "0.0.0"),
+            status=IntegrationStatus.active,
+            status_detail="Installed via entry_points",
+            config_command=f"circuit adapters configure {adapter['name']}",
+        )
 
     def _get_builtin_integrations(self) -> list[IntegrationInfo]:
         """Check status of built-in services."""
-        return [
-            self._check_calendar(),
-            self._check_statement_linker(),
-            self._check_text_parser(),
-            self._check_query_engine(),
-        ]
+        return [getattr(self, check)() for check in self._BUILTIN_CHECKS.values()]
 
     def _check_calendar(self) -> IntegrationInfo:
         """Check CalDAV calendar sync status."""
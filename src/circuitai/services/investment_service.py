@@ -89,14 +89,9 @@ class InvestmentService:
             source_account_id=source_account_id,
             notes=notes,
         )
-        self.contributions.insert(contrib)
-
-        # Update cost basis
-        inv = self.get_investment(investment_id)
-        self.investments.update(
-            investment_id,
-            cost_basis_cents=inv.cost_basis_cents + amount_cents,
-        )
+        with self.db.transaction():
+            self.investments.increment_cost_basis(investment_id, amount_cents)
+            self.contributions.insert(contrib)
         return contrib
 
     def get_contributions(self, investment_id: str, limit: int = 24) -> list[InvestmentContribution]:
@@ -107,21 +102,17 @@ class InvestmentService:
 
     def get_performance(self) -> dict[str, Any]:
         """Get overall investment performance summary."""
-        investments = self.list_investments()
-        total_value = sum(i.current_value_cents for i in investments)
-        total_cost = sum(i.cost_basis_cents for i in investments)
+        groups = self.investments.summary_by_type()
+        total_value = sum(g["value_cents"] for g in groups)
+        total_cost = sum(g["cost_basis_cents"] for g in groups)
         total_gain = total_value - total_cost
         gain_pct = (total_gain / total_cost * 100) if total_cost > 0 else 0
 
-        by_type: dict[str, int] = {}
-        for inv in investments:
-            by_type[inv.account_type] = by_type.get(inv.account_type, 0) + inv.current_value_cents
-
         return {
             "total_value_cents": total_value,
             "total_cost_basis_cents": total_cost,
             "total_gain_loss_cents": total_gain,
             "gain_loss_pct": round(gain_pct, 2),
-            "by_type": by_type,
-            "count": len(investments),
+            "by_type": {g["account_type"]: g["value_cents"] for g in groups},
+            "count": sum(g["count"] for g in groups),
         }
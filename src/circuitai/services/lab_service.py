@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import base64
 import hashlib
+import io
 import json
 import re
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any
 
 from circuitai.core.database import DatabaseConnection
@@ -35,18 +37,49 @@ try:
 except ImportError:
     HAS_PDFPLUMBER = False
 
+try:
+    import fitz  # PyMuPDF
+
+    HAS_FITZ = True
+except ImportError:
+    HAS_FITZ = False
+
+
+_NORMALIZE_RE = re.compile(r"[^A-Z0-9]")
+
+# Rendered PDF pages PNG-encoded concurrently in extract_from_pdf_vision
+ENCODE_WORKERS = 4
 
+# Vision page rendering: the API downscales images whose long edge exceeds
+# VISION_MAX_EDGE_PX, so pages are rendered no larger than that
+VISION_MAX_DPI = 200
+VISION_MAX_EDGE_PX = 1568
+
+
+def _vision_dpi(width_pt: float, height_pt: float) -> int:
+    """DPI that fits a page of the given size (in points) within VISION_MAX_EDGE_PX."""
+    return min(VISION_MAX_DPI, int(VISION_MAX_EDGE_PX * 72 / max(width_pt, height_pt)))
+
+
+@lru_cache(maxsize=1024)
 def compute_lab_fingerprint(result_date: str, provider: str, patient_name: str) -> str:
     """Compute a deterministic fingerprint for lab report dedup.
 
     Same pattern as compute_txn_fingerprint: normalize to uppercase alphanumeric, SHA-256[:16].
     """
-    normalized_provider = re.sub(r"[^A-Z0-9]", "", provider.upper())
-    normalized_name = re.sub(r"[^A-Z0-9]", "", patient_name.upper())
+    normalized_provider = _NORMALIZE_RE.sub("", provider.upper())
+    normalized_name = _NORMALIZE_RE.sub("", patient_name.upper())
     raw = f"{result_date}|{normalized_provider}|{normalized_name}"
     return hashlib.sha256(raw.encode()).hexdigest()[:16]
 
 
+def _encode_page_image(img: Any) -> str:
+    """PNG-encode a rendered pdfplumber page image and return it as base64 text."""
+    buf = io.BytesIO()
+    img.save(buf, format="PNG")
+    return base64.b64encode(buf.getbuffer()).decode("ascii")
+
+
 _LAB_VISION_PROMPT = """\
 You are extracting lab test results from a medical lab report image.
 
@@ -110,6 +143,60 @@ _LABCORP_HEADER_LINE = "Test Current Result and Flag"
 # Generic panel header patterns (all-caps lines)
 _PANEL_HEADER_RE = re.compile(r"^([A-Z][A-Z\s&/()-]{3,})(?:\s*:?\s*)$", re.MULTILINE)
 
+# Report header fields
+_LABCORP_NAME_RE = re.compile(
+    r"^([A-Za-z]+,\s*[A-Za-z]+(?:\s+[A-Z])?)\s+\d{2}/\d{2}/\d{4}\s+Patient Report", re.MULTILINE
+)
+_GENERIC_NAME_RE = re.compile(r"(?:Patient\s*(?:Name)?|Name)\s*[:]\s*(.+?)(?:\n|$)", re.IGNORECASE)
+_PHYS_RE = re.compile(
+    r"(?:Ordering\s*Physician|Physician|Doctor|Ordered\s*[Bb]y)\s*[:]\s*(.+?)(?:\n|$)", re.IGNORECASE
+)
+_DATE_COLLECTED_RE = re.compile(r"(?:Date\s*(?:Collected|Drawn|Ordered))\s*[:]\s*(.+?)(?:\n|$)", re.IGNORECASE)
+_DATE_REPORTED_RE = re.compile(r"(?:Date\s*(?:Reported|Resulted|Received))\s*[:]\s*(.+?)(?:\n|$)", re.IGNORECASE)
+
+# LabCorp line classification
+_CONT_RE = re.compile(r"\s*\(Cont\.\)\s*$")
+_PATIENT_HDR_RE = re.compile(r"^[A-Za-z]+,\s*[A-Za-z]+.*Patient Report")
+
+# Header, footer and note lines to skip; str.startswith checks the whole tuple in one call
+_LABCORP_SKIP_PREFIXES = (
+    "Patient Report", "Date Created and Stored", "©", "All Rights Reserved",
+    "Please Note:", "Microscopic follows", "Microscopic was indicated",
+    "Clinical Info:", "General Comments", "Ordered Items:",
+    "Icon Legend", "Out of Reference", "Performing Labs",
+    "Patient Details", "Physician Details", "Specimen Details",
+    "Historical Results", "The Previous Result",
+    "Prediabetes:", "Diabetes:", "Glycemic control",
+    "Roche ECLIA", "According to", "decrease and remain",
+    "prostatectomy", "Values obtained", "interchangeably",
+    "Normal:", "Moderately increased", "Severely increased",
+    "Men Women", "Avg.Risk", "Performed",
+    "Previous Result",
+    # Repeated patient ID lines
+    "Patient ID:", "Specimen ID:", "DOB:", "Date Collected:",
+)
+
+# LabCorp marker rows
+_PREV_DATE_RE = re.compile(r"\s+\d{1,2}/\d{1,2}/\d{4}\s+")
+_LAB_CODE_RE = re.compile(r"\s+01\s+")
+_TRAILING_FLAG_RE = re.compile(r"^[HLAChlac*]$")
+_RANGE_RE = re.compile(r"^([\d.]+)[-–]([\d.]+)$")
+_GT_RE = re.compile(r"^[><]=?\s*([\d.]+)$")
+
+# Lowercased "marker names" that are really header or label text
+_NOISE_NAMES = frozenset({
+    "test current", "date created", "date collected", "date reported",
+    "date received", "patient id", "specimen id", "ref.", "units",
+})
+
+# Report flag letter -> stored flag; anything else is "normal"
+_FLAG_NAMES = {"H": "high", "L": "low", "A": "critical", "C": "critical"}
+
+
+def _is_value_token(tok: str) -> bool:
+    """Number, <, > or lab qualitative result token."""
+    return tok[0] in ".<>" or tok[0].isdecimal() or tok in ("Negative", "Positive", "Reactive")
+
 
 class LabService:
     """Lab results import, extraction, and management."""
@@ -119,12 +206,25 @@ class LabService:
         self.results = LabResultRepository(db)
         self.panels = LabPanelRepository(db)
         self.markers = LabMarkerRepository(db)
+        self._api_key: str | None = None
 
     # ── Fingerprint & dedup ───────────────────────────────────────
 
     def _check_duplicate(self, fingerprint: str) -> LabResult | None:
         return self.results.find_by_fingerprint(fingerprint)
 
+    def _find_existing_report(self, parsed: dict[str, Any]) -> tuple[str | None, LabResult | None]:
+        """Fingerprint parsed report data and look up an earlier import of it.
+
+        Returns (None, None) when the date or provider needed for a fingerprint is missing.
+        """
+        result_date = parsed.get("result_date") or ""
+        provider = parsed.get("provider") or ""
+        if not (result_date and provider):
+            return None, None
+        fingerprint = compute_lab_fingerprint(result_date, provider, parsed.get("patient_name") or "")
+        return fingerprint, self._check_duplicate(fingerprint)
+
     # ── PDF text extraction ───────────────────────────────────────
 
     def extract_from_pdf_text(self, text: str) -> dict[str, Any]:
@@ -141,7 +241,9 @@ class LabService:
         if not text.strip():
             return data
 
-        # Provider (check first to select format-specific logic)
+        # Provider (check first to select format-specific logic). _PROVIDERS order is
+        # the priority: "quest" also matches words like "Requested", so LabCorp must win
+        # wherever it appears. One lower() plus substring scans beats an IGNORECASE regex.
         text_lower = text.lower()
         for key, name in _PROVIDERS.items():
             if key in text_lower:
@@ -152,11 +254,7 @@ class LabService:
 
         # Patient name — LabCorp format: "LastName, FirstName M DOB Patient Report"
         if is_labcorp:
-            name_match = re.search(
-                r"^([A-Za-z]+,\s*[A-Za-z]+(?:\s+[A-Z])?)\s+\d{2}/\d{2}/\d{4}\s+Patient Report",
-                text,
-                re.MULTILINE,
-            )
+            name_match = _LABCORP_NAME_RE.search(text)
             if name_match:
                 raw_name = name_match.group(1).strip()
                 # Convert "LastName, FirstName M" to "FirstName LastName"
@@ -170,34 +268,18 @@ class LabService:
                 else:
                     data["patient_name"] = raw_name.title()
         else:
-            name_match = re.search(
-                r"(?:Patient\s*(?:Name)?|Name)\s*[:]\s*(.+?)(?:\n|$)",
-                text,
-                re.IGNORECASE,
-            )
+            name_match = _GENERIC_NAME_RE.search(text)
             if name_match:
                 data["patient_name"] = name_match.group(1).strip()
 
         # Ordering physician
-        phys_match = re.search(
-            r"(?:Ordering\s*Physician|Physician|Doctor|Ordered\s*[Bb]y)\s*[:]\s*(.+?)(?:\n|$)",
-            text,
-            re.IGNORECASE,
-        )
+        phys_match = _PHYS_RE.search(text)
         if phys_match:
             data["ordering_physician"] = phys_match.group(1).strip()
 
         # Dates
-        date_collected = re.search(
-            r"(?:Date\s*(?:Collected|Drawn|Ordered))\s*[:]\s*(.+?)(?:\n|$)",
-            text,
-            re.IGNORECASE,
-        )
-        date_reported = re.search(
-            r"(?:Date\s*(?:Reported|Resulted|Received))\s*[:]\s*(.+?)(?:\n|$)",
-            text,
-            re.IGNORECASE,
-        )
+        date_collected = _DATE_COLLECTED_RE.search(text)
+        date_reported = _DATE_REPORTED_RE.search(text)
 
         if date_collected:
             data["order_date"] = self._normalize_date(date_collected.group(1).strip())
@@ -219,7 +301,7 @@ class LabService:
         LabCorp format: panel header line, then "Test Current Result and Flag..." header,
         then marker rows with: MarkerName [01]? Value [PrevValue PrevDate] Unit RefRange [Flag]
         """
-        lines = text.split("\n")
+        lines = text.splitlines()
         panels: list[dict[str, Any]] = []
         current_panel_name: str | None = None
         current_markers: list[dict[str, Any]] = []
@@ -227,22 +309,6 @@ class LabService:
         # Track lines to identify panel headers (line before "Test Current Result...")
         prev_line = ""
 
-        # Lines to skip (startswith patterns)
-        skip_starts = [
-            "Patient Report", "Date Created and Stored", "©", "All Rights Reserved",
-            "Please Note:", "Microscopic follows", "Microscopic was indicated",
-            "Clinical Info:", "General Comments", "Ordered Items:",
-            "Icon Legend", "Out of Reference", "Performing Labs",
-            "Patient Details", "Physician Details", "Specimen Details",
-            "Historical Results", "The Previous Result",
-            "Prediabetes:", "Diabetes:", "Glycemic control",
-            "Roche ECLIA", "According to", "decrease and remain",
-            "prostatectomy", "Values obtained", "interchangeably",
-            "Normal:", "Moderately increased", "Severely increased",
-            "Men Women", "Avg.Risk", "Performed",
-            "Previous Result",
-        ]
-
         for line in lines:
             stripped = line.strip()
             if not stripped:
@@ -256,35 +322,19 @@ class LabService:
                     current_markers = []
                 if prev_line and not prev_line.startswith("Date Collected"):
                     current_panel_name = prev_line.strip()
-                    current_panel_name = re.sub(r"\s*\(Cont\.\)\s*$", "", current_panel_name)
+                    current_panel_name = _CONT_RE.sub("", current_panel_name)
                 else:
                     current_panel_name = "General"
                 in_marker_section = True
                 prev_line = stripped
                 continue
 
-            # Skip header/footer/note lines
-            if any(stripped.startswith(p) for p in skip_starts):
-                prev_line = stripped
-                continue
-
-            # Skip repeated patient header lines
-            if re.match(r"^[A-Za-z]+,\s*[A-Za-z]+.*Patient Report", stripped):
-                prev_line = stripped
-                continue
-            if re.match(r"^(Patient ID|Specimen ID|DOB|Date Collected):", stripped):
-                prev_line = stripped
-                continue
-
-            # If in marker section, try to parse marker rows
-            if in_marker_section:
+            # Boilerplate lines only need filtering once a marker section has started;
+            # before that they just become prev_line like any other text
+            if in_marker_section and not self._is_labcorp_boilerplate(stripped):
                 marker = self._parse_labcorp_marker_line(stripped)
                 if marker:
                     current_markers.append(marker)
-                elif not stripped[0].isdigit() and len(stripped) > 3:
-                    # Could be a sub-header or continuation panel name
-                    # Check if next line might be "Test Current Result..."
-                    pass
 
             prev_line = stripped
 
@@ -294,8 +344,15 @@ class LabService:
 
         return panels
 
+    @staticmethod
+    def _is_labcorp_boilerplate(stripped: str) -> bool:
+        """Header/footer/note lines and repeated patient ID or patient header lines."""
+        if stripped.startswith(_LABCORP_SKIP_PREFIXES):
+            return True
+        return "Patient Report" in stripped and _PATIENT_HDR_RE.match(stripped) is not None
+
     def _parse_labcorp_marker_line(self, line: str) -> dict[str, Any] | None:
-        """Parse a single LabCorp marker row.
+        """Parse a single, already stripped LabCorp marker row.
 
         Strategy: Split on the previous-result date (MM/DD/YYYY), which consistently
         separates marker-name+value from unit+reference. Then parse each side.
@@ -307,39 +364,33 @@ class LabService:
             Specific Gravity 01 1.009 1.015 11/14/2024 1.005-1.030
             Urine-Color 01 Yellow Yellow 11/14/2024 Yellow
         """
-        if line.startswith("*") or line.startswith("†"):
+        if line.startswith(("*", "†")):
             return None
 
-        # Split on the previous-result date pattern (MM/DD/YYYY)
-        date_split = re.split(r"\s+\d{1,2}/\d{1,2}/\d{4}\s+", line, maxsplit=1)
-        if len(date_split) != 2:
+        # Find the previous-result date (MM/DD/YYYY) once and slice around it
+        date_match = _PREV_DATE_RE.search(line)
+        if date_match is None:
             return None
 
-        left = date_split[0].strip()   # "WBC 01 4.8 5.7" or "eGFR 113 108"
-        right = date_split[1].strip()  # "x10E3/uL 3.4-10.8" or "mL/min/1.73 >59" or "9-20"
-
         # Parse left side: marker_name [01] current_value [previous_value]
         # Remove lab code "01" if present
-        left = re.sub(r"\s+01\s+", " ", left)
+        tokens = _LAB_CODE_RE.sub(" ", line[:date_match.start()]).split()
+        # Right side: "x10E3/uL 3.4-10.8" or "mL/min/1.73 >59" or "9-20"
+        right = line[date_match.end():].split()
 
         # Split tokens: last 1-2 are numeric values, rest is marker name
-        tokens = left.split()
         if len(tokens) < 2:
             return None
 
-        # Work backwards: find where numbers start
-        value_start = len(tokens)
-        for i in range(len(tokens) - 1, 0, -1):
-            # Check if this token looks like a value (number, <, >, or lab qualitative)
-            if re.match(r"^[\d.<>]+\S*$", tokens[i]) or tokens[i] in ("Negative", "Positive", "Reactive"):
-                value_start = i
-            else:
-                break
-
-        if value_start >= len(tokens):
+        # A row with a previous-result date ends in "current previous", so only the
+        # last two tokens can be values; a name like "Vitamin D, 25-Hydroxy" keeps its
+        # digit-led token. The marker name needs at least one token of its own.
+        last = len(tokens) - 1
+        if not _is_value_token(tokens[last]):
             return None
+        value_start = last - 1 if last > 1 and _is_value_token(tokens[last - 1]) else last
 
-        marker_name = " ".join(tokens[:value_start]).strip()
+        marker_name = " ".join(tokens[:value_start])
         current_value = tokens[value_start]  # First numeric token = current value
 
         if not marker_name or self._is_noise_line(marker_name):
@@ -357,8 +408,8 @@ class LabService:
             "flag": self._parse_flag(flag),
         }
 
-    def _parse_labcorp_right_side(self, text: str) -> tuple[str, str, str, str]:
-        """Parse the right side after the date: unit + reference + optional flag.
+    def _parse_labcorp_right_side(self, parts: list[str]) -> tuple[str, str, str, str]:
+        """Parse the tokens after the date: unit + reference + optional flag.
 
         Examples:
             "x10E3/uL 3.4-10.8"      -> ("x10E3/uL", "3.4", "10.8", "")
@@ -370,7 +421,6 @@ class LabService:
             "mg/dL 0.0-1.2"          -> ("mg/dL", "0.0", "1.2", "")
             "mg/dL 100-199 H"        -> ("mg/dL", "100", "199", "H")
         """
-        parts = text.split()
         if not parts:
             return ("", "", "", "")
 
@@ -380,7 +430,7 @@ class LabService:
         flag = ""
 
         # Check for trailing flag (single char H/L/A/C)
-        if parts and re.match(r"^[HLAChlac*]$", parts[-1]):
+        if parts and _TRAILING_FLAG_RE.match(parts[-1]):
             flag = parts[-1].upper().replace("*", "")
             parts = parts[:-1]
 
@@ -399,14 +449,14 @@ class LabService:
 
         # Look for range pattern "low-high" in the parts
         for i, p in enumerate(parts):
-            range_match = re.match(r"^([\d.]+)[-–]([\d.]+)$", p)
+            range_match = _RANGE_RE.match(p)
             if range_match:
                 ref_low = range_match.group(1)
                 ref_high = range_match.group(2)
                 unit = " ".join(parts[:i])
                 break
             # Check for ">59" or ">=40" type reference
-            gt_match = re.match(r"^[><]=?\s*([\d.]+)$", p)
+            gt_match = _GT_RE.match(p)
             if gt_match:
                 if p.startswith(">"):
                     ref_low = gt_match.group(1)
@@ -420,15 +470,11 @@ class LabService:
     @staticmethod
     def _is_noise_line(name: str) -> bool:
         """Filter out lines that look like marker names but aren't."""
-        noise = {
-            "test current", "date created", "date collected", "date reported",
-            "date received", "patient id", "specimen id", "ref.", "units",
-        }
-        return name.lower() in noise or len(name) < 2
+        return len(name) < 2 or name.lower() in _NOISE_NAMES
 
     def _extract_generic_panels(self, text: str) -> list[dict[str, Any]]:
         """Extract panels from non-LabCorp PDFs using generic regex."""
-        lines = text.split("\n")
+        lines = text.splitlines()
         panels: list[dict[str, Any]] = []
         current_panel_name = "General"
         current_markers: list[dict[str, Any]] = []
@@ -438,17 +484,15 @@ class LabService:
             if not stripped:
                 continue
 
-            # Check for panel header (all-caps)
-            header_match = _PANEL_HEADER_RE.match(stripped)
-            if header_match and not _GENERIC_MARKER_RE.match(stripped):
-                if current_markers:
-                    panels.append({"panel_name": current_panel_name, "markers": current_markers})
-                    current_markers = []
-                current_panel_name = header_match.group(1).strip().title()
+            # Both patterns need a leading letter, and a marker row needs the "-"/"–"
+            # of its reference range; anything else is rejected before the regexes run
+            if not stripped[0].isalpha():
                 continue
+            if "-" in stripped or "–" in stripped:
+                marker_match = _GENERIC_MARKER_RE.match(stripped)
+            else:
+                marker_match = None
 
-            # Try generic marker pattern
-            marker_match = _GENERIC_MARKER_RE.match(stripped)
             if marker_match:
                 flag_raw = (marker_match.group(6) or "").upper()
                 current_markers.append({
@@ -459,6 +503,15 @@ class LabService:
                     "reference_high": marker_match.group(5),
                     "flag": self._parse_flag(flag_raw),
                 })
+                continue
+
+            # Check for panel header (all-caps)
+            header_match = _PANEL_HEADER_RE.match(stripped)
+            if header_match:
+                if current_markers:
+                    panels.append({"panel_name": current_panel_name, "markers": current_markers})
+                    current_markers = []
+                current_panel_name = header_match.group(1).strip().title()
 
         if current_markers:
             panels.append({"panel_name": current_panel_name, "markers": current_markers})
@@ -467,17 +520,15 @@ class LabService:
 
     @staticmethod
     def _parse_flag(flag_char: str) -> str:
-        if flag_char in ("H",):
-            return "high"
-        if flag_char in ("L",):
-            return "low"
-        if flag_char in ("A", "C"):
-            return "critical"
-        return "normal"
+        return _FLAG_NAMES.get(flag_char, "normal")
 
     @staticmethod
     def _normalize_date(text: str) -> str | None:
         """Normalize date text to YYYY-MM-DD."""
+        # Already ISO (which _DATE_RE would misread as M-D-Y): return the date as is
+        iso = text[:10]
+        if len(iso) == 10 and iso[4] == iso[7] == "-" and iso.isascii() and (iso[:4] + iso[5:7] + iso[8:]).isdigit():
+            return iso
         match = _DATE_RE.search(text)
         if not match:
             return None
@@ -493,34 +544,26 @@ class LabService:
         if not HAS_ANTHROPIC:
             raise AdapterError("anthropic package not installed. Install with: pip install anthropic")
 
-        if not HAS_PDFPLUMBER:
+        if not HAS_PDFPLUMBER and not HAS_FITZ:
             raise AdapterError("pdfplumber package not installed. Install with: pip install pdfplumber")
 
         api_key = self._get_api_key()
         if not api_key:
             raise AdapterError("Anthropic API key not configured. Run 'circuit capture setup' first.")
 
-        pdf = pdfplumber.open(pdf_path)
-        image_contents = []
-
-        for page in pdf.pages:
-            img = page.to_image(resolution=200)
-            import tempfile
-            with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-                img.save(f.name)
-                image_data = base64.b64encode(Path(f.name).read_bytes()).decode("utf-8")
-                Path(f.name).unlink(missing_ok=True)
+        encoded = self._render_pdf_pages(pdf_path)
 
-            image_contents.append({
+        image_contents = [
+            {
                 "type": "image",
                 "source": {
                     "type": "base64",
                     "media_type": "image/png",
                     "data": image_data,
                 },
-            })
-
-        pdf.close()
+            }
+            for image_data in encoded
+        ]
 
         if not image_contents:
             return {"panels": []}
@@ -550,12 +593,46 @@ class LabService:
         except json.JSONDecodeError as e:
             raise AdapterError(f"Vision API returned invalid JSON: {e}\nRaw: {raw[:200]}") from e
 
+    @staticmethod
+    def _render_pdf_pages(pdf_path: str) -> list[str]:
+        """Render each PDF page for vision and return base64 PNGs in page order.
+
+        PyMuPDF renders straight to PNG bytes when installed; otherwise pdfplumber
+        renders and the images are encoded by _encode_page_image.
+        """
+        if HAS_FITZ:
+            doc = fitz.open(pdf_path)
+            try:
+                return [
+                    base64.b64encode(
+                        page.get_pixmap(dpi=_vision_dpi(page.rect.width, page.rect.height)).tobytes("png")
+                    ).decode("ascii")
+                    for page in doc
+                ]
+            finally:
+                doc.close()
+
+        pdf = pdfplumber.open(pdf_path)
+        try:
+            # Pages share one document handle, so they are rendered here in order;
+            # each rendered image is encoded on the pool while the next one renders
+            with ThreadPoolExecutor(max_workers=ENCODE_WORKERS) as pool:
+                futures = [
+                    pool.submit(_encode_page_image, page.to_image(resolution=_vision_dpi(page.width, page.height)))
+                    for page in pdf.pages
+                ]
+            return [future.result() for future in futures]
+        finally:
+            pdf.close()
+
     def _get_api_key(self) -> str | None:
-        """Get Anthropic API key from adapter_state."""
-        row = self.db.fetchone(
-            "SELECT value FROM adapter_state WHERE adapter_name = 'capture' AND key = 'anthropic_api_key'",
-        )
-        return row["value"] if row else None
+        """Get Anthropic API key from adapter_state, cached once found."""
+        if self._api_key is None:
+            row = self.db.fetchone(
+                "SELECT value FROM adapter_state WHERE adapter_name = 'capture' AND key = 'anthropic_api_key'",
+            )
+            self._api_key = row["value"] if row else None
+        return self._api_key
 
     # ── Import orchestrator ───────────────────────────────────────
 
@@ -564,6 +641,13 @@ class LabService:
         if not HAS_PDFPLUMBER:
             raise AdapterError("pdfplumber package not installed. Install with: pip install pdfplumber")
 
+        # The exact same file imported before needs no parsing at all
+        with open(file_path, "rb") as f:
+            source_hash = hashlib.file_digest(f, "sha256").hexdigest()
+        existing = self.results.find_by_source_hash(source_hash)
+        if existing:
+            return self._duplicate_import(existing)
+
         pdf = pdfplumber.open(file_path)
         full_text = "\n".join(page.extract_text() or "" for page in pdf.pages)
         pdf.close()
@@ -571,43 +655,51 @@ class LabService:
         # Try text extraction first
         parsed = self.extract_from_pdf_text(full_text)
         has_markers = any(p.get("markers") for p in parsed.get("panels", []))
+        fingerprint, existing = self._find_existing_report(parsed)
 
-        # Vision fallback if text extraction is incomplete
-        if not has_markers and HAS_ANTHROPIC:
+        # Vision fallback if text extraction is incomplete, unless the text already
+        # identifies a report that was imported before
+        if existing is None and not has_markers and HAS_ANTHROPIC:
+            vision_parsed = None
             try:
                 api_key = self._get_api_key()
                 if api_key:
-                    parsed = self.extract_from_pdf_vision(file_path)
+                    vision_parsed = self.extract_from_pdf_vision(file_path)
             except Exception:
                 pass  # Fall through with text results
+            if vision_parsed is not None:
+                parsed = vision_parsed
+                fingerprint, existing = self._find_existing_report(parsed)
 
-        # Compute fingerprint for dedup
-        result_date = parsed.get("result_date") or ""
-        provider = parsed.get("provider") or ""
-        patient_name = parsed.get("patient_name") or ""
-
-        if result_date and provider:
-            fingerprint = compute_lab_fingerprint(result_date, provider, patient_name)
-            existing = self._check_duplicate(fingerprint)
-            if existing:
-                return {
-                    "result_id": existing.id,
-                    "panels_imported": 0,
-                    "markers_imported": 0,
-                    "flagged_count": 0,
-                    "duplicate": True,
-                    "existing_date": existing.created_at,
-                }
-        else:
-            fingerprint = None
+        if existing:
+            return self._duplicate_import(existing)
 
         parsed["report_fingerprint"] = fingerprint
-        result = self.import_lab_data(parsed, source="pdf")
+        parsed["source_hash"] = source_hash
+        # A computed fingerprint was already checked above; don't query it again
+        result = self.import_lab_data(parsed, source="pdf", dedup_checked=fingerprint is not None)
         result["duplicate"] = False
         return result
 
-    def import_lab_data(self, data: dict[str, Any], source: str = "pdf") -> dict[str, Any]:
-        """Persist parsed lab data into the 3-table hierarchy."""
+    @staticmethod
+    def _duplicate_import(existing: LabResult) -> dict[str, Any]:
+        return {
+            "result_id": existing.id,
+            "panels_imported": 0,
+            "markers_imported": 0,
+            "flagged_count": 0,
+            "duplicate": True,
+            "existing_date": existing.created_at,
+        }
+
+    def import_lab_data(
+        self, data: dict[str, Any], source: str = "pdf", *, dedup_checked: bool = False
+    ) -> dict[str, Any]:
+        """Persist parsed lab data into the 3-table hierarchy.
+
+        Pass dedup_checked=True when the caller has already looked up
+        data["report_fingerprint"] and found no existing result.
+        """
         # Compute fingerprint for dedup if not already set
         fingerprint = data.get("report_fingerprint")
         if not fingerprint:
@@ -618,7 +710,7 @@ class LabService:
             )
 
         # Check for duplicates
-        existing = self.results.find_by_fingerprint(fingerprint)
+        existing = None if dedup_checked else self.results.find_by_fingerprint(fingerprint)
         if existing:
             return {
                 "result_id": existing.id,
@@ -636,22 +728,24 @@ class LabService:
             order_date=data.get("order_date"),
             result_date=data.get("result_date"),
             report_fingerprint=fingerprint,
+            source_hash=data.get("source_hash"),
             status="completed",
             source=source,
         )
-        self.results.insert(lab_result)
 
-        panels_imported = 0
-        markers_imported = 0
+        # Build every panel and marker first (ids are assigned on construction),
+        # then write them with one executemany per table in a single transaction
+        panels: list[LabPanel] = []
+        markers: list[LabMarker] = []
         flagged_count = 0
 
         for panel_data in data.get("panels", []):
             panel_name = panel_data.get("panel_name", "General")
-            markers = panel_data.get("markers", [])
+            panel_markers = panel_data.get("markers", [])
 
             # Determine panel status from markers
             panel_status = "normal"
-            for m in markers:
+            for m in panel_markers:
                 flag = m.get("flag", "normal")
                 if flag == "critical":
                     panel_status = "critical"
@@ -664,10 +758,9 @@ class LabService:
                 panel_name=panel_name,
                 status=panel_status,
             )
-            self.panels.insert(panel)
-            panels_imported += 1
+            panels.append(panel)
 
-            for m in markers:
+            for m in panel_markers:
                 marker = LabMarker(
                     lab_panel_id=panel.id,
                     marker_name=m.get("marker_name", ""),
@@ -677,11 +770,18 @@ class LabService:
                     reference_high=m.get("reference_high", ""),
                     flag=m.get("flag", "normal"),
                 )
-                self.markers.insert(marker)
-                markers_imported += 1
+                markers.append(marker)
                 if marker.is_flagged:
                     flagged_count += 1
 
+        with self.db.transaction():
+            self.results.insert(lab_result)
+            self.panels.insert_many(panels)
+            self.markers.insert_many(markers)
+
+        panels_imported = len(panels)
+        markers_imported = len(markers)
+
         return {
             "result_id": lab_result.id,
             "panels_imported": panels_imported,
@@ -699,12 +799,12 @@ class LabService:
         return self.results.get(result_id)
 
     def get_result_detail(self, result_id: str) -> dict[str, Any]:
-        """Get a result with all nested panels and markers."""
+        """Get a result with all nested panels and markers (as ``LabMarkerRow``)."""
         result = self.results.get(result_id)
         panels = self.panels.get_for_result(result_id)
         panels_detail = []
         for panel in panels:
-            markers = self.markers.get_for_panel(panel.id)
+            markers = self.markers.get_for_panel_rows(panel.id)
             panels_detail.append({
                 "panel": panel,
                 "markers": markers,
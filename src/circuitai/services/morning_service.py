@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, timedelta
+from operator import itemgetter
 from typing import Any
 
 from circuitai.core.database import DatabaseConnection
 from circuitai.services.account_service import AccountService
 from circuitai.services.activity_service import ActivityService
-from circuitai.services.bill_service import BillService
+from circuitai.services.bill_service import BillService, next_due_date
 from circuitai.services.card_service import CardService
 from circuitai.services.deadline_service import DeadlineService
 from circuitai.services.lab_service import LabService
@@ -30,14 +31,20 @@ class MorningService:
 
     def get_briefing(self) -> dict[str, Any]:
         """Generate the full morning briefing."""
+        with self.db.read_snapshot():
+            return self._build_briefing()
+
+    def _build_briefing(self) -> dict[str, Any]:
         today = date.today()
 
-        # Attention items
-        attention: list[dict[str, Any]] = []
+        # Attention items: dated ones are sorted by days_until and come first,
+        # followed by undated ones (overdue deadlines, lab results) in order
+        dated: list[dict[str, Any]] = []
+        undated: list[dict[str, Any]] = []
 
         # Overdue deadlines
         for dl in self.deadlines.get_overdue():
-            attention.append({
+            undated.append({
                 "type": "deadline_overdue",
                 "title": dl.title,
                 "due_date": dl.due_date,
@@ -45,32 +52,20 @@ class MorningService:
                 "id": dl.id,
             })
 
-        # Bills due soon (within 7 days)
-        for bill in self.bills.get_due_soon(within_days=7):
-            last_payment = self.bills.get_last_payment(bill.id)
-            # Check if already paid this period
-            if last_payment:
-                paid = date.fromisoformat(last_payment.paid_date[:10])
-                if (today - paid).days < 25:  # Paid recently, skip
-                    continue
-
-            # Calculate actual due date this month
-            due_day = bill.due_day or 1
-            try:
-                due_date = today.replace(day=due_day)
-            except ValueError:
-                import calendar
-                last_day = calendar.monthrange(today.year, today.month)[1]
-                due_date = today.replace(day=min(due_day, last_day))
-
-            if due_date < today:
-                if today.month == 12:
-                    due_date = due_date.replace(year=today.year + 1, month=1)
-                else:
-                    due_date = due_date.replace(month=today.month + 1)
-
+        # Bills due soon (within 7 days); also used for the week summary below
+        bills_this_week = self.bills.get_due_soon(within_days=7)
+        last_paid = self.bills.get_last_paid_dates([b.id for b in bills_this_week])
+        # Paid within the last 25 days counts as paid this period (ISO dates compare as strings)
+        paid_cutoff = (today - timedelta(days=25)).isoformat()
+        for bill in bills_this_week:
+            last_paid_date = last_paid.get(bill.id)
+            if last_paid_date and last_paid_date[:10] > paid_cutoff:
+                continue
+
+            # Due date this month (clamped to month end), or next month's if already past
+            due_date = next_due_date(bill.due_day or 1, today)
             days_until = (due_date - today).days
-            attention.append({
+            dated.append({
                 "type": "bill_due",
                 "title": bill.name,
                 "amount_cents": bill.amount_cents,
@@ -79,9 +74,13 @@ class MorningService:
                 "id": bill.id,
             })
 
-        # Upcoming deadlines (within 3 days)
-        for dl in self.deadlines.get_upcoming(within_days=3):
-            attention.append({
+        # Upcoming deadlines (within 3 days), taken from the week's list
+        upcoming_deadlines = self.deadlines.get_upcoming(within_days=7)
+        soon = (today + timedelta(days=3)).isoformat()
+        for dl in upcoming_deadlines:
+            if dl.due_date > soon:
+                break
+            dated.append({
                 "type": "deadline_upcoming",
                 "title": dl.title,
                 "due_date": dl.due_date,
@@ -92,10 +91,9 @@ class MorningService:
 
         # Upcoming subscription charges (within 3 days)
         for sub in self.subscriptions.get_upcoming(within_days=3):
-            if sub.next_charge_date:
-                charge_date = date.fromisoformat(sub.next_charge_date[:10])
-                days_until = (charge_date - today).days
-                attention.append({
+            days_until = sub.days_until
+            if days_until is not None:
+                dated.append({
                     "type": "subscription_charge",
                     "title": sub.name,
                     "amount_cents": sub.amount_cents,
@@ -108,7 +106,7 @@ class MorningService:
         unreviewed_labs = [r for r in self.lab.list_results() if r.status != "reviewed"]
         for lab in unreviewed_labs:
             flagged = self.lab.get_flagged_markers(lab.id)
-            attention.append({
+            undated.append({
                 "type": "lab_unreviewed",
                 "title": f"Lab result: {lab.provider} — {lab.result_date or 'unknown date'}",
                 "flagged_count": len(flagged),
@@ -117,12 +115,11 @@ class MorningService:
             })
 
         # Sort attention items by urgency
-        attention.sort(key=lambda x: x.get("days_until", 999))
+        dated.sort(key=itemgetter("days_until"))
+        attention = dated + undated
 
         # This week's summary
-        bills_this_week = self.bills.get_due_soon(within_days=7)
         week_bill_total = sum(b.amount_cents for b in bills_this_week)
-        upcoming_deadlines = self.deadlines.get_upcoming(within_days=7)
 
         # Accounts snapshot
         acct_snapshot = self.accounts.get_snapshot()
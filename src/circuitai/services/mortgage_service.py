@@ -64,6 +64,9 @@ class MortgageService:
     def list_mortgages(self, active_only: bool = True) -> list[Mortgage]:
         return self.mortgages.list_all(active_only=active_only)  # type: ignore[return-value]
 
+    def get_total_balance(self) -> int:
+        return self.mortgages.total_balance()
+
     def update_mortgage(self, mortgage_id: str, **updates: Any) -> Mortgage:
         return self.mortgages.update(mortgage_id, **updates)  # type: ignore[return-value]
 
@@ -109,20 +112,23 @@ class MortgageService:
         monthly_rate = (mtg.interest_rate_bps / 10000) / 12
         payment = mtg.monthly_payment_cents - mtg.escrow_cents  # P&I only
 
+        escrow = mtg.escrow_cents
+        total_payment = payment + escrow
+
+        # Interest is truncated to whole cents each month, so this stays a loop
+        # rather than a closed-form annuity formula
         schedule = []
         for month in range(1, months + 1):
             interest = int(balance * monthly_rate)
-            principal = payment - interest
-            if principal > balance:
-                principal = balance
+            principal = min(payment - interest, balance)
             balance = max(0, balance - principal)
 
             schedule.append({
                 "month": month,
-                "payment_cents": payment + mtg.escrow_cents,
+                "payment_cents": total_payment,
                 "principal_cents": principal,
                 "interest_cents": interest,
-                "escrow_cents": mtg.escrow_cents,
+                "escrow_cents": escrow,
                 "remaining_balance_cents": balance,
             })
             if balance == 0:
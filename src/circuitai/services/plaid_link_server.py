@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 import threading
 import webbrowser
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any
 from urllib.parse import parse_qs, urlparse
 
@@ -66,8 +66,13 @@ def run_link_flow(link_token: str, port: int = 8765) -> dict[str, Any]:
     Raises ``AdapterError`` if the user cancels or an error occurs.
     """
     result: dict[str, Any] = {}
+    done = threading.Event()
+    # Rendered once; reloads and extra GETs are served the same bytes
+    page = _LINK_HTML.replace("{{LINK_TOKEN}}", link_token).encode("utf-8")
 
     class LinkHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
         def do_GET(self) -> None:
             parsed = urlparse(self.path)
 
@@ -85,27 +90,39 @@ def run_link_flow(link_token: str, port: int = 8765) -> dict[str, Any]:
                 self.send_response(200)
                 self.send_header("Content-Type", "text/plain")
                 self.send_header("Access-Control-Allow-Origin", "*")
+                self.send_header("Content-Length", "2")
                 self.end_headers()
                 self.wfile.write(b"ok")
-                # Shut down in a daemon thread so we don't deadlock
-                threading.Thread(target=server.shutdown, daemon=True).start()
+                done.set()
                 return
 
             # Serve the Link HTML page
-            html = _LINK_HTML.replace("{{LINK_TOKEN}}", link_token)
             self.send_response(200)
-            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(page)))
             self.end_headers()
-            self.wfile.write(html.encode())
+            self.wfile.write(page)
 
         def log_message(self, format: str, *args: Any) -> None:
             # Suppress request logs
             pass
 
-    server = HTTPServer(("127.0.0.1", port), LinkHandler)
-    url = f"http://127.0.0.1:{port}"
-    webbrowser.open(url)
-    server.serve_forever()
+    def serve() -> None:
+        try:
+            server.serve_forever(poll_interval=0.1)
+        finally:
+            # Don't leave the caller waiting if the loop dies early
+            done.set()
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), LinkHandler)
+    try:
+        threading.Thread(target=serve, daemon=True).start()
+        url = f"http://127.0.0.1:{port}"
+        webbrowser.open(url)
+        done.wait()
+        server.shutdown()
+    finally:
+        server.server_close()
 
     if result.get("cancelled"):
         raise AdapterError("Plaid Link flow was cancelled by the user.")
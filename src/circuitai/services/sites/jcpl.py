@@ -296,10 +296,11 @@ class JCPLSite(BaseSite):
             from pathlib import Path
             import tempfile
 
-            screenshot_path = Path(tempfile.mktemp(suffix=".png"))
-            self.page.screenshot(path=str(screenshot_path), full_page=True)
+            with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
+                screenshot_path = Path(f.name)
 
             try:
+                self.page.screenshot(path=str(screenshot_path), full_page=True)
                 extracted = capture_svc.extract_from_screenshot(screenshot_path)
                 # Convert vision API format to our billing format
                 balance = extracted.get("balance_cents")
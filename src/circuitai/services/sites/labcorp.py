@@ -455,10 +455,11 @@ class LabCorpSite(BaseSite):
             from pathlib import Path
             import tempfile
 
-            screenshot_path = Path(tempfile.mktemp(suffix=".png"))
-            self.page.screenshot(path=str(screenshot_path), full_page=True)
+            with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
+                screenshot_path = Path(f.name)
 
             try:
+                self.page.screenshot(path=str(screenshot_path), full_page=True)
                 import base64
                 import json as json_mod
 
@@ -206,7 +206,8 @@ class SubscriptionService:
             expected_interval = _FREQ_INTERVALS[frequency]
             next_charge = (dates[-1] + timedelta(days=expected_interval)).isoformat()
 
-            sub = Subscription(
+            # All fields are computed above, so skip validation
+            sub = Subscription.model_construct(
                 name=vendor.title(),
                 provider=vendor.title(),
                 amount_cents=avg_amount,
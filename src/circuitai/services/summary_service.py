@@ -30,15 +30,14 @@ class SummaryService:
         """Get a complete financial summary."""
         bill_summary = self.bills.get_summary()
         acct_total = self.accounts.get_total_balance()
-        card_total = self.cards.get_total_balance()
+        card_totals = self.cards.get_totals()
+        card_total = card_totals["balance_cents"]
         inv_perf = self.investments.get_performance()
         overdue = self.deadlines.get_overdue()
         upcoming_deadlines = self.deadlines.get_upcoming(within_days=7)
 
         # Net worth estimate
-        mortgage_balance = sum(
-            m.balance_cents for m in self.mortgages.list_mortgages()
-        )
+        mortgage_balance = self.mortgages.get_total_balance()
         net_worth = acct_total + inv_perf["total_value_cents"] - card_total - mortgage_balance
 
         return {
@@ -49,7 +48,7 @@ class SummaryService:
             },
             "cards": {
                 "total_balance_cents": card_total,
-                "total_limit_cents": self.cards.get_total_limit(),
+                "total_limit_cents": card_totals["limit_cents"],
                 "snapshot": self.cards.get_snapshot(),
             },
             "bills": bill_summary,
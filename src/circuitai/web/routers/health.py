@@ -45,7 +45,7 @@ async def health_dashboard(
         "SELECT m.*, r.result_date FROM lab_markers m "
         "JOIN lab_panels p ON m.lab_panel_id = p.id "
         "JOIN lab_results r ON p.lab_result_id = r.id "
-        "WHERE m.flag != 'normal' AND r.status != 'reviewed' AND r.is_active = 1 "
+        "WHERE m.is_abnormal = 1 AND r.status != 'reviewed' AND r.is_active = 1 "
         "ORDER BY r.result_date DESC, m.marker_name",
     )
     all_flagged = [dict(r) for r in flagged_rows]
@@ -7,7 +7,7 @@ import pytest
 
 from circuitai.core.database import DatabaseConnection
 from circuitai.core.migrations import initialize_database
-from circuitai.services.bill_service import BillService
+from circuitai.services.bill_service import BillService, _due_in_next_month, next_due_date
 
 
 @pytest.fixture
@@ -77,6 +77,44 @@ class TestBillService:
         payments = svc.get_payments(bill.id)
         assert len(payments) == 2
 
+    def test_pay_bill_many(self, svc):
+        bill = svc.add_bill(name="Gas", amount_cents=8000)
+        payments = svc.pay_bill_many(bill.id, [
+            (8000, "2026-01-15", "jan"),
+            (8200, "2026-02-15", "feb"),
+        ])
+        assert len(payments) == 2
+        stored = svc.get_payments(bill.id)
+        assert [p.paid_date for p in stored] == ["2026-02-15", "2026-01-15"]
+        assert stored[0].amount_cents == 8200
+
+    def test_get_last_paid_dates(self, svc):
+        gas = svc.add_bill(name="Gas", amount_cents=8000)
+        water = svc.add_bill(name="Water", amount_cents=6750)
+        unpaid = svc.add_bill(name="New", amount_cents=100)
+        svc.pay_bill(gas.id, paid_date="2026-01-15")
+        svc.pay_bill(gas.id, paid_date="2026-02-15")
+        svc.pay_bill(water.id, paid_date="2026-01-20")
+        assert svc.get_last_paid_dates([gas.id, water.id, unpaid.id]) == {
+            gas.id: "2026-02-15", water.id: "2026-01-20",
+        }
+        assert svc.get_last_paid_dates([]) == {}
+
+    def test_get_due_soon_across_month_end(self, svc):
+        from datetime import date
+        svc.add_bill(name="Rent", amount_cents=100, due_day=1)
+        svc.add_bill(name="Late", amount_cents=100, due_day=30)
+        svc.add_bill(name="Mid", amount_cents=100, due_day=15)
+        # Jan 31: the 30th has passed and Feb has no 30th, so it clamps to Feb 28
+        due = svc.bills.get_due_soon(within_days=28, today=date(2025, 1, 31))
+        assert [b.name for b in due] == ["Rent", "Mid", "Late"]
+        due = svc.bills.get_due_soon(within_days=7, today=date(2025, 12, 28))
+        assert [b.name for b in due] == ["Rent", "Late"]
+
+    def test_pay_bill_many_empty(self, svc):
+        bill = svc.add_bill(name="Gas", amount_cents=8000)
+        assert svc.pay_bill_many(bill.id, []) == []
+
     def test_search_bills(self, svc):
         svc.add_bill(name="JCPL Electric", provider="JCPL")
         svc.add_bill(name="American Water", provider="American Water")
@@ -93,6 +131,23 @@ class TestBillService:
         assert summary["yearly_total_cents"] == 120000
         assert summary["estimated_monthly_cents"] == 10000 + 10000  # monthly + yearly/12
 
+    def test_get_summary_counts_active_only(self, svc):
+        svc.add_bill(name="Quarterly", amount_cents=30000, frequency="quarterly")
+        svc.add_bill(name="One-off", amount_cents=5000, frequency="one-time")
+        gone = svc.add_bill(name="Old", amount_cents=9999, frequency="monthly")
+        svc.delete_bill(gone.id)
+        summary = svc.get_summary()
+        assert summary["total_bills"] == 2
+        assert summary["monthly_total_cents"] == 0
+        assert summary["estimated_monthly_cents"] == 10000
+
+    def test_get_summary_estimate_leaves_out_weekly(self, svc):
+        svc.add_bill(name="Monthly", amount_cents=10000, frequency="monthly")
+        svc.add_bill(name="Weekly", amount_cents=2000, frequency="weekly")
+        summary = svc.get_summary()
+        assert summary["total_bills"] == 2
+        assert summary["estimated_monthly_cents"] == 10000
+
     def test_validation_no_name(self, svc):
         from circuitai.core.exceptions import ValidationError
         with pytest.raises(ValidationError, match="name"):
@@ -104,6 +159,24 @@ class TestBillService:
             svc.add_bill(name="Bad", amount_cents=-100)
 
 
+class TestDueDates:
+    def test_next_month_clamps_to_month_end(self):
+        from datetime import date
+        assert _due_in_next_month(2025, 1, 31) == date(2025, 2, 28)
+        assert _due_in_next_month(2024, 1, 30) == date(2024, 2, 29)
+        assert _due_in_next_month(2025, 12, 31) == date(2026, 1, 31)
+        assert _due_in_next_month(2025, 3, 31) == date(2025, 4, 30)
+
+    def test_next_due_date_for_given_today(self):
+        from datetime import date
+        assert next_due_date(15, date(2025, 3, 10)) == date(2025, 3, 15)
+        assert next_due_date(10, date(2025, 3, 10)) == date(2025, 3, 10)
+        assert next_due_date(31, date(2025, 2, 20)) == date(2025, 2, 28)
+        # Already past this month, and next month is shorter
+        assert next_due_date(30, date(2025, 1, 31)) == date(2025, 2, 28)
+        assert next_due_date(5, date(2025, 12, 20)) == date(2026, 1, 5)
+
+
 class TestBillDeadlineIntegration:
     """Tests for auto-creating deadlines from bills (#29)."""
 
@@ -192,6 +192,19 @@ class TestCredentials:
 
         assert svc.get_credentials("jcpl") is None
 
+    @patch("circuitai.services.browser_service.keyring")
+    def test_get_credentials_cached(self, mock_keyring, db):
+        from circuitai.services.browser_service import BrowserService
+
+        svc = BrowserService(db)
+        mock_keyring.get_password.side_effect = lambda service, key: (
+            "user@test.com" if key == "_username" else "pass"
+        )
+
+        assert svc.get_credentials("jcpl") == ("user@test.com", "pass")
+        assert svc.has_credentials("jcpl") is True
+        assert mock_keyring.get_password.call_count == 2
+
 
 # ── Browser Launch Tests ────────────────────────────────────────────
 
@@ -208,7 +221,7 @@ class TestBrowserLaunch:
 
     @patch("circuitai.services.browser_service.sync_playwright", create=True)
     @patch("circuitai.services.browser_service.HAS_PLAYWRIGHT", True)
-    def test_launch_browser_visible(self, mock_sync_pw, db):
+    def test_launch_browser_visible(self, mock_sync_pw, db, tmp_path):
         from circuitai.services.browser_service import BrowserService
 
         svc = BrowserService(db)
@@ -216,58 +229,107 @@ class TestBrowserLaunch:
         mock_pw = MagicMock()
         mock_sync_pw.return_value.start.return_value = mock_pw
         mock_page = MagicMock()
-        mock_context = MagicMock()
-        mock_context.pages = [mock_page]
-        mock_pw.chromium.launch_persistent_context.return_value = mock_context
+        mock_browser = mock_pw.chromium.launch.return_value
+        mock_browser.new_context.return_value.new_page.return_value = mock_page
 
-        _browser, _context, page = svc.launch_browser()
+        with patch("circuitai.services.browser_service.STORAGE_STATE_PATH", tmp_path / "data" / "state.json"):
+            _browser, _context, page = svc.launch_browser()
 
-        call_kwargs = mock_pw.chromium.launch_persistent_context.call_args
-        assert call_kwargs.kwargs["headless"] is False
-        assert page is mock_page
+            call_kwargs = mock_pw.chromium.launch.call_args
+            assert call_kwargs.kwargs["headless"] is False
+            assert page is mock_page
+            assert (tmp_path / "data").stat().st_mode & 0o777 == 0o700
 
-        svc.close_browser()
+            svc.close_browser()
 
     @patch("circuitai.services.browser_service.sync_playwright", create=True)
     @patch("circuitai.services.browser_service.HAS_PLAYWRIGHT", True)
-    def test_launch_browser_persistent_context(self, mock_sync_pw, db):
-        from circuitai.services.browser_service import BrowserService, BROWSER_DATA_DIR
+    def test_launch_browser_restores_storage_state(self, mock_sync_pw, db, tmp_path):
+        from circuitai.services.browser_service import BrowserService
 
         svc = BrowserService(db)
+        state_path = tmp_path / "storage_state.json"
+        state_path.write_text("{}")
 
         mock_pw = MagicMock()
         mock_sync_pw.return_value.start.return_value = mock_pw
-        mock_context = MagicMock()
-        mock_context.pages = [MagicMock()]
-        mock_pw.chromium.launch_persistent_context.return_value = mock_context
+        mock_browser = mock_pw.chromium.launch.return_value
 
-        svc.launch_browser()
-
-        call_args = mock_pw.chromium.launch_persistent_context.call_args
-        user_data_dir = call_args.kwargs.get("user_data_dir") or (call_args.args[0] if call_args.args else "")
-        assert str(BROWSER_DATA_DIR) in user_data_dir
-
-        svc.close_browser()
+        with patch("circuitai.services.browser_service.STORAGE_STATE_PATH", state_path):
+            svc.launch_browser()
+            call_kwargs = mock_browser.new_context.call_args
+            assert call_kwargs.kwargs["storage_state"] == str(state_path)
+            svc.close_browser()
 
     @patch("circuitai.services.browser_service.sync_playwright", create=True)
     @patch("circuitai.services.browser_service.HAS_PLAYWRIGHT", True)
-    def test_close_browser_cleanup(self, mock_sync_pw, db):
+    def test_close_browser_cleanup(self, mock_sync_pw, db, tmp_path):
         from circuitai.services.browser_service import BrowserService
 
         svc = BrowserService(db)
+        state_path = tmp_path / "storage_state.json"
 
         mock_pw = MagicMock()
         mock_sync_pw.return_value.start.return_value = mock_pw
-        mock_context = MagicMock()
-        mock_context.pages = [MagicMock()]
-        mock_pw.chromium.launch_persistent_context.return_value = mock_context
+        mock_browser = mock_pw.chromium.launch.return_value
+        mock_context = mock_browser.new_context.return_value
+        mock_context.storage_state.return_value = {"cookies": [{"name": "sid"}], "origins": []}
 
-        svc.launch_browser()
-        svc.close_browser()
+        with patch("circuitai.services.browser_service.STORAGE_STATE_PATH", state_path):
+            svc.launch_browser()
+            svc.close_browser()
 
+        mock_context.storage_state.assert_called_once_with()
+        assert json.loads(state_path.read_text())["cookies"] == [{"name": "sid"}]
+        assert state_path.stat().st_mode & 0o777 == 0o600
         mock_context.close.assert_called_once()
+        mock_browser.close.assert_called_once()
         mock_pw.stop.assert_called_once()
 
+    @patch("circuitai.services.browser_service.sync_playwright", create=True)
+    @patch("circuitai.services.browser_service.HAS_PLAYWRIGHT", True)
+    def test_launch_browser_imports_legacy_profile(self, mock_sync_pw, db, tmp_path):
+        from circuitai.services.browser_service import BrowserService
+
+        svc = BrowserService(db)
+        (tmp_path / "Default").mkdir()
+        state_path = tmp_path / "storage_state.json"
+
+        mock_pw = MagicMock()
+        mock_sync_pw.return_value.start.return_value = mock_pw
+        legacy = mock_pw.chromium.launch_persistent_context.return_value
+        legacy.storage_state.return_value = {"cookies": [{"name": "old"}], "origins": []}
+        mock_browser = mock_pw.chromium.launch.return_value
+
+        with patch("circuitai.services.browser_service.STORAGE_STATE_PATH", state_path):
+            svc.launch_browser()
+            assert mock_pw.chromium.launch_persistent_context.call_args.kwargs["user_data_dir"] == str(tmp_path)
+            legacy.close.assert_called_once()
+            assert json.loads(state_path.read_text())["cookies"] == [{"name": "old"}]
+            assert mock_browser.new_context.call_args.kwargs["storage_state"] == str(state_path)
+            svc.close_browser()
+
+    @patch("circuitai.services.browser_service.sync_playwright", create=True)
+    @patch("circuitai.services.browser_service.HAS_PLAYWRIGHT", True)
+    def test_recycle_context(self, mock_sync_pw, db, tmp_path):
+        from circuitai.services.browser_service import BrowserService
+
+        svc = BrowserService(db)
+
+        mock_pw = MagicMock()
+        mock_sync_pw.return_value.start.return_value = mock_pw
+        mock_browser = mock_pw.chromium.launch.return_value
+        first, second = MagicMock(), MagicMock()
+        mock_browser.new_context.side_effect = [first, second]
+
+        with patch("circuitai.services.browser_service.STORAGE_STATE_PATH", tmp_path / "state.json"):
+            svc.launch_browser()
+            page = svc.recycle_context()
+
+        first.close.assert_called_once()
+        assert page is second.new_page.return_value
+        svc.close_browser()
+
 
 # ── JCPL Login Tests ────────────────────────────────────────────────
 
@@ -676,16 +738,37 @@ class TestBrowseCLI:
         assert result.exit_code == 0
         assert "playwright" in result.output.lower()
 
+    @patch("circuitai.services.browser_service.sync_playwright", create=True)
     @patch("circuitai.services.browser_service.keyring")
     @patch("circuitai.services.browser_service.HAS_PLAYWRIGHT", True)
-    def test_sync_no_credentials(self, mock_keyring, cli_runner):
+    def test_sync_no_credentials(self, mock_keyring, mock_sync_pw, cli_runner):
         from circuitai.cli.main import cli
 
         mock_keyring.get_password.return_value = None
 
         result = cli_runner.invoke(cli, ["browse", "sync", "jcpl"], catch_exceptions=False)
         assert result.exit_code == 0
-        assert "No credentials" in result.output or "credentials" in result.output.lower()
+        assert "No credentials" in result.output
+        # Checked before the browser is started
+        mock_sync_pw.assert_not_called()
+        mock_keyring.get_password.assert_called_once_with("circuitai:jcpl", "_username")
+
+    @patch("circuitai.services.browser_service.sync_playwright", create=True)
+    @patch("circuitai.services.browser_service.keyring")
+    @patch("circuitai.services.browser_service.HAS_PLAYWRIGHT", True)
+    def test_sync_reports_launch_error(self, mock_keyring, mock_sync_pw, cli_runner):
+        from circuitai.cli.main import cli
+
+        stored = {
+            ("circuitai:jcpl", "_username"): "user@test.com",
+            ("circuitai:jcpl", "user@test.com"): "pass123",
+        }
+        mock_keyring.get_password.side_effect = lambda s, k: stored.get((s, k))
+        mock_sync_pw.return_value.start.side_effect = RuntimeError("chromium missing")
+
+        result = cli_runner.invoke(cli, ["browse", "sync", "jcpl"], catch_exceptions=False)
+        assert result.exit_code == 0
+        assert "chromium missing" in result.output
 
     @patch("circuitai.services.browser_service.sync_playwright", create=True)
     @patch("circuitai.services.browser_service.keyring")
@@ -1,5 +1,6 @@
 """Tests for screen capture service — fingerprints, extraction, import, dedup, migration."""
 
+import hashlib
 import json
 import tempfile
 from pathlib import Path
@@ -9,7 +10,11 @@ import pytest
 
 from circuitai.core.database import DatabaseConnection
 from circuitai.core.migrations import get_schema_version, initialize_database
-from circuitai.services.capture_service import CaptureService, compute_txn_fingerprint
+from circuitai.services.capture_service import (
+    CaptureService,
+    compute_txn_fingerprint,
+    compute_txn_fingerprints,
+)
 
 
 @pytest.fixture
@@ -101,6 +106,16 @@ class TestMigrationV3:
         count = db.fetchone("SELECT COUNT(*) as c FROM account_transactions WHERE txn_fingerprint IS NULL")
         assert count["c"] == 3
 
+    def test_fingerprint_lookup_uses_index(self, db):
+        """Dedup lookups probe the partial fingerprint indexes, not a table scan."""
+        plan = db.fetchall(
+            "EXPLAIN QUERY PLAN SELECT txn_fingerprint FROM txn_fingerprints WHERE txn_fingerprint IN (?, ?)",
+            ("a", "b"),
+        )
+        details = " ".join(row["detail"] for row in plan)
+        assert "idx_acct_txn_fingerprint" in details
+        assert "idx_card_txn_fingerprint" in details
+
 
 # ── Fingerprint tests ────────────────────────────────────────────
 
@@ -139,6 +154,29 @@ class TestFingerprint:
         fp = compute_txn_fingerprint("2025-01-15", "Test", -100)
         assert all(c in "0123456789abcdef" for c in fp)
 
+    def test_stored_value_is_stable(self):
+        # Fingerprints are persisted and matched across sources; the encoding must never drift
+        fp = compute_txn_fingerprint("2025-01-15", "Amazon.com*AB12", -4299)
+        assert fp == hashlib.sha256(b"2025-01-15|AMAZONCOMAB12|-4299").hexdigest()[:16]
+        assert fp == "41430ecadb04068e"
+
+    def test_normalization_matches_regex(self):
+        import re
+
+        def reference(txn_date, description, amount_cents):
+            normalized = re.sub(r"[^A-Z0-9]", "", description.upper())
+            return hashlib.sha256(f"{txn_date}|{normalized}|{amount_cents}".encode()).hexdigest()[:16]
+
+        samples = ["Café Déjà Vu #12", "straße", "ﬁne print", "İstanbul ½ ①", "tab\tnl\n", "", "!!!"]
+        for desc in samples:
+            assert compute_txn_fingerprint("2025-01-15", desc, -100) == reference("2025-01-15", desc, -100)
+        entries = [("2025-01-15", desc, -100) for desc in samples]
+        assert compute_txn_fingerprints(entries) == [reference(*e) for e in entries]
+
+    def test_bulk_matches_single(self):
+        entries = [("2025-01-15", "Amazon.com", -4299), ("2025-01-16", "JCPL Bill", 14257)]
+        assert compute_txn_fingerprints(entries) == [compute_txn_fingerprint(*e) for e in entries]
+
 
 # ── Credentials tests ────────────────────────────────────────────
 
@@ -164,6 +202,13 @@ class TestCaptureCredentials:
         svc = CaptureService(db)
         assert not svc.is_configured()
 
+    def test_state_reads_are_cached(self, db):
+        CaptureService(db).save_api_key("test-key")
+        svc = CaptureService(db)
+        assert svc._get_api_key() == "test-key"
+        db.execute("DELETE FROM adapter_state")
+        assert svc._get_api_key() == "test-key"
+
 
 # ── Screenshot tests ─────────────────────────────────────────────
 
@@ -186,6 +231,9 @@ class TestScreenshot:
                 from circuitai.core.exceptions import AdapterError
                 with pytest.raises(AdapterError, match="cancelled or failed"):
                     svc.take_screenshot()
+                # The pre-created temp file is removed on failure
+                target = Path(mock_run.call_args.args[0][-1])
+                assert not target.exists()
 
 
 # ── Vision extraction tests ──────────────────────────────────────
@@ -256,6 +304,28 @@ class TestVisionExtraction:
                 assert result["account_name"] == "Test"
                 assert result["transactions"] == []
 
+    def test_invalid_json_raises_adapter_error(self, db):
+        svc = self._make_svc(db)
+        mock_message = MagicMock()
+        mock_message.content = [MagicMock(text="```json\n{not json}\n```")]
+
+        with patch("circuitai.services.capture_service.HAS_ANTHROPIC", True):
+            with patch("circuitai.services.capture_service.anthropic", create=True) as mock_anthropic:
+                mock_client = MagicMock()
+                mock_client.messages.create.return_value = mock_message
+                mock_anthropic.Anthropic.return_value = mock_client
+
+                with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
+                    f.write(b"\x89PNG\r\n\x1a\n" + b"\x00" * 100)
+                    tmp_path = Path(f.name)
+
+                from circuitai.core.exceptions import AdapterError
+                try:
+                    with pytest.raises(AdapterError, match="invalid JSON"):
+                        svc.extract_from_screenshot(tmp_path)
+                finally:
+                    tmp_path.unlink(missing_ok=True)
+
     def test_no_anthropic_package_raises(self, db):
         svc = self._make_svc(db)
         with patch("circuitai.services.capture_service.HAS_ANTHROPIC", False):
@@ -292,6 +362,41 @@ class TestImportAndDedup:
         acct = db.fetchone("SELECT balance_cents FROM accounts WHERE id = ?", (aid,))
         assert acct["balance_cents"] == 95000
 
+    def test_unknown_account_reported_not_raised(self, db):
+        svc = CaptureService(db)
+        data = {
+            "balance_cents": 100,
+            "transactions": [{"date": "2025-01-15", "description": "COFFEE", "amount_cents": -450}],
+        }
+        result = svc.import_transactions(data, "no-such-account", "account")
+        assert result["imported"] == 0
+        assert result["errors"][0] == "Account not found: no-such-account"
+        assert result["balance_updated"] is False
+
+    def test_batch_failure_falls_back_per_row(self, db):
+        """A fingerprint stored after the dedup lookup fails only its own row."""
+        aid = _seed_account(db)
+        svc = CaptureService(db)
+        svc.import_transactions(
+            {"transactions": [{"date": "2025-01-15", "description": "COFFEE", "amount_cents": -450}]},
+            aid, "account",
+        )
+        data = {
+            "balance_cents": 90000,
+            "transactions": [
+                {"date": "2025-01-14", "description": "BAKERY", "amount_cents": -300},
+                {"date": "2025-01-15", "description": "COFFEE", "amount_cents": -450},
+                {"date": "2025-01-16", "description": "BOOKS", "amount_cents": -2000},
+            ],
+        }
+        with patch("circuitai.services.capture_service.existing_fingerprints", return_value=set()):
+            result = svc.import_transactions(data, aid, "account")
+        assert result["imported"] == 2
+        assert len(result["errors"]) == 1 and result["errors"][0].startswith("Transaction 1:")
+        assert result["balance_updated"] is True
+        rows = db.fetchall("SELECT * FROM account_transactions WHERE account_id = ?", (aid,))
+        assert len(rows) == 3
+
     def test_same_data_twice_skips(self, db):
         aid = _seed_account(db)
         svc = CaptureService(db)
@@ -406,6 +511,16 @@ class TestImportAndDedup:
         assert result["skipped"] == 0
         assert result["balance_updated"] is True
 
+    def test_duplicate_within_batch_skipped(self, db):
+        aid = _seed_account(db)
+        svc = CaptureService(db)
+
+        txn = {"date": "2025-01-15", "description": "AMAZON", "amount_cents": -4299, "category": ""}
+        result = svc.import_transactions({"transactions": [txn, dict(txn)]}, aid, "account")
+        assert result["imported"] == 1
+        assert result["skipped"] == 1
+        assert result["errors"] == []
+
 
 # ── Snap orchestration test ──────────────────────────────────────
 
@@ -438,3 +553,98 @@ class TestSnapOrchestration:
         assert result["balance_updated"] is True
         # Temp file should be cleaned up
         assert not tmp_path.exists()
+
+    def test_snap_many_merges_pages(self, db):
+        aid = _seed_account(db)
+        svc = CaptureService(db)
+        svc.save_api_key("test-key")
+
+        shared = {"date": "2025-01-20", "description": "GROCERY", "amount_cents": -2500, "category": "food"}
+        pages = [
+            {"balance_cents": None, "transactions": [shared]},
+            {"balance_cents": 80000, "transactions": [
+                dict(shared),
+                {"date": "2025-01-19", "description": "GAS", "amount_cents": -4000, "category": ""},
+            ]},
+        ]
+
+        paths = []
+        for _ in pages:
+            with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
+                f.write(b"\x89PNG" + b"\x00" * 100)
+                paths.append(Path(f.name))
+
+        by_path = dict(zip(paths, pages))
+        with patch.object(svc, "_vision_client", return_value=MagicMock()):
+            with patch.object(svc, "take_screenshot", side_effect=paths):
+                with patch.object(CaptureService, "_extract", side_effect=lambda client, p: by_path[p]):
+                    with patch.object(svc, "run_statement_linking", return_value={"matched": 0}):
+                        result = svc.snap_many(aid, "account", pages=2)
+
+        assert result["imported"] == 2
+        assert result["skipped"] == 1
+        assert result["balance_updated"] is True
+        assert not any(p.exists() for p in paths)
+
+    def test_snap_many_extracts_while_capturing(self, db):
+        """Page 1 is sent for extraction before the user captures page 2."""
+        import threading
+
+        svc = CaptureService(db)
+        first_extracted = threading.Event()
+        shots = iter([Path("/tmp/page-a.png"), Path("/tmp/page-b.png")])
+        overlapped = []
+
+        def take_screenshot():
+            path = next(shots)
+            if path.name == "page-b.png":
+                overlapped.append(first_extracted.wait(timeout=5))
+            return path
+
+        def extract(client, path):
+            if path.name == "page-a.png":
+                first_extracted.set()
+            return {"transactions": []}
+
+        with patch.object(svc, "_vision_client", return_value=MagicMock()):
+            with patch.object(svc, "take_screenshot", side_effect=take_screenshot):
+                with patch.object(CaptureService, "_extract", side_effect=extract):
+                    result = svc.snap_many("acct", "account", pages=2)
+
+        assert overlapped == [True]
+        assert result["imported"] == 0
+
+    def test_snap_many_cancel_does_not_wait_for_extraction(self, db, tmp_path):
+        """Cancelling page 2 raises at once, without waiting on page 1's request."""
+        import threading
+        import time
+
+        from circuitai.core.exceptions import AdapterError
+
+        svc = CaptureService(db)
+        release = threading.Event()
+        page = tmp_path / "page-a.png"
+        page.write_bytes(b"\x89PNG")
+        shots = iter([page])
+
+        def take_screenshot():
+            try:
+                return next(shots)
+            except StopIteration:
+                raise AdapterError("Screenshot cancelled") from None
+
+        def extract(client, path):
+            release.wait(timeout=5)
+            return {"transactions": []}
+
+        with patch.object(svc, "_vision_client", return_value=MagicMock()):
+            with patch.object(svc, "take_screenshot", side_effect=take_screenshot):
+                with patch.object(CaptureService, "_extract", side_effect=extract):
+                    started = time.monotonic()
+                    with pytest.raises(AdapterError, match="cancelled"):
+                        svc.snap_many("acct", "account", pages=2)
+                    elapsed = time.monotonic() - started
+                    release.set()
+
+        assert elapsed < 2
+        assert not page.exists()
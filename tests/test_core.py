@@ -74,6 +74,37 @@ class TestDatabase:
         assert row["name"] == "hello"
         conn.close()
 
+    def test_connection_pragmas(self, tmp_dir):
+        conn = DatabaseConnection(db_path=tmp_dir / "test.db")
+        conn.connect()
+        assert conn.fetchcolumn("PRAGMA journal_mode") == ["wal"]
+        assert conn.fetchcolumn("PRAGMA synchronous") == [1]  # NORMAL
+        assert conn.fetchcolumn("PRAGMA foreign_keys") == [1]
+        assert conn.fetchcolumn("PRAGMA busy_timeout") == [5000]
+        conn.close()
+
+    def test_fetchall_dicts(self, tmp_dir):
+        conn = DatabaseConnection(db_path=tmp_dir / "test.db")
+        conn.connect()
+        conn.execute("CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT)")
+        conn.executemany("INSERT INTO test VALUES (?, ?)", [(1, "a"), (2, "b")])
+        conn.commit()
+        rows = conn.fetchall_dicts("SELECT * FROM test ORDER BY id")
+        assert rows == [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+        assert conn.fetchall_dicts("SELECT * FROM test WHERE id = ?", (99,)) == []
+        conn.close()
+
+    def test_fetchcolumn(self, tmp_dir):
+        conn = DatabaseConnection(db_path=tmp_dir / "test.db")
+        conn.connect()
+        conn.execute("CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT)")
+        conn.executemany("INSERT INTO test VALUES (?, ?)", [(1, "a"), (2, "b")])
+        conn.commit()
+        assert conn.fetchcolumn("SELECT name FROM test ORDER BY id") == ["a", "b"]
+        # Connection-level row factory is untouched
+        assert conn.fetchone("SELECT name FROM test WHERE id = 1")["name"] == "a"
+        conn.close()
+
     def test_transaction_rollback(self, tmp_dir):
         conn = DatabaseConnection(db_path=tmp_dir / "test.db")
         conn.connect()
@@ -91,6 +122,85 @@ class TestDatabase:
         assert row["cnt"] == 0
         conn.close()
 
+    def test_transaction_defers_inner_commits(self, tmp_dir):
+        conn = DatabaseConnection(db_path=tmp_dir / "test.db")
+        conn.connect()
+        conn.execute("CREATE TABLE test (id INTEGER PRIMARY KEY)")
+        conn.commit()
+
+        with pytest.raises(ValueError):
+            with conn.transaction():
+                conn.execute("INSERT INTO test VALUES (1)")
+                conn.commit()  # e.g. from a repository insert
+                with conn.transaction():
+                    conn.execute("INSERT INTO test VALUES (2)")
+                raise ValueError("oops")
+
+        row = conn.fetchone("SELECT COUNT(*) as cnt FROM test")
+        assert row["cnt"] == 0
+
+        with conn.transaction():
+            conn.execute("INSERT INTO test VALUES (3)")
+            conn.commit()
+        assert not conn.conn.in_transaction
+        assert conn.fetchone("SELECT COUNT(*) as cnt FROM test")["cnt"] == 1
+        conn.close()
+
+    def test_transaction_interrupt_releases_lock(self, tmp_dir):
+        conn = DatabaseConnection(db_path=tmp_dir / "test.db")
+        conn.connect()
+        conn.execute("CREATE TABLE test (id INTEGER PRIMARY KEY)")
+        conn.commit()
+
+        with pytest.raises(KeyboardInterrupt):
+            with conn.transaction():
+                conn.execute("INSERT INTO test VALUES (1)")
+                raise KeyboardInterrupt
+        assert not conn.conn.in_transaction
+
+        # Later writes commit and are visible to another connection
+        conn.execute("INSERT INTO test VALUES (2)")
+        conn.commit()
+        other = DatabaseConnection(db_path=tmp_dir / "test.db")
+        other.connect()
+        assert other.fetchcolumn("SELECT id FROM test") == [2]
+        other.close()
+        conn.close()
+
+    def test_nested_transaction_failure_is_isolated(self, tmp_dir):
+        conn = DatabaseConnection(db_path=tmp_dir / "test.db")
+        conn.connect()
+        conn.execute("CREATE TABLE test (id INTEGER PRIMARY KEY)")
+        conn.commit()
+
+        with conn.transaction():
+            conn.execute("INSERT INTO test VALUES (1)")
+            try:
+                with conn.transaction():
+                    conn.execute("INSERT INTO test VALUES (2)")
+                    raise ValueError("oops")
+            except ValueError:
+                pass
+            with conn.transaction():
+                conn.execute("INSERT INTO test VALUES (3)")
+        assert not conn.conn.in_transaction
+        assert conn.fetchcolumn("SELECT id FROM test ORDER BY id") == [1, 3]
+        conn.close()
+
+    def test_read_snapshot(self, tmp_dir):
+        conn = DatabaseConnection(db_path=tmp_dir / "test.db")
+        conn.connect()
+        conn.execute("CREATE TABLE test (id INTEGER PRIMARY KEY)")
+        conn.commit()
+
+        with conn.read_snapshot():
+            assert conn.conn.in_transaction
+            with conn.read_snapshot():
+                conn.fetchall("SELECT * FROM test")
+            assert conn.conn.in_transaction
+        assert not conn.conn.in_transaction
+        conn.close()
+
 
 class TestMigrations:
     def test_initialize_creates_tables(self, db):
@@ -113,3 +223,20 @@ class TestMigrations:
         assert "activities" in table_names
         assert "tags" in table_names
         assert "schema_version" in table_names
+
+
+class TestFormatter:
+    def test_dollars(self):
+        from circuitai.output.formatter import dollars, dollars_many
+        assert dollars(0) == "$0.00"
+        assert dollars(123456789) == "$1,234,567.89"
+        assert dollars(-505) == "-$5.05"
+        assert dollars_many([100, -1, 99999]) == ["$1.00", "-$0.01", "$999.99"]
+
+    def test_format_date(self):
+        from circuitai.output.formatter import format_date
+        assert format_date("2025-03-07") == "Mar 07, 2025"
+        assert format_date("2025-03-07") == "Mar 07, 2025"
+        assert format_date(None) == "—"
+        assert format_date("not-a-date") == "not-a-date"
+        assert format_date.cache_info().hits >= 1
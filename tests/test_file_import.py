@@ -103,3 +103,16 @@ class TestGetFileType:
 
     def test_pdf_uppercase(self):
         assert get_file_type("/path/to/BILL.PDF") == "pdf"
+
+
+class TestImportFile:
+    """Tests for import_file() routing."""
+
+    def test_explicit_file_type_skips_extension(self, tmp_path):
+        from circuitai.core.exceptions import AdapterError
+        from circuitai.services.file_import_service import import_file
+
+        f = tmp_path / "statement.csv"
+        f.write_text("date,description,amount\n")
+        with pytest.raises(AdapterError, match="xlsx"):
+            import_file(None, str(f), account_id="acc", file_type="xlsx")
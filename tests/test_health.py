@@ -252,6 +252,22 @@ class TestLabMarkerRepository:
         markers = marker_repo.get_for_panel(p.id)
         assert len(markers) == 2
 
+    def test_get_for_panel_rows(self, db, result_repo, panel_repo, marker_repo):
+        r = LabResult(patient_name="Test")
+        result_repo.insert(r)
+        p = LabPanel(lab_result_id=r.id, panel_name="Lipid")
+        panel_repo.insert(p)
+        m = LabMarker(lab_panel_id=p.id, marker_name="LDL", value="140", reference_high="100", flag="high")
+        marker_repo.insert(m)
+
+        rows = marker_repo.get_for_panel_rows(p.id)
+        assert len(rows) == 1
+        row = rows[0]
+        assert not hasattr(row, "__dict__")
+        assert row.is_flagged
+        assert row.reference_range == "< 100"
+        assert row.to_model().model_dump() == m.model_dump()
+
     def test_get_flagged_for_result(self, lab_svc):
         result = _seed_full_result(lab_svc)
         flagged = lab_svc.markers.get_flagged_for_result(result["result_id"])
@@ -272,6 +288,13 @@ class TestLabMarkerRepository:
         flagged = lab_svc.markers.get_all_flagged()
         assert len(flagged) == 0
 
+    def test_is_abnormal_generated_column(self, db, lab_svc):
+        _seed_full_result(lab_svc)
+        rows = db.fetchall("SELECT flag, is_abnormal FROM lab_markers")
+        assert rows
+        for row in rows:
+            assert row["is_abnormal"] == (0 if row["flag"] == "normal" else 1)
+
 
 # ── Fingerprint tests ─────────────────────────────────────────
 
@@ -297,6 +320,10 @@ class TestLabFingerprint:
         fp2 = compute_lab_fingerprint("2026-02-15", "LabCorp", "John P Patel")
         assert fp1 == fp2
 
+    def test_stable_value(self):
+        # Persisted in lab_results.report_fingerprint; must never change
+        assert compute_lab_fingerprint("2026-02-15", "LabCorp", "John Patel") == "6b6c074ac2421312"
+
 
 # ── PDF text extraction tests ─────────────────────────────────
 
@@ -317,6 +344,21 @@ class TestPdfTextExtraction:
         data = lab_svc.extract_from_pdf_text(text)
         assert data["provider"] == "Quest Diagnostics"
 
+    def test_extract_provider_bioreference(self, lab_svc):
+        data = lab_svc.extract_from_pdf_text("BIOREFERENCE LABORATORIES\nResults")
+        assert data["provider"] == "BioReference"
+
+    def test_extract_provider_labcorp_wins_over_earlier_quest(self, lab_svc):
+        text = "Requested by: Dr. Smith\nLabCorp\nResults"
+        data = lab_svc.extract_from_pdf_text(text)
+        assert data["provider"] == "LabCorp"
+
+    def test_extract_iso_dates(self, lab_svc):
+        text = "Date Collected: 2026-02-10\nDate Reported: 2026-02-15 09:30"
+        data = lab_svc.extract_from_pdf_text(text)
+        assert data["order_date"] == "2026-02-10"
+        assert data["result_date"] == "2026-02-15"
+
     def test_extract_dates(self, lab_svc):
         text = "Date Collected: 02/10/2026\nDate Reported: 02/15/2026"
         data = lab_svc.extract_from_pdf_text(text)
@@ -357,6 +399,55 @@ class TestPdfTextExtraction:
         marker = data["panels"][0]["markers"][0]
         assert marker["flag"] == "high"
 
+    def test_extract_labcorp_report(self, lab_svc):
+        text = (
+            "Doe, John A 01/15/1980 Patient Report\n"
+            "Date Collected: 02/01/2025\n"
+            "labcorp\n"
+            "CBC With Differential/Platelet\n"
+            "Test Current Result and Flag Previous Result and Date Units Reference Interval\n"
+            "WBC 01 4.8 5.7 11/14/2024 x10E3/uL 3.4-10.8\n"
+            "RBC 01 5.90 5.50 11/14/2024 x10E6/uL 4.14-5.80 H\n"
+            "Please Note: the following\n"
+            "Doe, John A 01/15/1980 Patient Report\n"
+            "Comprehensive Metabolic Panel (14) (Cont.)\n"
+            "Test Current Result and Flag Previous Result and Date Units Reference Interval\n"
+            "eGFR 113 108 11/14/2024 mL/min/1.73 >59\n"
+            "BUN/Creatinine Ratio 13 12 11/14/2024 9-20\n"
+            "Protein 01 Negative Negative 11/14/2024 Negative/Trace\n"
+            "Troponin <0.01 <0.01 11/14/2024 ng/mL 0.00-0.04\n"
+            "PSA 01 1.2 1.1 11/14/2024 ng/mL Not Estab.\n"
+        )
+        data = lab_svc.extract_from_pdf_text(text)
+        assert data["patient_name"] == "John Doe"
+        assert data["provider"] == "LabCorp"
+        assert data["order_date"] == "2025-02-01"
+        assert [p["panel_name"] for p in data["panels"]] == [
+            "CBC With Differential/Platelet", "Comprehensive Metabolic Panel (14)",
+        ]
+        cbc, cmp_ = (p["markers"] for p in data["panels"])
+        assert cbc[0] == {
+            "marker_name": "WBC", "value": "4.8", "unit": "x10E3/uL",
+            "reference_low": "3.4", "reference_high": "10.8", "flag": "normal",
+        }
+        assert cbc[1]["flag"] == "high"
+        by_name = {m["marker_name"]: m for m in cmp_}
+        assert list(by_name) == ["eGFR", "BUN/Creatinine Ratio", "Protein", "Troponin", "PSA"]
+        assert (by_name["eGFR"]["unit"], by_name["eGFR"]["reference_low"]) == ("mL/min/1.73", "59")
+        bun = by_name["BUN/Creatinine Ratio"]
+        assert (bun["unit"], bun["reference_high"]) == ("", "20")
+        assert by_name["Protein"]["value"] == "Negative"
+        assert by_name["Troponin"]["value"] == "<0.01"
+        assert (by_name["PSA"]["unit"], by_name["PSA"]["reference_low"]) == ("ng/mL", "")
+
+    def test_labcorp_marker_name_with_leading_digit_token(self, lab_svc):
+        marker = lab_svc._parse_labcorp_marker_line(
+            "Vitamin D, 25-Hydroxy 38.2 40.1 11/14/2024 ng/mL 30.0-100.0"
+        )
+        assert marker["marker_name"] == "Vitamin D, 25-Hydroxy"
+        assert marker["value"] == "38.2"
+        assert (marker["reference_low"], marker["reference_high"]) == ("30.0", "100.0")
+
     def test_empty_text(self, lab_svc):
         data = lab_svc.extract_from_pdf_text("")
         assert data["patient_name"] == ""
@@ -451,6 +542,60 @@ class TestLabImport:
         panels = lab_svc.get_panels(result["result_id"])
         assert panels[0].panel_name == "General"
 
+    def test_import_from_pdf_checks_fingerprint_once(self, lab_svc, tmp_path):
+        pdf_path = tmp_path / "report.pdf"
+        pdf_path.write_bytes(b"%PDF-1.7 report")
+        with patch("circuitai.services.lab_service.HAS_PDFPLUMBER", True), \
+             patch("circuitai.services.lab_service.pdfplumber", create=True), \
+             patch.object(lab_svc, "extract_from_pdf_text", side_effect=lambda _: _sample_lab_data()), \
+             patch.object(lab_svc.results, "find_by_fingerprint",
+                          wraps=lab_svc.results.find_by_fingerprint) as lookup:
+            first = lab_svc.import_from_pdf(str(pdf_path))
+            assert first["duplicate"] is False
+            assert lookup.call_count == 1
+
+            # Same report content in a different file is caught by the fingerprint
+            pdf_path.write_bytes(b"%PDF-1.7 report, re-downloaded")
+            second = lab_svc.import_from_pdf(str(pdf_path))
+            assert second["duplicate"] is True
+            assert second["result_id"] == first["result_id"]
+
+    def test_import_from_pdf_same_file_skips_parsing(self, lab_svc, tmp_path):
+        pdf_path = tmp_path / "report.pdf"
+        pdf_path.write_bytes(b"%PDF-1.7 report")
+        with patch("circuitai.services.lab_service.HAS_PDFPLUMBER", True), \
+             patch("circuitai.services.lab_service.pdfplumber", create=True) as mock_pdfplumber, \
+             patch.object(lab_svc, "extract_from_pdf_text", side_effect=lambda _: _sample_lab_data()):
+            first = lab_svc.import_from_pdf(str(pdf_path))
+            mock_pdfplumber.open.reset_mock()
+
+            second = lab_svc.import_from_pdf(str(pdf_path))
+
+        mock_pdfplumber.open.assert_not_called()
+        assert second["duplicate"] is True
+        assert second["result_id"] == first["result_id"]
+
+        # A deleted result no longer short-circuits the import
+        lab_svc.delete_result(first["result_id"])
+        assert lab_svc.results.find_by_source_hash(lab_svc.get_result(first["result_id"]).source_hash) is None
+
+    def test_import_from_pdf_known_report_skips_vision(self, lab_svc, tmp_path):
+        first = _seed_full_result(lab_svc)
+        pdf_path = tmp_path / "scan.pdf"
+        pdf_path.write_bytes(b"%PDF-1.7 scan")
+        text_only = {**_sample_lab_data(), "panels": []}
+        with patch("circuitai.services.lab_service.HAS_PDFPLUMBER", True), \
+             patch("circuitai.services.lab_service.HAS_ANTHROPIC", True), \
+             patch("circuitai.services.lab_service.pdfplumber", create=True), \
+             patch.object(lab_svc, "extract_from_pdf_text", return_value=text_only), \
+             patch.object(lab_svc, "_get_api_key", return_value="sk-test"), \
+             patch.object(lab_svc, "extract_from_pdf_vision") as vision:
+            result = lab_svc.import_from_pdf(str(pdf_path))
+
+        vision.assert_not_called()
+        assert result["duplicate"] is True
+        assert result["result_id"] == first["result_id"]
+
     def test_import_empty_panels(self, lab_svc):
         data = {"patient_name": "Test", "provider": "LabCorp", "panels": []}
         result = lab_svc.import_lab_data(data)
@@ -477,6 +622,7 @@ class TestVisionExtraction:
 
         with patch("circuitai.services.lab_service.HAS_ANTHROPIC", True), \
              patch("circuitai.services.lab_service.HAS_PDFPLUMBER", True), \
+             patch("circuitai.services.lab_service.HAS_FITZ", False), \
              patch("circuitai.services.lab_service.anthropic") as mock_anthropic, \
              patch("circuitai.services.lab_service.pdfplumber") as mock_pdfplumber:
 
@@ -486,6 +632,7 @@ class TestVisionExtraction:
             mock_page = MagicMock()
             mock_img = MagicMock()
             mock_page.to_image.return_value = mock_img
+            mock_page.width, mock_page.height = 612, 792
 
             # Create a real temp file for the save
             import tempfile
@@ -493,7 +640,7 @@ class TestVisionExtraction:
                 f.write(b"fake png data")
                 temp_path = f.name
 
-            mock_img.save.side_effect = lambda p: Path(p).write_bytes(b"fake")
+            mock_img.save.side_effect = lambda buf, format: buf.write(b"fake")
             mock_pdf = MagicMock()
             mock_pdf.pages = [mock_page]
             mock_pdfplumber.open.return_value = mock_pdf
@@ -518,6 +665,7 @@ class TestVisionExtraction:
 
         with patch("circuitai.services.lab_service.HAS_ANTHROPIC", True), \
              patch("circuitai.services.lab_service.HAS_PDFPLUMBER", True), \
+             patch("circuitai.services.lab_service.HAS_FITZ", False), \
              patch("circuitai.services.lab_service.anthropic") as mock_anthropic, \
              patch("circuitai.services.lab_service.pdfplumber") as mock_pdfplumber:
 
@@ -526,7 +674,8 @@ class TestVisionExtraction:
             mock_page = MagicMock()
             mock_img = MagicMock()
             mock_page.to_image.return_value = mock_img
-            mock_img.save.side_effect = lambda p: Path(p).write_bytes(b"fake")
+            mock_page.width, mock_page.height = 612, 792
+            mock_img.save.side_effect = lambda buf, format: buf.write(b"fake")
             mock_pdf = MagicMock()
             mock_pdf.pages = [mock_page]
             mock_pdfplumber.open.return_value = mock_pdf
@@ -540,6 +689,81 @@ class TestVisionExtraction:
             result = lab_svc.extract_from_pdf_vision("/fake/path.pdf")
             assert result["patient_name"] == "Test"
 
+    def test_vision_keeps_page_order(self, lab_svc):
+        import base64
+
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock(text='{"panels": []}')]
+        mock_client = MagicMock()
+        mock_client.messages.create.return_value = mock_response
+
+        def make_page(n):
+            img = MagicMock()
+            img.save.side_effect = lambda buf, format: buf.write(f"page{n}".encode())
+            page = MagicMock()
+            page.to_image.return_value = img
+            page.width, page.height = 612, 792
+            return page
+
+        with patch("circuitai.services.lab_service.HAS_ANTHROPIC", True), \
+             patch("circuitai.services.lab_service.HAS_PDFPLUMBER", True), \
+             patch("circuitai.services.lab_service.HAS_FITZ", False), \
+             patch("circuitai.services.lab_service.anthropic", create=True) as mock_anthropic, \
+             patch("circuitai.services.lab_service.pdfplumber", create=True) as mock_pdfplumber, \
+             patch.object(lab_svc, "_get_api_key", return_value="sk-test"):
+            mock_anthropic.Anthropic.return_value = mock_client
+            mock_pdf = MagicMock()
+            mock_pdf.pages = [make_page(n) for n in range(6)]
+            mock_pdfplumber.open.return_value = mock_pdf
+
+            lab_svc.extract_from_pdf_vision("/fake/path.pdf")
+
+        content = mock_client.messages.create.call_args.kwargs["messages"][0]["content"]
+        pages = [base64.b64decode(c["source"]["data"]) for c in content if c["type"] == "image"]
+        assert pages == [f"page{n}".encode() for n in range(6)]
+        mock_pdf.close.assert_called_once()
+
+    def test_api_key_cached_once_found(self, lab_svc):
+        assert lab_svc._get_api_key() is None
+        lab_svc.db.execute(
+            "INSERT INTO adapter_state (id, adapter_name, key, value) VALUES (?, ?, ?, ?)",
+            ("test-key", "capture", "anthropic_api_key", "sk-test"),
+        )
+        lab_svc.db.commit()
+        assert lab_svc._get_api_key() == "sk-test"
+        with patch.object(lab_svc.db, "fetchone") as fetchone:
+            assert lab_svc._get_api_key() == "sk-test"
+        fetchone.assert_not_called()
+
+    def test_vision_dpi_fits_api_edge_limit(self):
+        from circuitai.services.lab_service import _vision_dpi
+
+        assert _vision_dpi(612, 792) == 142  # Letter: 792pt * 142 / 72 = 1562px
+        assert 792 / 72 * _vision_dpi(612, 792) <= 1568
+        assert _vision_dpi(288, 432) == 200  # small pages keep the 200 DPI cap
+
+    def test_render_pages_with_pymupdf(self):
+        import base64
+
+        pages = []
+        for n in range(3):
+            page = MagicMock()
+            page.get_pixmap.return_value.tobytes.return_value = f"png{n}".encode()
+            page.rect.width, page.rect.height = 612, 792
+            pages.append(page)
+        doc = MagicMock()
+        doc.__iter__.return_value = iter(pages)
+
+        with patch("circuitai.services.lab_service.HAS_FITZ", True), \
+             patch("circuitai.services.lab_service.fitz", create=True) as mock_fitz:
+            mock_fitz.open.return_value = doc
+            encoded = LabService._render_pdf_pages("/fake/path.pdf")
+
+        assert [base64.b64decode(e) for e in encoded] == [b"png0", b"png1", b"png2"]
+        pages[0].get_pixmap.assert_called_once_with(dpi=142)
+        pages[0].get_pixmap.return_value.tobytes.assert_called_once_with("png")
+        doc.close.assert_called_once()
+
 
 # ── Service CRUD tests ────────────────────────────────────────
 
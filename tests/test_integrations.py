@@ -104,6 +104,42 @@ class TestIntegrationRegistry:
         assert info.kind == "adapter"
 
 
+    def test_get_builtin_skips_other_checks(self, tmp_db):
+        """get() on a built-in runs only that integration's status check."""
+        registry = IntegrationRegistry(db=tmp_db)
+        with patch.object(IntegrationRegistry, "_check_calendar") as cal:
+            info = registry.get("text-parser")
+        assert info is not None
+        assert info.name == "text-parser"
+        cal.assert_not_called()
+
+    def test_get_matches_list_all(self, tmp_db):
+        """get() returns the same info list_all() reports for each name."""
+        registry = IntegrationRegistry(db=tmp_db)
+        for info in registry.list_all():
+            assert registry.get(info.name) == info
+
+
+    def test_adapter_discovery_cached(self, tmp_db):
+        """Entry points are scanned once per process until the cache is cleared."""
+        from circuitai.adapters import registry as adapter_registry
+
+        adapter_registry.AdapterRegistry.clear_cache()
+        try:
+            with patch.object(
+                adapter_registry, "entry_points", wraps=adapter_registry.entry_points
+            ) as eps:
+                IntegrationRegistry(db=tmp_db).list_all()
+                IntegrationRegistry(db=tmp_db).get("manual")
+                assert eps.call_count == 1
+
+                adapter_registry.AdapterRegistry.clear_cache()
+                IntegrationRegistry(db=tmp_db).get("manual")
+                assert eps.call_count == 2
+        finally:
+            adapter_registry.AdapterRegistry.clear_cache()
+
+
 class TestIntegrationsCLI:
     """Tests for the `circuit integrations` CLI command."""
 
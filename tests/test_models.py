@@ -89,6 +89,29 @@ class TestRepositories:
         all_bills = repo.list_all()
         assert len(all_bills) == 1
 
+    def test_from_rows_coerces_flags(self, db):
+        repo = BillRepository(db)
+        repo.insert(Bill(name="Auto", amount_cents=100, auto_pay=True))
+        repo.insert(Bill(name="Manual", amount_cents=200))
+
+        bills = {b.name: b for b in repo.list_all()}
+        assert bills["Auto"].auto_pay is True
+        assert bills["Manual"].auto_pay is False
+        assert all(b.is_active is True for b in bills.values())
+        assert bills["Auto"].model_dump()["auto_pay"] is True
+
+    def test_list_all_active_filter(self, db):
+        repo = BillRepository(db)
+        keep = Bill(name="Keep", amount_cents=100)
+        gone = Bill(name="Gone", amount_cents=100)
+        repo.insert_many([keep, gone])
+        repo.soft_delete(gone.id)
+        assert [b.name for b in repo.list_all()] == ["Keep"]
+        assert len(repo.list_all(active_only=False)) == 2
+        # Tables without is_active are listed whole
+        ChildRepository(db).insert(Child(name="Jake"))
+        assert len(ChildRepository(db).list_all()) == 1
+
     def test_not_found(self, db):
         repo = BillRepository(db)
         with pytest.raises(NotFoundError):
@@ -102,3 +125,10 @@ class TestRepositories:
         found = repo.find_by_name("jake")
         assert found is not None
         assert found.name == "Jake"
+
+    def test_to_row_matches_model_dump(self):
+        bill = Bill(name="Electric", amount_cents=14200, auto_pay=True)
+        row = bill.to_row()
+        assert list(row) == list(bill.model_dump())
+        assert row["auto_pay"] == 1
+        assert row["is_active"] == 1
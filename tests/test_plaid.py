@@ -389,11 +389,11 @@ class TestLinkServer:
         from circuitai.services.plaid_link_server import run_link_flow
 
         # Mock the HTTPServer to immediately return a cancelled result
-        with patch("circuitai.services.plaid_link_server.HTTPServer") as MockServer, \
+        with patch("circuitai.services.plaid_link_server.ThreadingHTTPServer") as MockServer, \
              patch("circuitai.services.plaid_link_server.webbrowser"):
             server_instance = MagicMock()
 
-            def fake_serve_forever():
+            def fake_serve_forever(poll_interval=0.5):
                 # Simulate the handler setting cancelled
                 pass
 
@@ -407,6 +407,43 @@ class TestLinkServer:
             with pytest.raises(AdapterError, match="No public token"):
                 run_link_flow("fake-link-token", port=0)
 
+    def test_callback_returns_token(self):
+        """The page and the callback are served, and the flow returns once called back."""
+        import socket
+        import threading
+        import urllib.request
+
+        from circuitai.services.plaid_link_server import run_link_flow
+
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            port = s.getsockname()[1]
+
+        out: dict = {}
+        with patch("circuitai.services.plaid_link_server.webbrowser") as mock_browser:
+            opened = threading.Event()
+            mock_browser.open.side_effect = lambda url: opened.set()
+            flow = threading.Thread(
+                target=lambda: out.update(run_link_flow("link-sandbox-abc", port=port)),
+            )
+            flow.start()
+            assert opened.wait(5)
+
+            base = f"http://127.0.0.1:{port}"
+            with urllib.request.urlopen(base, timeout=5) as resp:
+                body = resp.read()
+                assert int(resp.headers["Content-Length"]) == len(body)
+                assert resp.headers["Content-Type"] == "text/html; charset=utf-8"
+            assert b"link-sandbox-abc" in body
+            assert "CircuitAI — Connect Bank".encode("utf-8") in body
+            cb = f"{base}/plaid-callback?public_token=public-xyz&metadata=%7B%22a%22%3A1%7D"
+            with urllib.request.urlopen(cb, timeout=5) as resp:
+                assert resp.read() == b"ok"
+            flow.join(5)
+
+        assert not flow.is_alive()
+        assert out == {"public_token": "public-xyz", "metadata": {"a": 1}}
+
 
 # ── Migration tests ──────────────────────────────────────────────
 
@@ -58,6 +58,23 @@ class TestCardService:
         svc.add_card(name="C2", institution="Citi", balance_cents=30000)
         assert svc.get_total_balance() == 80000
 
+    def test_snapshot_utilization(self, db):
+        svc = CardService(db)
+        svc.add_card(name="C1", institution="Amex", credit_limit_cents=1000000, balance_cents=120500)
+        svc.add_card(name="C2", institution="Citi", balance_cents=30000)
+        snapshot = {c["name"]: c for c in svc.get_snapshot()}
+        assert snapshot["C1"]["utilization_pct"] == 12.1
+        assert snapshot["C1"]["limit_cents"] == 1000000
+        assert snapshot["C2"]["utilization_pct"] == 0.0
+
+    def test_totals_skip_deleted_cards(self, db):
+        svc = CardService(db)
+        svc.add_card(name="C1", institution="Amex", credit_limit_cents=1000000, balance_cents=50000)
+        gone = svc.add_card(name="C2", institution="Citi", credit_limit_cents=500000, balance_cents=30000)
+        svc.delete_card(gone.id)
+        assert svc.get_totals() == {"balance_cents": 50000, "limit_cents": 1000000}
+        assert svc.get_total_limit() == 1000000
+
 
 class TestInvestmentService:
     def test_add_and_contribute(self, db):
@@ -70,6 +87,17 @@ class TestInvestmentService:
         updated = svc.get_investment(inv.id)
         assert updated.cost_basis_cents == 10000
 
+        svc.contribute(inv.id, amount_cents=2500)
+        assert svc.get_investment(inv.id).cost_basis_cents == 12500
+
+    def test_contribute_unknown_investment(self, db):
+        from circuitai.core.exceptions import NotFoundError
+
+        svc = InvestmentService(db)
+        with pytest.raises(NotFoundError):
+            svc.contribute("missing", amount_cents=10000)
+        assert db.fetchone("SELECT COUNT(*) as n FROM investment_contributions")["n"] == 0
+
     def test_performance(self, db):
         svc = InvestmentService(db)
         svc.add_investment(name="I1", institution="X", current_value_cents=110000, cost_basis_cents=100000)
@@ -77,6 +105,15 @@ class TestInvestmentService:
         assert perf["total_value_cents"] == 110000
         assert perf["total_gain_loss_cents"] == 10000
 
+    def test_performance_by_type(self, db):
+        svc = InvestmentService(db)
+        svc.add_investment(name="I1", institution="X", account_type="401k", current_value_cents=200000)
+        svc.add_investment(name="I2", institution="Y", account_type="401k", current_value_cents=50000)
+        svc.add_investment(name="I3", institution="Z", account_type="529", current_value_cents=30000)
+        perf = svc.get_performance()
+        assert perf["by_type"] == {"401k": 250000, "529": 30000}
+        assert perf["count"] == 3
+
 
 class TestDeadlineService:
     def test_add_and_complete(self, db):
@@ -87,6 +124,72 @@ class TestDeadlineService:
         completed = svc.complete_deadline(dl.id)
         assert completed.is_completed
 
+    def test_complete_many(self, db):
+        svc = DeadlineService(db)
+        a = svc.add_deadline(title="A", due_date="2026-04-15")
+        b = svc.add_deadline(title="B", due_date="2026-05-15")
+        c = svc.add_deadline(title="C", due_date="2026-06-15")
+        assert svc.deadlines.complete_many([a.id, b.id]) == 2
+        assert svc.deadlines.complete_many([]) == 0
+        remaining = svc.list_deadlines(active_only=True)
+        assert [d.id for d in remaining] == [c.id]
+        assert svc.get_deadline(a.id).completed_at
+
+    def test_reschedule_many(self, db):
+        svc = DeadlineService(db)
+        a = svc.add_deadline(title="A", due_date="2026-04-15")
+        b = svc.add_deadline(title="B", due_date="2026-05-15")
+        assert svc.deadlines.get_due_dates([a.id, b.id, "missing"]) == {
+            a.id: "2026-04-15", b.id: "2026-05-15",
+        }
+        svc.deadlines.reschedule_many([(a.id, "2026-04-20")])
+        assert svc.get_deadline(a.id).due_date == "2026-04-20"
+        assert svc.get_deadline(b.id).due_date == "2026-05-15"
+
+
+class TestMorningService:
+    def test_briefing_bills_and_deadlines(self, db):
+        from datetime import date, timedelta
+
+        from circuitai.services.bill_service import BillService
+        from circuitai.services.morning_service import MorningService
+
+        today = date.today()
+        bills = BillService(db)
+        due_day = (today + timedelta(days=2)).day
+        bills.add_bill(name="Unpaid", amount_cents=1000, due_day=due_day)
+        paid = bills.add_bill(name="Paid", amount_cents=2000, due_day=due_day)
+        bills.pay_bill(paid.id, paid_date=today.isoformat())
+
+        deadlines = DeadlineService(db)
+        deadlines.add_deadline(title="Soon", due_date=(today + timedelta(days=3)).isoformat())
+        deadlines.add_deadline(title="Later", due_date=(today + timedelta(days=6)).isoformat())
+        deadlines.add_deadline(title="Missed", due_date=(today - timedelta(days=1)).isoformat())
+
+        briefing = MorningService(db).get_briefing()
+        items = briefing["attention_items"]
+        assert [i["title"] for i in items if i["type"] == "bill_due"] == ["Unpaid"]
+        upcoming = [i["title"] for i in items if i["type"] == "deadline_upcoming"]
+        assert "Soon" in upcoming and "Later" not in upcoming
+        # Dated items sorted by urgency first, undated (overdue) ones after
+        days = [i["days_until"] for i in items if "days_until" in i]
+        assert days == sorted(days)
+        assert items[len(days)]["title"] == "Missed"
+        assert items[len(days)]["type"] == "deadline_overdue"
+        week = briefing["week_summary"]
+        assert week["bills_due_count"] == 2
+        assert week["bills_due_cents"] == 3000
+        assert week["deadlines_count"] == len(DeadlineService(db).get_upcoming(within_days=7))
+
+    def test_briefing_reflects_writes_between_calls(self, db):
+        from circuitai.services.morning_service import MorningService
+
+        svc = MorningService(db)
+        acct = svc.accounts.add_account(name="Checking", institution="Chase", balance_cents=1000)
+        assert svc.get_briefing()["accounts_snapshot"][0]["balance_cents"] == 1000
+        svc.accounts.update_balance(acct.id, 2500)
+        assert svc.get_briefing()["accounts_snapshot"][0]["balance_cents"] == 2500
+
 
 class TestActivityService:
     def test_add_child_and_activity(self, db):
@@ -106,6 +209,22 @@ class TestActivityService:
         summary = svc.get_cost_summary()
         assert summary["total_cents"] == 40000
 
+    def test_cost_summary_multiple_children(self, db):
+        svc = ActivityService(db)
+        emma = svc.add_child(name="Emma")
+        svc.add_child(name="Jake")
+        svc.add_activity(name="Tennis", child_id=emma.id, cost_cents=15000)
+        dropped = svc.add_activity(name="Chess", child_id=emma.id, cost_cents=5000)
+        svc.delete_activity(dropped.id)
+
+        summary = svc.get_cost_summary()
+        by_name = {c["name"]: c for c in summary["children"]}
+        assert [c["name"] for c in summary["children"]] == ["Emma", "Jake"]
+        assert by_name["Emma"]["activities"] == [{"name": "Tennis", "sport": "Tennis", "cost_cents": 15000}]
+        assert by_name["Jake"]["activities"] == []
+        assert by_name["Jake"]["total_cents"] == 0
+        assert summary["total_cents"] == 15000
+
 
 class TestMortgageService:
     def test_add_and_pay(self, db):
@@ -121,6 +240,7 @@ class TestMortgageService:
         # Balance should be reduced
         updated = svc.get_mortgage(mtg.id)
         assert updated.balance_cents == 35000000 - 100000
+        assert svc.get_total_balance() == 35000000 - 100000
 
     def test_amortization(self, db):
         svc = MortgageService(db)
@@ -134,3 +254,44 @@ class TestMortgageService:
         # Balance should decrease each month
         for i in range(1, len(schedule)):
             assert schedule[i]["remaining_balance_cents"] < schedule[i - 1]["remaining_balance_cents"]
+
+    def test_amortization_full_term_to_the_cent(self, db):
+        svc = MortgageService(db)
+        mtg = svc.add_mortgage(
+            name="Test", lender="Bank", original_amount_cents=30000000,
+            balance_cents=30000000, interest_rate_bps=600,
+            monthly_payment_cents=205000, escrow_cents=25000,
+        )
+        schedule = svc.get_amortization_schedule(mtg.id, months=400)
+        assert len(schedule) == 360
+        assert sum(m["interest_cents"] for m in schedule) == 34664063
+        assert schedule[0]["interest_cents"] == 150000
+        assert schedule[-1] == {
+            "month": 360, "payment_cents": 205000, "principal_cents": 43844,
+            "interest_cents": 219, "escrow_cents": 25000, "remaining_balance_cents": 0,
+        }
+
+
+    def test_amortization_stops_at_payoff(self, db):
+        svc = MortgageService(db)
+        mtg = svc.add_mortgage(
+            name="Test", lender="Bank", original_amount_cents=250000,
+            balance_cents=250000, interest_rate_bps=0, monthly_payment_cents=100000,
+        )
+        schedule = svc.get_amortization_schedule(mtg.id, months=12)
+        assert [m["principal_cents"] for m in schedule] == [100000, 100000, 50000]
+        assert schedule[-1]["remaining_balance_cents"] == 0
+
+
+class TestServiceModules:
+    def test_no_class_defined_twice_in_a_module(self):
+        import ast
+
+        import circuitai.services
+
+        services_dir = Path(circuitai.services.__file__).parent
+        for path in services_dir.rglob("*.py"):
+            tree = ast.parse(path.read_text())
+            names = [node.name for node in tree.body if isinstance(node, ast.ClassDef)]
+            duplicates = {n for n in names if names.count(n) > 1}
+            assert not duplicates, f"{path.name} defines {sorted(duplicates)} more than once"
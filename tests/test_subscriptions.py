@@ -117,6 +117,13 @@ class TestSubscriptionModel:
         assert fetched.is_active is True  # int → bool
         assert fetched.confidence == 85
 
+    def test_days_until(self):
+        in_three = (date.today() + timedelta(days=3)).isoformat()
+        assert Subscription(name="Test", next_charge_date=in_three).days_until == 3
+        assert Subscription(name="Test", next_charge_date=f"{in_three}T00:00:00").days_until == 3
+        assert Subscription(name="Test").days_until is None
+        assert Subscription(name="Test", next_charge_date="soon").days_until is None
+
     def test_confidence_score(self):
         sub = Subscription(name="Test", confidence=75)
         assert sub.confidence_score == 0.75
@@ -208,6 +215,12 @@ class TestSubscriptionRepository:
         patterns = repo.get_all_match_patterns()
         assert patterns == {"NETFLIX.COM", "SPOTIFY.COM"}
 
+    def test_get_all_match_patterns_skips_empty(self, repo):
+        repo.insert(Subscription(name="A", match_pattern="HULU"))
+        repo.insert(Subscription(name="B", match_pattern="HULU"))
+        repo.insert(Subscription(name="C", match_pattern=""))
+        assert repo.get_all_match_patterns() == {"HULU"}
+
 
 # ── Normalization Tests ───────────────────────────────────────────
 